@@ -0,0 +1,352 @@
+# -*- coding: utf-8 -*-
+"""
+AI 해석 영구 캐시 (SQLite)
+- 키: (프롬프트 지문, 카테고리, 모델) → 해석 텍스트
+- 지문은 시스템 프롬프트 + 명식 프롬프트 + 생성 설정의 SHA-256 (내용 주소 방식)
+  → 같은 8글자·성별·대운·세운이면 누가 요청해도 같은 키
+- gunicorn 워커 전체가 파일 하나를 공유 (WAL 모드), 적중/미스 카운터도 파일에 기록
+- 개수 제한 LRU 축출 + TTL 만료 (저장할 때마다가 아니라 프로세스마다 AI_CACHE_SWEEP_INTERVAL 초에 한 번,
+  그 사이 조회는 항목별로 만료 확인 → 개수 제한은 한 주기 동안의 저장 수만큼 넘칠 수 있음)
+- 단일 비행(single-flight): 같은 (지문, 카테고리)의 업스트림 호출은 스레드·워커를 통틀어 하나만,
+  나머지는 끝날 때까지 기다렸다가 캐시에서 결과를 받음 (합류한 호출 수는 coalesced 카운터)
+- 선행 생성(prefetch)으로 저장한 항목은 표시해 두고 처음 쓰일 때 prefetch_hits,
+  쓰이지 않고 축출·만료되면 prefetch_wasted 로 집계 (PREFETCH_WINDOW 가 지난 미사용 항목도 낭비로 봄)
+- DB 오류는 캐시 미스로 취급 (캐시 때문에 해석이 실패하지 않도록)
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+AI_CACHE_PATH = os.environ.get(
+    'AI_CACHE_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ai_cache.sqlite3'))
+AI_CACHE_MAX_ENTRIES = int(os.environ.get('AI_CACHE_MAX_ENTRIES', 20000))
+AI_CACHE_TTL = float(os.environ.get('AI_CACHE_TTL_DAYS', 30)) * 86400
+AI_CACHE_SWEEP_INTERVAL = 60    # 만료·축출 정리 주기 (초)
+
+# 선행 호출이 이 시간 안에 끝나지 않으면 중단된 것으로 보고 넘겨받음 (초)
+# 가장 긴 단일 호출 예산(카테고리·묶음 90초)보다 조금 길고 gunicorn timeout(120초)보다 짧게
+# → 선행 워커가 죽어도 대기자가 자기 워커 timeout 전에 넘겨받음
+FLIGHT_LEASE = 100
+FLIGHT_POLL = 0.2       # 대기 중 확인 주기 (초)
+FLIGHT_KEEP = 60        # 끝난 호출 기록 보관 (늦게 합류한 대기자가 결과를 확인하도록, 초)
+
+PREFETCH_WINDOW = 86400 # 선행 생성 후 이 시간 안에 쓰이지 않으면 낭비로 집계 (초)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS interpretations (
+    fingerprint TEXT NOT NULL,
+    category TEXT NOT NULL,
+    model TEXT NOT NULL,
+    text TEXT NOT NULL,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0,
+    prefetched INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (fingerprint, category, model)
+);
+CREATE INDEX IF NOT EXISTS interpretations_accessed ON interpretations (accessed);
+CREATE INDEX IF NOT EXISTS interpretations_created ON interpretations (created);
+CREATE TABLE IF NOT EXISTS inflight (
+    fingerprint TEXT NOT NULL,
+    category TEXT NOT NULL,
+    started REAL NOT NULL,
+    lease_until REAL NOT NULL,
+    done INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    finished REAL,
+    owner INTEGER,
+    PRIMARY KEY (fingerprint, category)
+);
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+COUNTERS = ('hits', 'misses', 'evictions', 'expired', 'coalesced',
+            'prefetched', 'prefetch_hits', 'prefetch_wasted')
+
+
+def _pid_alive(pid):
+    """같은 호스트의 프로세스가 살아 있는지 (owner 가 없으면 살아 있다고 봄 → 임대 만료까지 기다림)"""
+    if not pid:
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def fingerprint(*parts):
+    """프롬프트 구성 요소들 → 정규 지문 (SHA-256 hex)"""
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(str(part).encode('utf-8'))
+        h.update(b'\x1f')
+    return h.hexdigest()
+
+
+class InterpretationCache:
+    """워커 간 공유되는 SQLite 해석 캐시 (연결은 프로세스·스레드마다 따로)"""
+
+    def __init__(self, path=AI_CACHE_PATH, max_entries=AI_CACHE_MAX_ENTRIES, ttl=AI_CACHE_TTL,
+                 sweep_interval=AI_CACHE_SWEEP_INTERVAL):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.sweep_interval = sweep_interval
+        self._next_sweep = 0.0
+        self._local = threading.local()
+
+    def _connect(self):
+        # fork 이전에 열린 연결은 재사용하지 않음 (preload 마스터 → 워커)
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+        conn = sqlite3.connect(self.path, timeout=5, isolation_level=None, check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.executescript(_SCHEMA)
+        columns = {row[1] for row in conn.execute('PRAGMA table_info(interpretations)')}
+        if 'prefetched' not in columns:  # 선행 생성 표시 도입 전에 만든 파일
+            try:
+                conn.execute('ALTER TABLE interpretations ADD COLUMN prefetched INTEGER NOT NULL DEFAULT 0')
+            except sqlite3.OperationalError:
+                pass  # 다른 워커가 먼저 추가함
+        columns = {row[1] for row in conn.execute('PRAGMA table_info(inflight)')}
+        if 'owner' not in columns:  # 선행자 pid 기록 도입 전에 만든 파일
+            try:
+                conn.execute('ALTER TABLE inflight ADD COLUMN owner INTEGER')
+            except sqlite3.OperationalError:
+                pass
+        conn.executemany('INSERT OR IGNORE INTO counters (name, value) VALUES (?, 0)',
+                         [(name,) for name in COUNTERS])
+        self._local.conn, self._local.pid = conn, os.getpid()
+        return conn
+
+    def _count(self, conn, name, n=1):
+        if n:
+            conn.execute('UPDATE counters SET value = value + ? WHERE name = ?', (n, name))
+
+    @contextmanager
+    def prefetching(self, categories):
+        """이 스레드에서 저장하는 categories 해석을 선행 생성으로 표시 (이 안의 조회는 적중으로 치지 않음)"""
+        self._local.prefetch = frozenset(categories)
+        try:
+            yield
+        finally:
+            self._local.prefetch = frozenset()
+
+    def get(self, fp, category, model):
+        """캐시된 해석 텍스트 (없거나 만료면 None)"""
+        try:
+            conn = self._connect()
+            now = time.time()
+            row = conn.execute(
+                'SELECT text, created, prefetched FROM interpretations '
+                'WHERE fingerprint = ? AND category = ? AND model = ?',
+                (fp, category, model)).fetchone()
+            if row is not None and self.ttl and row[1] + self.ttl <= now:
+                conn.execute('DELETE FROM interpretations WHERE fingerprint = ? AND category = ? AND model = ?',
+                             (fp, category, model))
+                self._count(conn, 'expired')
+                self._count(conn, 'prefetch_wasted', row[2])
+                row = None
+            if row is None:
+                return None
+            if getattr(self._local, 'prefetch', None):
+                return row[0]  # 선행 생성 중 조회는 적중·최근 사용으로 치지 않음
+            conn.execute(
+                'UPDATE interpretations SET accessed = ?, hits = hits + 1 '
+                'WHERE fingerprint = ? AND category = ? AND model = ?',
+                (now, fp, category, model))
+            self._count(conn, 'hits')
+            if row[2]:
+                # 선행 생성한 항목을 사용자 요청이 처음 사용
+                conn.execute('UPDATE interpretations SET prefetched = 0 '
+                             'WHERE fingerprint = ? AND category = ? AND model = ?', (fp, category, model))
+                self._count(conn, 'prefetch_hits')
+            return row[0]
+        except sqlite3.Error as e:
+            print(f"[AI 캐시] 조회 오류: {e}")
+            return None
+
+    def has(self, fp, category, models):
+        """models 중 하나로 만든 해석이 있는지 (조회·적중 카운터는 건드리지 않음, DB 오류면 False)"""
+        try:
+            marks = ', '.join('?' * len(models))
+            return self._connect().execute(
+                f'SELECT 1 FROM interpretations WHERE fingerprint = ? AND category = ? AND model IN ({marks}) '
+                'AND created > ? LIMIT 1',
+                (fp, category, *models, time.time() - self.ttl if self.ttl else 0)).fetchone() is not None
+        except sqlite3.Error as e:
+            print(f"[AI 캐시] 조회 오류: {e}")
+            return False
+
+    def record_miss(self):
+        if getattr(self._local, 'prefetch', None):
+            return  # 선행 생성 중 미스는 사용자 요청의 적중률에 넣지 않음
+        try:
+            self._count(self._connect(), 'misses')
+        except sqlite3.Error as e:
+            print(f"[AI 캐시] 카운터 오류: {e}")
+
+    def put(self, fp, category, model, text, replace=True):
+        """해석 저장 (replace=False 면 같은 키가 이미 있을 때 그대로 둠)"""
+        try:
+            conn = self._connect()
+            now = time.time()
+            prefetched = int(category in getattr(self._local, 'prefetch', ()))
+            inserted = conn.execute(
+                f'INSERT OR {"REPLACE" if replace else "IGNORE"} INTO interpretations '
+                '(fingerprint, category, model, text, created, accessed, prefetched) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)', (fp, category, model, text, now, now, prefetched)).rowcount
+            self._count(conn, 'prefetched', prefetched * inserted)
+            if now >= self._next_sweep:
+                self._next_sweep = now + self.sweep_interval
+                self._sweep(conn, now)
+        except sqlite3.Error as e:
+            print(f"[AI 캐시] 저장 오류: {e}")
+
+    def _sweep(self, conn, now):
+        """TTL 만료 삭제 + 개수 제한 초과분 축출 (한 트랜잭션 → 워커 여럿이 동시에 돌아도 한 번만 집계)"""
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            if self.ttl:
+                self._count(conn, 'prefetch_wasted', conn.execute(
+                    'SELECT COUNT(*) FROM interpretations WHERE created <= ? AND prefetched = 1',
+                    (now - self.ttl,)).fetchone()[0])
+                expired = conn.execute('DELETE FROM interpretations WHERE created <= ?',
+                                       (now - self.ttl,)).rowcount
+                self._count(conn, 'expired', expired)
+            # 개수 제한 초과분은 가장 오래 조회되지 않은 것부터 축출
+            over = conn.execute('SELECT COUNT(*) FROM interpretations').fetchone()[0] - self.max_entries
+            if over > 0:
+                self._count(conn, 'prefetch_wasted', conn.execute(
+                    'SELECT COUNT(*) FROM (SELECT prefetched FROM interpretations ORDER BY accessed LIMIT ?) '
+                    'WHERE prefetched = 1', (over,)).fetchone()[0])
+                conn.execute('DELETE FROM interpretations WHERE rowid IN '
+                             '(SELECT rowid FROM interpretations ORDER BY accessed LIMIT ?)', (over,))
+                self._count(conn, 'evictions', over)
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+    # ---- 단일 비행 ----
+
+    def _reap_flights(self, conn, now):
+        """오래된 종료 기록, 만료된 임대, 죽은 프로세스(gunicorn 이 죽인 워커 등)가 잡고 있던 임대 삭제"""
+        conn.execute('DELETE FROM inflight WHERE (done = 1 AND finished < ?) OR lease_until < ?',
+                     (now - FLIGHT_KEEP, now))
+        owners = [row[0] for row in conn.execute('SELECT DISTINCT owner FROM inflight WHERE done = 0')]
+        dead = [(pid,) for pid in owners if not _pid_alive(pid)]
+        if dead:
+            conn.executemany('DELETE FROM inflight WHERE done = 0 AND owner = ?', dead)
+
+    def begin_flight(self, fp, category):
+        """
+        진행 중인 같은 호출이 없으면 선행자로 등록하고 True,
+        있으면 대기자로 집계하고 False (DB 오류 시에는 True = 직접 호출)
+        """
+        try:
+            conn = self._connect()
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                now = time.time()
+                self._reap_flights(conn, now)
+                row = conn.execute('SELECT done FROM inflight WHERE fingerprint = ? AND category = ?',
+                                   (fp, category)).fetchone()
+                leader = row is None or row[0] == 1
+                if leader:
+                    conn.execute('INSERT OR REPLACE INTO inflight (fingerprint, category, started, lease_until, owner) '
+                                 'VALUES (?, ?, ?, ?, ?)', (fp, category, now, now + FLIGHT_LEASE, os.getpid()))
+                else:
+                    self._count(conn, 'coalesced')
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+            return leader
+        except sqlite3.Error as e:
+            print(f"[AI 캐시] 단일 비행 오류: {e}")
+            return True
+
+    def wait_flight(self, fp, category, timeout=FLIGHT_LEASE):
+        """
+        선행 호출이 끝날 때까지 대기
+        반환: ('done', 선행자 오류 또는 None) / ('gone', None) 선행자 중단 / ('timeout', None)
+        - 선행자 프로세스가 죽었으면(임대가 남아 있어도) 바로 'gone'
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                row = self._connect().execute(
+                    'SELECT done, error, lease_until, owner FROM inflight WHERE fingerprint = ? AND category = ?',
+                    (fp, category)).fetchone()
+            except sqlite3.Error as e:
+                print(f"[AI 캐시] 단일 비행 오류: {e}")
+                return 'gone', None
+            if row is None or (not row[0] and (row[2] < time.time() or not _pid_alive(row[3]))):
+                return 'gone', None
+            if row[0]:
+                return 'done', row[1]
+            if time.monotonic() >= deadline:
+                return 'timeout', None
+            time.sleep(FLIGHT_POLL)
+
+    def end_flight(self, fp, category, error=None):
+        """선행 호출 종료 기록 (성공이면 결과는 이미 캐시에 있음) + 죽은 선행자의 임대 정리"""
+        try:
+            conn = self._connect()
+            now = time.time()
+            conn.execute(
+                'UPDATE inflight SET done = 1, error = ?, finished = ? WHERE fingerprint = ? AND category = ?',
+                (error, now, fp, category))
+            self._reap_flights(conn, now)
+        except sqlite3.Error as e:
+            print(f"[AI 캐시] 단일 비행 오류: {e}")
+
+    def clear(self):
+        conn = self._connect()
+        conn.execute('DELETE FROM interpretations')
+        conn.execute('UPDATE counters SET value = 0')
+
+    def stats(self):
+        try:
+            conn = self._connect()
+            counters = dict(conn.execute('SELECT name, value FROM counters'))
+            size, text_bytes = conn.execute(
+                'SELECT COUNT(*), COALESCE(SUM(LENGTH(CAST(text AS BLOB))), 0) FROM interpretations').fetchone()
+            inflight = conn.execute('SELECT COUNT(*) FROM inflight WHERE done = 0').fetchone()[0]
+            pending, stale = conn.execute(
+                'SELECT COUNT(*), COALESCE(SUM(created < ?), 0) FROM interpretations WHERE prefetched = 1',
+                (time.time() - PREFETCH_WINDOW,)).fetchone()
+        except sqlite3.Error as e:
+            return {'error': str(e)}
+        total = counters.get('hits', 0) + counters.get('misses', 0)
+        prefetched = counters.get('prefetched', 0)
+        return {
+            'size': size,
+            'max_entries': self.max_entries,
+            'bytes': text_bytes,
+            'inflight': inflight,
+            **{name: counters.get(name, 0) for name in COUNTERS},
+            'hit_rate': round(counters.get('hits', 0) / total, 4) if total else 0.0,
+            # 선행 생성: 쓰인 비율 / 쓰이지 않고 버려졌거나 PREFETCH_WINDOW 가 지난 비율 (나머지는 대기 중)
+            'prefetch_pending': pending,
+            'prefetch_hit_rate': round(counters.get('prefetch_hits', 0) / prefetched, 4) if prefetched else 0.0,
+            'prefetch_waste_rate': round((counters.get('prefetch_wasted', 0) + stale) / prefetched, 4)
+                                   if prefetched else 0.0,
+        }
+
+
+AI_CACHE = InterpretationCache()
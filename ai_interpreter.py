@@ -5,9 +5,19 @@ AI 해석 엔진 (서버사이드 전용)
 ★ 429 자동 재시도 + 최신 모델 자동 전환 (2025년 기준)
 """
 
+import json
 import os
+import re
+import threading
 import time
-import requests
+
+from ai_cache import AI_CACHE, fingerprint
+from rate_limiter import GEMINI_LIMITER
+from model_health import MODEL_HEALTH, OK, ERROR, RATE_LIMITED, NOT_FOUND
+from context_cache import CONTEXT_CACHE
+from saju_engine import (
+    CHEONGAN, CHEONGAN_KR, JIJI_KR, CHEONGAN_OHAENG, JIJI_OHAENG, OHAENG_KR, pillar_label,
+)
 
 # ============================================================
 # Gemini API 설정 (2025~2026 최신 모델명)
@@ -22,10 +32,46 @@ GEMINI_MODELS = [
     'gemini-2.5-flash',         # 최신 고성능
 ]
 
-GEMINI_BASE_URL = 'https://generativelanguage.googleapis.com/v1beta/models'
+# GEMINI_API_ROOT 로 로컬 대역 서버를 가리키게 할 수 있음 (부하 테스트·개발용)
+GEMINI_API_ROOT = os.environ.get('GEMINI_API_ROOT', 'https://generativelanguage.googleapis.com/v1beta').rstrip('/')
+GEMINI_BASE_URL = f'{GEMINI_API_ROOT}/models'
+
+# 컨텍스트 캐시 (GEMINI_CONTEXT_CACHE=1): 시스템 프롬프트를 모델별 cachedContent 로 올려 두고 재사용
+# 무료 티어이거나 프롬프트가 모델의 최소 캐시 토큰 수보다 짧으면 생성이 거절되어 인라인으로 동작
+GEMINI_CONTEXT_CACHE = os.environ.get('GEMINI_CONTEXT_CACHE', '') == '1'
+# 핸들 자체가 거절됐을 때의 오류 본문 (만료·삭제된 cachedContent) → 인라인으로 다시 보냄
+CACHED_CONTENT_ERROR = re.compile(r'cached\s*content', re.IGNORECASE)
+
+# 모델별 공유 토큰 버킷에서 토큰을 기다리는 최대 시간 (초, 0 이면 즉시 실패)
+GEMINI_LIMIT_WAIT = float(os.environ.get('GEMINI_LIMIT_WAIT', 10))
+
+# 동기 요청 하나가 AI 호출에 쓸 수 있는 시간 (초, gunicorn timeout 120초보다 짧게)
+# 같은 호출을 기다리는 대기자는 (예산 - 자기 호출 timeout) 까지만 기다리고 직접 호출
+GEMINI_REQUEST_BUDGET = float(os.environ.get('GEMINI_REQUEST_BUDGET', 110))
+
+# 헤지 요청 (GEMINI_HEDGE=1): 1순위 모델이 p90 지연 안에 답하지 않으면 다음 순위 모델에도 요청
+GEMINI_HEDGE = os.environ.get('GEMINI_HEDGE', '') == '1'
+HEDGE_DEFAULT_DELAY = 20  # p90 표본이 부족할 때 (초)
+HEDGE_MIN_DELAY = 2       # p90 이 아주 짧아도 이보다 빨리 헤지하지 않음 (초)
+MIN_ATTEMPT_TIMEOUT = 5   # 호출 예산이 이보다 적게 남으면 더 시도하지 않음 (초)
 
-# 마지막으로 성공한 모델 캐싱 (서버 재시작까지 유지)
-_working_model = None
+# 카테고리 묶음 생성 (GEMINI_CATEGORY_BUNDLE=1 로 켬): 상세 해석 첫 요청 때 다섯 카테고리를
+# 구조화 JSON 한 번으로 받아 카테고리별로 캐시 → 나머지 탭은 API 호출 없이 캐시에서
+# 출력 토큰은 gemini-2.0-flash 상한(8192), 재시도까지 합쳐 CATEGORY_BUNDLE_BUDGET 초 안에 끝냄
+GEMINI_CATEGORY_BUNDLE = os.environ.get('GEMINI_CATEGORY_BUNDLE', '0') == '1'
+CATEGORY_BUNDLE_MAX_TOKENS = int(os.environ.get('GEMINI_BUNDLE_MAX_TOKENS', 8192))
+CATEGORY_BUNDLE_BUDGET = 90
+CATEGORY_MAX_TOKENS = 8192
+FULL_MAX_TOKENS = 4096
+
+# 선행 생성 (AI_PREFETCH=1): 종합 해석이 성공하면 자주 보는 카테고리를 낮은 우선순위 작업으로 미리 생성
+# 1순위 모델 버킷에 AI_PREFETCH_MIN_HEADROOM 개 이상 토큰이 남아 있을 때만 (사용자 요청 몫을 남김)
+AI_PREFETCH = os.environ.get('AI_PREFETCH', '') == '1'
+PREFETCH_CATEGORIES = tuple(
+    c.strip() for c in os.environ.get('AI_PREFETCH_CATEGORIES', 'love,money,career').split(',') if c.strip())
+PREFETCH_MIN_HEADROOM = float(os.environ.get('AI_PREFETCH_MIN_HEADROOM', 3))
+_hedge_pool = None
+_hedge_lock = threading.Lock()
 
 def get_api_key():
     return os.environ.get('GEMINI_API_KEY', '')
@@ -62,183 +108,738 @@ SAJU_SYSTEM_PROMPT = """당신은 '랑이명리'의 전문 명리학 상담사
 """
 
 
-def build_saju_prompt(saju_data):
-    """사주 데이터를 AI 해석용 프롬프트로 변환"""
-    p = saju_data['pillars']
+def build_saju_prompt(chart):
+    """사주 명식(SajuChart)을 AI 해석용 프롬프트로 변환"""
+    def pillar_line(g, j):
+        return f"{pillar_label(g, j)} | 천간: {OHAENG_KR[CHEONGAN_OHAENG[g]]} | 지지: {OHAENG_KR[JIJI_OHAENG[j]]}"
+    
+    ohaeng = chart.ohaeng
+    sipsin = chart.sipsin
+    yongsin = chart.yongsin
+    daeun = chart.daeun
+    v = chart.ohaeng_values
+    solar = chart.solar_date  # 음력 입력도 양력으로 표기 (같은 명식 → 같은 프롬프트 → 같은 캐시 키)
     
     prompt = f"""
 다음 사주를 정통 명리학 관점에서 상세히 해석해주세요.
 
 [기본 정보]
-- 성별: {saju_data['input']['gender']}
-- 생년월일시: {saju_data['input']['year']}년 {saju_data['input']['month']}월 {saju_data['input']['day']}일 {saju_data['input']['hour_name']}
-- 띠: {saju_data['zodiac']}띠
+- 성별: {chart.gender}
+- 생년월일시: {solar.year}년 {solar.month}월 {solar.day}일 {chart.hour_name}
+- 띠: {chart.zodiac}띠
 
 [사주 원국 (四柱八字)]
-- 년주(年柱): {p['year']['label']} | 천간: {p['year']['gan_ohaeng']} | 지지: {p['year']['ji_ohaeng']}
-- 월주(月柱): {p['month']['label']} | 천간: {p['month']['gan_ohaeng']} | 지지: {p['month']['ji_ohaeng']}
-- 일주(日柱): {p['day']['label']} | 천간: {p['day']['gan_ohaeng']} | 지지: {p['day']['ji_ohaeng']}  ← 일간(나)
-- 시주(時柱): {p['hour']['label']} | 천간: {p['hour']['gan_ohaeng']} | 지지: {p['hour']['ji_ohaeng']}
+- 년주(年柱): {pillar_line(chart.year_gan, chart.year_ji)}
+- 월주(月柱): {pillar_line(chart.month_gan, chart.month_ji)}
+- 일주(日柱): {pillar_line(chart.day_gan, chart.day_ji)}  ← 일간(나)
+- 시주(時柱): {pillar_line(chart.hour_gan, chart.hour_ji)}
 
-[일간] {p['day']['gan_kr']}({p['day']['gan']}) = {saju_data['ilgan_ohaeng']}
+[일간] {CHEONGAN_KR[chart.day_gan]}({CHEONGAN[chart.day_gan]}) = {chart.ilgan_ohaeng}
 
 [오행 분포]
-목(木):{saju_data['ohaeng']['values'][0]} 화(火):{saju_data['ohaeng']['values'][1]} 토(土):{saju_data['ohaeng']['values'][2]} 금(金):{saju_data['ohaeng']['values'][3]} 수(水):{saju_data['ohaeng']['values'][4]}
-강: {saju_data['ohaeng']['dominant']} | 약: {saju_data['ohaeng']['weak']}
+목(木):{v[0]} 화(火):{v[1]} 토(土):{v[2]} 금(金):{v[3]} 수(水):{v[4]}
+강: {ohaeng['dominant']} | 약: {ohaeng['weak']}
 
 [십신 배치]
-년간 {p['year']['gan_kr']}: {saju_data['sipsin']['year_gan']} | 년지 {p['year']['ji_kr']}: {saju_data['sipsin']['year_ji']}
-월간 {p['month']['gan_kr']}: {saju_data['sipsin']['month_gan']} | 월지 {p['month']['ji_kr']}: {saju_data['sipsin']['month_ji']}
-일지 {p['day']['ji_kr']}: {saju_data['sipsin']['day_ji']}
-시간 {p['hour']['gan_kr']}: {saju_data['sipsin']['hour_gan']} | 시지 {p['hour']['ji_kr']}: {saju_data['sipsin']['hour_ji']}
+년간 {CHEONGAN_KR[chart.year_gan]}: {sipsin['year_gan']} | 년지 {JIJI_KR[chart.year_ji]}: {sipsin['year_ji']}
+월간 {CHEONGAN_KR[chart.month_gan]}: {sipsin['month_gan']} | 월지 {JIJI_KR[chart.month_ji]}: {sipsin['month_ji']}
+일지 {JIJI_KR[chart.day_ji]}: {sipsin['day_ji']}
+시간 {CHEONGAN_KR[chart.hour_gan]}: {sipsin['hour_gan']} | 시지 {JIJI_KR[chart.hour_ji]}: {sipsin['hour_ji']}
 
-[신강/신약] {saju_data['yongsin']['strength']}
-[용신] {saju_data['yongsin']['yongsin_ohaeng']}
+[신강/신약] {yongsin['strength']}
+[용신] {yongsin['yongsin_ohaeng']}
 
 [합/충/형]
-{chr(10).join(saju_data['relations']) if saju_data['relations'] else '없음'}
+{chr(10).join(chart.relations) if chart.relations else '없음'}
 
 [신살]
-{chr(10).join(saju_data['sinsal']) if saju_data['sinsal'] else '없음'}
+{chr(10).join(chart.sinsal) if chart.sinsal else '없음'}
 
-[대운] {saju_data['daeun']['start_age']}세 시작
-{chr(10).join([f"- {d['age']}세~: {d['label']}" for d in saju_data['daeun']['list']])}
+[대운] {daeun['start_age']}세 시작
+{chr(10).join([f"- {d['age']}세~: {d['label']}" for d in daeun['list']])}
 
-[올해 세운] {saju_data['current_year']['label']}
+[올해 세운] {chart.current_year_info['label']}
 
 위 정보를 바탕으로 종합적이고 상세한 사주 해석을 작성해주세요.
 """
     return prompt
 
 
-def _call_gemini(prompt, extra_prompt='', max_tokens=4096, timeout=60):
+NO_API_KEY_ERROR = 'GEMINI_API_KEY가 설정되지 않았습니다. .env 파일을 확인하세요.'
+INVALID_API_KEY_ERROR = 'API 키가 유효하지 않습니다. Google AI Studio에서 새 키를 발급하세요.'
+RATE_LIMIT_ERROR = 'API 호출 한도 초과(429). 무료 티어 분당 15회 제한. 잠시 후 다시 시도해주세요.'
+TIMEOUT_ERROR = '해석 생성 시간 초과. 잠시 후 다시 시도해주세요.'
+INVALID_CATEGORY_ERROR = '잘못된 카테고리'
+
+
+def _model_order():
+    """모델 순서: 모든 워커가 공유하는 상태 레지스트리 기준 (최근 실패율·p90 지연 순, 브레이커 열린 모델 제외)"""
+    return MODEL_HEALTH.rank(GEMINI_MODELS)
+
+
+def prompt_fingerprint(full_prompt, max_tokens, response_schema=None):
+    """AI 캐시·단일 비행 키 (응답 스키마가 없는 호출은 스키마 도입 전과 같은 지문)"""
+    if response_schema is None:
+        return fingerprint(SAJU_SYSTEM_PROMPT, full_prompt, max_tokens)
+    return fingerprint(SAJU_SYSTEM_PROMPT, full_prompt, max_tokens, json.dumps(response_schema, sort_keys=True))
+
+
+def _cached_interpretation(fp, category, models, record_miss=True):
+    """AI 캐시에서 모델 우선순위대로 조회 → (모델, 텍스트), 없으면 미스 기록 후 None"""
+    for model in models:
+        text = AI_CACHE.get(fp, category, model)
+        if text is not None:
+            print(f"[AI] 캐시 적중: {model} ({category}), {len(text)}자")
+            return model, text
+    if record_miss:
+        AI_CACHE.record_miss()
+    return None
+
+
+def _join_flight(fp, category, wait):
+    """
+    단일 비행 합류 - 같은 (지문, 카테고리) 호출이 다른 스레드·워커에서 진행 중이면 최대 wait 초 대기
+    반환: (선행자인지, 대기해서 얻은 결과 dict 또는 None)
+    - (True, None): 선행자로 등록됨 → 직접 호출 후 end_flight
+    - (False, None): 대기 시간 초과 → 선행자 등록 없이 직접 호출 (워커 timeout 전에 응답하도록)
+    - 선행 호출이 성공하면 캐시에서 결과를, 실패하면 같은 오류를 받음 (실패를 대기자 수만큼 반복하지 않도록)
+    - 선행 호출이 중단되면(임대 만료, 선행 워커 종료) 대기자 중 하나가 넘겨받아 직접 호출
+    """
+    deadline = time.monotonic() + wait
+    while True:
+        if AI_CACHE.begin_flight(fp, category):
+            return True, None
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            print(f"[AI] 같은 요청 대기 시간 초과 → 직접 호출 ({category})")
+            return False, None
+        print(f"[AI] 같은 요청 진행 중 → 결과 대기 ({category})")
+        state, error = AI_CACHE.wait_flight(fp, category, remaining)
+        if state == 'gone':
+            continue
+        if state == 'timeout':
+            print(f"[AI] 같은 요청 대기 시간 초과 → 직접 호출 ({category})")
+            return False, None
+        if state == 'done' and error is None:
+            # 선행자가 쓴 모델이 이 워커의 순서에서 빠져 있을 수 있으므로 전체 모델 조회
+            cached = _cached_interpretation(fp, category, GEMINI_MODELS)
+            if cached is not None:
+                return False, {'success': True, 'interpretation': cached[1], 'error': None, 'model': cached[0]}
+        return False, {'success': False, 'error': error or TIMEOUT_ERROR, 'interpretation': None}
+
+
+def _flight_wait(timeout):
+    """대기자가 선행 호출을 기다릴 수 있는 시간 = 요청 예산에서 자기 호출 timeout 을 뺀 나머지"""
+    return max(0.0, GEMINI_REQUEST_BUDGET - timeout)
+
+
+def _acquire_token(model, models, deadline):
+    """모델 버킷에서 토큰 1개 - 뒤에 다른 모델이 남아 있으면 기다리지 않음"""
+    wait = 0.0 if model != models[-1] else max(0.0, deadline - time.monotonic())
+    if GEMINI_LIMITER.acquire(model, wait):
+        return True
+    print(f"[AI] 호출 한도 대기 초과: {model}")
+    return False
+
+
+RETRY_WAITS = (0, 5, 15)  # 429 재시도 전 대기 (초), 모델마다 최대 3회
+
+
+def _wait_retry(attempt, stop):
+    """재시도 전 대기 - 대기 후 호출 예산(stop, monotonic)이 MIN_ATTEMPT_TIMEOUT 보다 적게 남으면 False"""
+    wait = RETRY_WAITS[attempt]
+    if stop and time.monotonic() + wait + MIN_ATTEMPT_TIMEOUT > stop:
+        print("[AI] 호출 예산 소진 → 중단")
+        return False
+    if wait > 0:
+        print(f"[AI] 대기 {wait}초... (재시도 {attempt+1}/{len(RETRY_WAITS)})")
+        time.sleep(wait)
+    return True
+
+
+def _attempt_timeout(timeout, stop):
+    """시도 하나의 timeout - 예산이 있으면 남은 시간만큼만 기다림"""
+    if not stop:
+        return timeout
+    return max(MIN_ATTEMPT_TIMEOUT, min(timeout, stop - time.monotonic()))
+
+
+def _handle_failure(model, attempt, status, value):
+    """
+    실패한 시도 처리 (_call_upstream / _stream_upstream 공통) → (다음 동작, 오류 메시지)
+    - 'retry': 같은 모델 재시도 (429, 버킷을 비워 다른 워커도 함께 물러남)
+    - 'next': 다음 모델로 (404, 타임아웃, 예외, 기타 상태)
+    - 'stop': 더 시도하지 않음 (403, 키 문제라 다른 모델도 같음)
+    """
+    if status == 429:
+        print(f"[AI] 429 한도초과 ({model}, 시도 {attempt+1})")
+        GEMINI_LIMITER.drain(model)
+        return 'retry', RATE_LIMIT_ERROR
+    if status == 404:
+        print(f"[AI] 404 - {model} 사용 불가, 다음 모델 시도")
+        return 'next', f'{model} 모델을 사용할 수 없습니다.'
+    if status == 403:
+        print(f"[AI] 403 권한없음: {value}")
+        return 'stop', INVALID_API_KEY_ERROR
+    if status == 'timeout':
+        print(f"[AI] 타임아웃 ({model})")
+        return 'next', TIMEOUT_ERROR
+    if status == 'error':
+        print(f"[AI] 예외: {value[:100]}")
+        return 'next', value
+    print(f"[AI] {status}: {value}")
+    return 'next', f'API 오류 ({status})'
+
+
+def _gemini_request_body(full_prompt, max_tokens, response_schema=None):
+    body = {
+        'system_instruction': {
+            'parts': [{'text': SAJU_SYSTEM_PROMPT}]
+        },
+        'contents': [{
+            'parts': [{'text': full_prompt}]
+        }],
+        'generationConfig': {
+            'temperature': 0.7,
+            'topP': 0.9,
+            'topK': 40,
+            'maxOutputTokens': max_tokens,
+        }
+    }
+    if response_schema is not None:
+        # 구조화 출력: 응답 텍스트가 스키마를 따르는 JSON
+        body['generationConfig']['responseMimeType'] = 'application/json'
+        body['generationConfig']['responseSchema'] = response_schema
+    return body
+
+
+def _record_health(model, status, latency):
+    """호출 결과를 모델 상태 레지스트리에 기록 (403 은 키 문제라 모델 상태와 무관)"""
+    if status == 200:
+        MODEL_HEALTH.record(model, OK, latency)
+    elif status == 429:
+        MODEL_HEALTH.record(model, RATE_LIMITED)
+    elif status == 404:
+        MODEL_HEALTH.record(model, NOT_FOUND)
+    elif status != 403:
+        MODEL_HEALTH.record(model, ERROR)
+
+
+def _refresh_context_cache(requests, model, api_key, name, prompt_fp):
+    """시스템 프롬프트 캐시 핸들 연장(name 이 있으면) 또는 생성 - 백그라운드 스레드에서 실행"""
+    headers = {'Content-Type': 'application/json', 'x-goog-api-key': api_key}
+    ttl = f'{CONTEXT_CACHE.ttl}s'
+    try:
+        if name:
+            response = requests.patch(f'{GEMINI_API_ROOT}/{name}', params={'updateMask': 'ttl'},
+                                      headers=headers, json={'ttl': ttl}, timeout=30)
+            if response.status_code == 200:
+                CONTEXT_CACHE.store(model, name, prompt_fp)
+                print(f"[AI] 컨텍스트 캐시 연장: {model}")
+                return
+            print(f"[AI] 컨텍스트 캐시 연장 실패 ({model}, {response.status_code}) → 새로 생성")
+        response = requests.post(
+            f'{GEMINI_API_ROOT}/cachedContents',
+            headers=headers,
+            json={
+                'model': f'models/{model}',
+                'systemInstruction': {'parts': [{'text': SAJU_SYSTEM_PROMPT}]},
+                'ttl': ttl,
+            },
+            timeout=30,
+        )
+        if response.status_code == 200:
+            CONTEXT_CACHE.store(model, response.json()['name'], prompt_fp)
+            print(f"[AI] 컨텍스트 캐시 생성: {model}")
+        else:
+            print(f"[AI] 컨텍스트 캐시 사용 불가 ({model}, {response.status_code}) → 인라인 프롬프트")
+            CONTEXT_CACHE.fail(model, f'{response.status_code}: {response.text[:150]}')
+    except Exception as e:
+        print(f"[AI] 컨텍스트 캐시 오류 ({model}): {str(e)[:100]}")
+        CONTEXT_CACHE.fail(model, str(e))
+
+
+def _context_cached_body(requests, model, api_key, body):
+    """
+    시스템 프롬프트 캐시 핸들이 있으면 system_instruction 대신 cachedContent 를 쓰는 요청 본문
+    (핸들이 없거나 곧 만료되면 한 곳에서만 백그라운드 갱신, 이번 호출은 기다리지 않음)
+    """
+    if not GEMINI_CONTEXT_CACHE:
+        return body
+    prompt_fp = fingerprint(SAJU_SYSTEM_PROMPT)
+    name, stale = CONTEXT_CACHE.lookup(model, prompt_fp)
+    if stale:
+        current = CONTEXT_CACHE.claim(model, prompt_fp)
+        if current is not None:
+            threading.Thread(target=_refresh_context_cache, args=(requests, model, api_key, current, prompt_fp),
+                             name='gemini-context-cache', daemon=True).start()
+    if name is None:
+        return body
+    cached = {key: value for key, value in body.items() if key != 'system_instruction'}
+    cached['cachedContent'] = name
+    return cached
+
+
+def _post_gemini(requests, url, model, api_key, body, timeout, stream=False):
+    """
+    Gemini 생성 호출 (컨텍스트 캐시 핸들이 있으면 사용)
+    핸들로 보낸 요청이 핸들 때문에(오류 본문이 cachedContent 를 가리킴) 400/403/404 면
+    핸들을 버리고 같은 요청을 인라인 프롬프트로 다시 보냄 (API 키·모델 오류는 그대로 반환)
+    """
+    headers = {
+        'Content-Type': 'application/json',
+        'x-goog-api-key': api_key,
+    }
+    sent = _context_cached_body(requests, model, api_key, body)
+    response = requests.post(url, headers=headers, json=sent, timeout=timeout, stream=stream)
+    if (sent is not body and response.status_code in (400, 403, 404)
+            and CACHED_CONTENT_ERROR.search(response.text)):
+        print(f"[AI] 컨텍스트 캐시 거절 ({model}, {response.status_code}) → 인라인 재전송")
+        response.close()
+        CONTEXT_CACHE.invalidate(model, sent['cachedContent'])
+        response = requests.post(url, headers=headers, json=body, timeout=timeout, stream=stream)
+    return response
+
+
+def _post_once(requests, model, api_key, body, timeout):
+    """
+    모델 한 번 호출 → (상태, 값)
+    - 상태: HTTP 코드 또는 'timeout' / 'error'
+    - 값: 성공이면 해석 텍스트, 아니면 오류 내용
+    """
+    started = time.monotonic()
+    try:
+        response = _post_gemini(requests, f'{GEMINI_BASE_URL}/{model}:generateContent',
+                                model, api_key, body, timeout)
+        status = response.status_code
+        if status == 200:
+            value = response.json()['candidates'][0]['content']['parts'][0]['text']
+        else:
+            value = response.text[:200]
+    except requests.Timeout:
+        status, value = 'timeout', TIMEOUT_ERROR
+    except Exception as e:
+        status, value = 'error', str(e)[:200]
+    _record_health(model, status, time.monotonic() - started)
+    return status, value
+
+
+def _post_hedged(requests, model, backup, api_key, body, timeout):
+    """
+    헤지 요청: model 이 최근 p90 지연 안에 답하지 않으면 backup 모델에도 요청하고
+    먼저 성공한 쪽을 사용 → (사용한 모델, 상태, 값)
+    backup 버킷에 토큰이 없으면 헤지하지 않고 model 결과를 기다림
+    """
+    global _hedge_pool
+    from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout, as_completed
+    with _hedge_lock:
+        if _hedge_pool is None:
+            _hedge_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='gemini-hedge')
+    
+    delay = max(MODEL_HEALTH.latency_percentile(model, 0.9) or HEDGE_DEFAULT_DELAY, HEDGE_MIN_DELAY)
+    primary = _hedge_pool.submit(_post_once, requests, model, api_key, body, timeout)
+    try:
+        return (model,) + primary.result(timeout=delay)
+    except FutureTimeout:
+        pass
+    if not GEMINI_LIMITER.acquire(backup, 0):
+        return (model,) + primary.result()
+    
+    print(f"[AI] 헤지 요청: {model} {delay:.1f}초 초과 → {backup}")
+    secondary = _hedge_pool.submit(_post_once, requests, backup, api_key, body, timeout)
+    futures = {primary: model, secondary: backup}
+    for future in as_completed(futures):
+        status, value = future.result()
+        if status == 200:
+            return futures[future], status, value
+    return (model,) + primary.result()
+
+
+def _call_gemini(prompt, extra_prompt='', max_tokens=4096, timeout=60, category='full',
+                 limit_wait=GEMINI_LIMIT_WAIT, hedge=GEMINI_HEDGE, response_schema=None, budget=None):
     """
     Gemini API 호출
-    - 429(한도초과) → 대기 후 재시도 (최대 3회)
+    - AI 캐시(프롬프트 지문 + 카테고리 + 모델)에 있으면 API 호출 없이 반환
+    - 모델 순서는 공유 상태 레지스트리 기준 (최근 실패율·p90 지연 순, 브레이커 열린 모델 제외)
+    - 호출 전 모델별 공유 토큰 버킷에서 토큰 획득 (다음 모델이 있으면 기다리지 않고 전환,
+      마지막 모델은 limit_wait 초까지 대기)
+    - hedge: 첫 시도가 p90 지연을 넘기면 다음 순위 모델에도 요청해 먼저 성공한 결과 사용
+    - 429(한도초과) → 버킷 비우고 대기 후 재시도 (최대 3회)
     - 404(모델없음) → 다음 모델로 자동 전환
-    - 성공한 모델 기억하여 다음 호출부터 바로 사용
+    - 같은 호출이 이미 진행 중이면(다른 스레드·워커 포함) API 를 다시 부르지 않고 그 결과를 기다림
+    - response_schema: 구조화 출력(JSON) 요청 - 해석 텍스트 대신 JSON 문자열을 돌려받음
+    - budget: 재시도·대기를 모두 합친 호출 시간 상한 (초, None 이면 시도마다 timeout)
+    - 성공하면 결과에 만든 모델('model')도 포함
     """
-    global _working_model
+    full_prompt = prompt + extra_prompt
+    
+    fp = prompt_fingerprint(full_prompt, max_tokens, response_schema)
+    # 캐시는 브레이커가 열린 모델이 만든 결과도 유효 → 전체 모델 조회, 순위는 실제 호출에만
+    cached = _cached_interpretation(fp, category, GEMINI_MODELS)
+    if cached is not None:
+        return {'success': True, 'interpretation': cached[1], 'error': None, 'model': cached[0]}
     
+    models = _model_order()
     api_key = get_api_key()
     if not api_key:
         return {
             'success': False,
-            'error': 'GEMINI_API_KEY가 설정되지 않았습니다. .env 파일을 확인하세요.',
+            'error': NO_API_KEY_ERROR,
             'interpretation': None
         }
     
+    leader, result = _join_flight(fp, category, _flight_wait(budget or timeout))
+    if result is not None:
+        return result
+    
+    result = {'success': False, 'error': 'AI 해석 생성 실패', 'interpretation': None}
+    try:
+        body = _gemini_request_body(full_prompt, max_tokens, response_schema)
+        result = _call_upstream(body, fp, category, models, api_key, timeout, limit_wait, hedge, budget)
+    finally:
+        if leader:
+            AI_CACHE.end_flight(fp, category, None if result['success'] else result['error'])
+    return result
+
+
+def _call_upstream(body, fp, category, models, api_key, timeout, limit_wait, hedge, budget=None):
+    """_call_gemini 의 실제 API 호출 부분 (단일 비행 선행자, 또는 대기 시간이 지난 대기자가 실행)"""
+    # requests(+urllib3, certifi)는 임포트만 수십 ms → 첫 AI 호출 때 로드
+    import requests
+    
+    last_error = ''
+    deadline = time.monotonic() + limit_wait
+    stop = time.monotonic() + budget if budget else None
+    
+    for i, model in enumerate(models):
+        backup = models[i + 1] if hedge and i + 1 < len(models) else None
+        
+        for attempt in range(len(RETRY_WAITS)):
+            if not _wait_retry(attempt, stop):
+                return {'success': False, 'error': last_error or TIMEOUT_ERROR, 'interpretation': None}
+            
+            if not _acquire_token(model, models, min(deadline, stop) if stop else deadline):
+                last_error = RATE_LIMIT_ERROR
+                break
+            
+            call_timeout = _attempt_timeout(timeout, stop)
+            print(f"[AI] 호출: {model} (시도 {attempt+1})")
+            
+            if backup and attempt == 0:
+                used, status, value = _post_hedged(requests, model, backup, api_key, body, call_timeout)
+            else:
+                used = model
+                status, value = _post_once(requests, model, api_key, body, call_timeout)
+            
+            if status == 200:
+                AI_CACHE.put(fp, category, used, value)
+                print(f"[AI] ✅ 성공! 모델: {used}, {len(value)}자")
+                return {'success': True, 'interpretation': value, 'error': None, 'model': used}
+            
+            action, last_error = _handle_failure(model, attempt, status, value)
+            if action == 'stop':
+                return {'success': False, 'error': last_error, 'interpretation': None}
+            if action == 'next':
+                break
+    
+    print(f"[AI] 모든 모델 실패: {last_error}")
+    return {'success': False, 'error': last_error or 'AI 해석 생성 실패', 'interpretation': None}
+
+
+def _stream_gemini(prompt, extra_prompt='', max_tokens=4096, timeout=60, category='full',
+                   limit_wait=GEMINI_LIMIT_WAIT, budget=GEMINI_REQUEST_BUDGET):
+    """
+    Gemini 스트리밍 호출 (streamGenerateContent, SSE)
+    - ('chunk', 텍스트) 를 받는 대로 내보내고 마지막에 ('done', {'success', 'error'}) 한 번
+    - 첫 조각을 받기 전까지는 _call_gemini 와 같은 토큰 버킷 / 429 재시도 / 404 모델 전환
+      (헤지 요청은 하지 않음 - 이미 내보낸 조각을 다른 모델 결과로 바꿀 수 없음)
+    - 첫 조각 이후 끊기면 다른 모델로 이어 쓸 수 없으므로 실패로 끝냄 (캐시 저장 안 함)
+    - budget: 대기·재시도·본문 수신을 모두 합친 응답 시간 상한 (초, gunicorn timeout 안에서 끝나도록)
+    - 캐시 적중이면 전체 텍스트를 한 조각으로 바로 반환
+    - 같은 호출이 이미 진행 중이면 끝날 때까지 기다렸다가 결과를 한 조각으로 반환
+    """
+    stop = time.monotonic() + budget
     full_prompt = prompt + extra_prompt
     
-    # 모델 순서: 마지막 성공한 모델 먼저
-    if _working_model:
-        models = [_working_model] + [m for m in GEMINI_MODELS if m != _working_model]
-    else:
-        models = GEMINI_MODELS[:]
+    fp = prompt_fingerprint(full_prompt, max_tokens)
+    cached = _cached_interpretation(fp, category, GEMINI_MODELS)  # _call_gemini 와 같이 전체 모델
+    if cached is not None:
+        yield 'chunk', cached[1]
+        yield 'done', {'success': True, 'error': None}
+        return
     
+    models = _model_order()
+    api_key = get_api_key()
+    if not api_key:
+        yield 'done', {'success': False, 'error': NO_API_KEY_ERROR}
+        return
+    
+    leader, result = _join_flight(fp, category, _flight_wait(timeout))
+    if result is not None:
+        if result['success']:
+            yield 'chunk', result['interpretation']
+        yield 'done', {'success': result['success'], 'error': result['error']}
+        return
+    
+    # 클라이언트가 끊어 제너레이터가 닫혀도 대기자가 풀려나도록 finally 에서 종료 기록
+    error = 'AI 해석 생성 실패'
+    try:
+        for kind, payload in _stream_upstream(full_prompt, fp, category, models, api_key,
+                                              max_tokens, timeout, limit_wait, stop):
+            if kind == 'done':
+                error = payload['error']
+            yield kind, payload
+    finally:
+        if leader:
+            AI_CACHE.end_flight(fp, category, error)
+
+
+def _stream_upstream(full_prompt, fp, category, models, api_key, max_tokens, timeout, limit_wait, stop):
+    """_stream_gemini 의 실제 API 호출 부분 (단일 비행 선행자, 또는 대기 시간이 지난 대기자가 실행)"""
+    import requests
+    
+    body = _gemini_request_body(full_prompt, max_tokens)
     last_error = ''
+    deadline = time.monotonic() + limit_wait
     
     for model in models:
-        url = f'{GEMINI_BASE_URL}/{model}:generateContent'
+        url = f'{GEMINI_BASE_URL}/{model}:streamGenerateContent?alt=sse'
         
-        # 429 재시도 (최대 3회, 5초→15초→30초 대기)
-        for attempt in range(3):
-            try:
-                wait = [0, 5, 15][attempt]
-                if wait > 0:
-                    print(f"[AI] 대기 {wait}초... (재시도 {attempt+1}/3)")
-                    time.sleep(wait)
-                
-                print(f"[AI] 호출: {model} (시도 {attempt+1})")
-                
-                response = requests.post(
-                    url,
-                    headers={
-                        'Content-Type': 'application/json',
-                        'x-goog-api-key': api_key,
-                    },
-                    json={
-                        'system_instruction': {
-                            'parts': [{'text': SAJU_SYSTEM_PROMPT}]
-                        },
-                        'contents': [{
-                            'parts': [{'text': full_prompt}]
-                        }],
-                        'generationConfig': {
-                            'temperature': 0.7,
-                            'topP': 0.9,
-                            'topK': 40,
-                            'maxOutputTokens': max_tokens,
-                        }
-                    },
-                    timeout=timeout
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    text = result['candidates'][0]['content']['parts'][0]['text']
-                    _working_model = model
-                    print(f"[AI] ✅ 성공! 모델: {model}, {len(text)}자")
-                    return {'success': True, 'interpretation': text, 'error': None}
-                
-                elif response.status_code == 429:
-                    print(f"[AI] 429 한도초과 ({model}, 시도 {attempt+1})")
-                    last_error = 'API 호출 한도 초과(429). 무료 티어 분당 15회 제한. 잠시 후 다시 시도해주세요.'
-                    continue  # 같은 모델 재시도
-                
-                elif response.status_code == 404:
-                    print(f"[AI] 404 - {model} 사용 불가, 다음 모델 시도")
-                    last_error = f'{model} 모델을 사용할 수 없습니다.'
-                    break  # 다음 모델로
-                
-                elif response.status_code == 403:
-                    err = response.text[:200]
-                    print(f"[AI] 403 권한없음: {err}")
-                    return {
-                        'success': False,
-                        'error': 'API 키가 유효하지 않습니다. Google AI Studio에서 새 키를 발급하세요.',
-                        'interpretation': None
-                    }
-                
-                else:
-                    err = response.text[:200]
-                    print(f"[AI] {response.status_code}: {err}")
-                    last_error = f'API 오류 ({response.status_code})'
-                    break
+        for attempt in range(len(RETRY_WAITS)):
+            if not _wait_retry(attempt, stop):
+                yield 'done', {'success': False, 'error': last_error or TIMEOUT_ERROR}
+                return
             
-            except requests.Timeout:
-                print(f"[AI] 타임아웃 ({model})")
-                last_error = '해석 생성 시간 초과. 잠시 후 다시 시도해주세요.'
+            if not _acquire_token(model, models, min(deadline, stop)):
+                last_error = RATE_LIMIT_ERROR
                 break
+            
+            print(f"[AI] 스트리밍 호출: {model} (시도 {attempt+1})")
+            started = time.monotonic()
+            parts = []
+            try:
+                response = _post_gemini(requests, url, model, api_key, body, _attempt_timeout(timeout, stop),
+                                        stream=True)
+                with response:
+                    status = response.status_code
+                    if status == 200:
+                        response.encoding = 'utf-8'  # text/event-stream 은 charset 이 없음
+                        for line in response.iter_lines(chunk_size=None, decode_unicode=True):
+                            if time.monotonic() > stop:  # 조각이 느리게 와도 예산 안에서 끊음
+                                raise requests.Timeout()
+                            if not line.startswith('data:'):
+                                continue
+                            event = json.loads(line[5:])
+                            candidate = (event.get('candidates') or [{}])[0]
+                            for part in candidate.get('content', {}).get('parts', []):
+                                if part.get('text'):
+                                    parts.append(part['text'])
+                                    yield 'chunk', part['text']
+                        value = ''.join(parts)
+                        if not parts:
+                            status, value = 'error', f'{model} 응답이 비어 있습니다.'
+                    else:
+                        value = response.text[:200]
+            except requests.Timeout:
+                status, value = 'timeout', TIMEOUT_ERROR
             except Exception as e:
-                print(f"[AI] 예외: {str(e)[:100]}")
-                last_error = str(e)[:200]
+                status, value = 'error', str(e)[:200]
+            _record_health(model, status, time.monotonic() - started)
+            
+            if status == 200:
+                AI_CACHE.put(fp, category, model, value)
+                print(f"[AI] ✅ 스트리밍 완료! 모델: {model}, {len(value)}자")
+                yield 'done', {'success': True, 'error': None}
+                return
+            
+            action, last_error = _handle_failure(model, attempt, status, value)
+            if action == 'stop' or parts:  # 이미 내보낸 조각은 다른 시도로 이어 쓸 수 없음
+                yield 'done', {'success': False, 'error': last_error}
+                return
+            if action == 'next':
                 break
     
     print(f"[AI] 모든 모델 실패: {last_error}")
-    return {'success': False, 'error': last_error or 'AI 해석 생성 실패', 'interpretation': None}
+    yield 'done', {'success': False, 'error': last_error or 'AI 해석 생성 실패'}
 
 
-def get_ai_interpretation(saju_data):
-    """종합 사주 해석"""
-    prompt = build_saju_prompt(saju_data)
-    return _call_gemini(prompt)
+def get_ai_interpretation(chart, limit_wait=GEMINI_LIMIT_WAIT, prompt=None):
+    """종합 사주 해석 (prompt: 명식 저장소에 보관된 build_saju_prompt 결과가 있으면 재사용)"""
+    return _call_gemini(prompt or build_saju_prompt(chart), max_tokens=FULL_MAX_TOKENS, limit_wait=limit_wait)
 
 
-def get_category_interpretation(saju_data, category):
-    """카테고리별 상세 해석"""
-    category_prompts = {
-        'love': '연애운과 궁합, 결혼 시기에 대해 집중적으로 상세 분석해주세요. 도화살, 합충 관계를 중심으로.',
-        'money': '재물운과 투자 적성에 대해 집중 분석해주세요. 재성(편재/정재), 식상의 역할을 중심으로.',
-        'career': '직업운과 적성, 승진/이직 시기에 대해 분석해주세요. 관성, 인성, 식상을 중심으로.',
-        'health': '건강 주의사항을 오행 불균형 관점에서 상세 분석해주세요. 약한 오행과 관련된 장기를 중심으로.',
-        'yearly': f'{saju_data["current_year"]["year"]}년 올해 운세를 월별로 상세히 분석해주세요. 세운과 원국의 상호작용을 중심으로.',
-    }
+# ============================================================
+# 카테고리별 상세 해석
+# ============================================================
+
+# {year} = 명식 기준 연도
+CATEGORY_PROMPTS = {
+    'love': '연애운과 궁합, 결혼 시기에 대해 집중적으로 상세 분석해주세요. 도화살, 합충 관계를 중심으로.',
+    'money': '재물운과 투자 적성에 대해 집중 분석해주세요. 재성(편재/정재), 식상의 역할을 중심으로.',
+    'career': '직업운과 적성, 승진/이직 시기에 대해 분석해주세요. 관성, 인성, 식상을 중심으로.',
+    'health': '건강 주의사항을 오행 불균형 관점에서 상세 분석해주세요. 약한 오행과 관련된 장기를 중심으로.',
+    'yearly': '{year}년 올해 운세를 월별로 상세히 분석해주세요. 세운과 원국의 상호작용을 중심으로.',
+}
+CATEGORIES = tuple(CATEGORY_PROMPTS)
+
+# 묶음 응답 스키마: 카테고리 이름 → 해석 본문
+CATEGORY_BUNDLE_SCHEMA = {
+    'type': 'OBJECT',
+    'properties': {category: {'type': 'STRING'} for category in CATEGORIES},
+    'required': list(CATEGORIES),
+    'propertyOrdering': list(CATEGORIES),
+}
+
+# 묶음 생성이 실패했을 때 카테고리 단독 호출로 다시 시도해도 소용없는 오류
+BUNDLE_FINAL_ERRORS = (NO_API_KEY_ERROR, INVALID_API_KEY_ERROR, RATE_LIMIT_ERROR, TIMEOUT_ERROR)
+
+
+def category_extra_prompt(chart, category):
+    """카테고리별 추가 요청문 (잘못된 카테고리면 None)"""
+    if category not in CATEGORY_PROMPTS:
+        return None
+    request = CATEGORY_PROMPTS[category].format(year=chart.current_year)
+    return f"\n\n[특별 요청]\n{request}\n3000자 이상 상세하게 작성해주세요."
+
+
+def category_bundle_prompt(chart):
+    """다섯 카테고리를 한 번에 요청하는 추가 요청문 (응답은 CATEGORY_BUNDLE_SCHEMA JSON)"""
+    lines = '\n'.join(f"- {category}: {CATEGORY_PROMPTS[category].format(year=chart.current_year)}"
+                      for category in CATEGORIES)
+    return ("\n\n[특별 요청]\n아래 다섯 분야를 각각 따로 상세 분석해주세요. "
+            "JSON 으로 답하되 키는 분야 이름, 값은 그 분야의 해석 본문(마크다운)입니다.\n"
+            f"{lines}\n분야마다 1000자 이상 상세하게 작성해주세요.")
+
+
+def split_category_bundle(text):
+    """묶음 응답 JSON → {카테고리: 해석} (형식이 어긋나면 None)"""
+    try:
+        sections = json.loads(text)
+    except ValueError:
+        return None
+    if not isinstance(sections, dict):
+        return None
+    if not all(isinstance(sections.get(c), str) and sections[c].strip() for c in CATEGORIES):
+        return None
+    return {category: sections[category].strip() for category in CATEGORIES}
+
+
+def category_bundle_fingerprint(chart, prompt):
+    """
+    묶음 생성 지문 - 묶음 응답 전체는 (지문, 'bundle'), 쪼갠 카테고리는 (지문, 카테고리) 로 저장
+    (단독 호출과 프롬프트가 다르므로 단독 호출 지문과 섞지 않음)
+    """
+    return prompt_fingerprint(prompt + category_bundle_prompt(chart), CATEGORY_BUNDLE_MAX_TOKENS,
+                              CATEGORY_BUNDLE_SCHEMA)
+
+
+def _category_from_bundle(chart, category, prompt, limit_wait):
+    """
+    묶음 생성으로 카테고리 해석 얻기 (결과 dict, 단독 호출로 넘겨야 하면 None)
+    - 단독 호출 캐시나 이미 쪼개 둔 묶음 캐시가 있으면 바로 반환
+    - 없으면 다섯 카테고리를 구조화 JSON 한 번으로 생성 (묶음 자체도 캐시·단일 비행 대상)
+      → 카테고리마다 묶음 지문으로 나눠 저장 (이미 캐시된 카테고리는 덮어쓰지 않음)
+    """
+    fp = prompt_fingerprint(prompt + category_extra_prompt(chart, category), CATEGORY_MAX_TOKENS)
+    bundle_fp = category_bundle_fingerprint(chart, prompt)
+    for key in (fp, bundle_fp):
+        cached = _cached_interpretation(key, category, GEMINI_MODELS, record_miss=False)
+        if cached is not None:
+            return {'success': True, 'interpretation': cached[1], 'error': None, 'model': cached[0]}
     
-    if category not in category_prompts:
-        return {'success': False, 'error': '잘못된 카테고리', 'interpretation': None}
+    res = _call_gemini(prompt, category_bundle_prompt(chart), max_tokens=CATEGORY_BUNDLE_MAX_TOKENS,
+                       timeout=CATEGORY_BUNDLE_BUDGET, category='bundle', limit_wait=limit_wait,
+                       response_schema=CATEGORY_BUNDLE_SCHEMA, budget=CATEGORY_BUNDLE_BUDGET)
+    if not res['success']:
+        return res if res['error'] in BUNDLE_FINAL_ERRORS else None
     
-    prompt = build_saju_prompt(saju_data)
-    extra = f"\n\n[특별 요청]\n{category_prompts[category]}\n3000자 이상 상세하게 작성해주세요."
+    sections = split_category_bundle(res['interpretation'])
+    if sections is None:
+        print(f"[AI] 묶음 응답 형식 오류 ({res['model']}) → 카테고리 단독 호출")
+        return None
+    missing = missing_interpretations(chart, CATEGORIES, prompt, bundle=True)
+    for name in missing:
+        AI_CACHE.put(bundle_fp, name, res['model'], sections[name], replace=False)
+    print(f"[AI] 묶음 생성 → {len(missing)}개 카테고리 캐시 ({res['model']})")
+    return {'success': True, 'interpretation': sections[category], 'error': None, 'model': res['model']}
+
+
+def get_category_interpretation(chart, category, limit_wait=GEMINI_LIMIT_WAIT, prompt=None,
+                                bundle=GEMINI_CATEGORY_BUNDLE):
+    """
+    카테고리별 상세 해석
+    bundle: 다섯 카테고리 묶음 생성 사용 (실패·형식 오류면 이 카테고리만 단독 호출)
+    """
+    extra = category_extra_prompt(chart, category)
+    if extra is None:
+        return {'success': False, 'error': INVALID_CATEGORY_ERROR, 'interpretation': None}
     
-    return _call_gemini(prompt, extra, max_tokens=8192, timeout=90)
+    prompt = prompt or build_saju_prompt(chart)
+    if bundle:
+        res = _category_from_bundle(chart, category, prompt, limit_wait)
+        if res is not None:
+            return res
+    return _call_gemini(prompt, extra, max_tokens=CATEGORY_MAX_TOKENS, timeout=90, category=category,
+                        limit_wait=limit_wait)
+
+
+def prefetch_headroom(min_headroom=PREFETCH_MIN_HEADROOM):
+    """선행 생성할 여유가 있는지 (1순위 모델 버킷의 남은 토큰 기준)"""
+    return GEMINI_LIMITER.headroom(_model_order()[0]) >= min_headroom
+
+
+def interpretation_fingerprints(chart, prompt=None):
+    """종류('full' + CATEGORIES) → AI 캐시 지문 (캐시 예열 도구가 이미 만든 해석을 건너뛸 때)"""
+    prompt = prompt or build_saju_prompt(chart)
+    fps = {'full': prompt_fingerprint(prompt, FULL_MAX_TOKENS)}
+    for category in CATEGORIES:
+        fps[category] = prompt_fingerprint(prompt + category_extra_prompt(chart, category), CATEGORY_MAX_TOKENS)
+    return fps
+
+
+def missing_interpretations(chart, kinds, prompt=None, bundle=GEMINI_CATEGORY_BUNDLE):
+    """
+    kinds 중 어떤 모델로도 캐시에 없는 종류 (조회 카운터는 건드리지 않음)
+    bundle: 묶음 생성으로 쪼개 둔 카테고리도 캐시된 것으로 봄
+    """
+    prompt = prompt or build_saju_prompt(chart)
+    fps = interpretation_fingerprints(chart, prompt)
+    keys = {kind: [fps[kind]] for kind in fps}
+    if bundle:
+        bundle_fp = category_bundle_fingerprint(chart, prompt)
+        for category in CATEGORIES:
+            keys[category].append(bundle_fp)
+    return [kind for kind in kinds if not any(AI_CACHE.has(fp, kind, GEMINI_MODELS) for fp in keys[kind])]
+
+
+def prefetch_category_interpretations(chart, prompt=None):
+    """
+    PREFETCH_CATEGORIES 해석을 미리 만들어 AI 캐시에 선행 생성으로 표시해 저장 → 준비된 카테고리 목록
+    - 카테고리마다 한도 여유를 다시 확인하고 토큰은 기다리지 않음 (여유가 없거나 실패하면 중단)
+    - 묶음 생성이 켜져 있으면 첫 카테고리에서 다섯 개가 모두 채워지고 나머지는 캐시 적중
+    """
+    prompt = prompt or build_saju_prompt(chart)
+    ready = []
+    with AI_CACHE.prefetching(CATEGORIES):
+        for category in PREFETCH_CATEGORIES:
+            if not prefetch_headroom():
+                print(f"[AI] 선행 생성 중단: 호출 한도 여유 없음 ({category})")
+                break
+            if not get_category_interpretation(chart, category, 0, prompt)['success']:
+                break
+            ready.append(category)
+    return ready
+
+
+def stream_ai_interpretation(chart, prompt=None):
+    """종합 사주 해석 (스트리밍) - ('chunk', 텍스트) ... ('done', 결과)"""
+    return _stream_gemini(prompt or build_saju_prompt(chart))
+
+
+def stream_category_interpretation(chart, category, prompt=None):
+    """카테고리별 상세 해석 (스트리밍)"""
+    extra = category_extra_prompt(chart, category)
+    if extra is None:
+        return iter([('done', {'success': False, 'error': INVALID_CATEGORY_ERROR})])
+    return _stream_gemini(prompt or build_saju_prompt(chart), extra, max_tokens=CATEGORY_MAX_TOKENS,
+                          timeout=90, category=category)
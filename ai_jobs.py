@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+"""
+AI 해석 비동기 작업 큐
+- 요청은 작업을 SQLite 큐(ai_jobs.sqlite3)에 넣고 작업 id 를 바로 반환
+- 각 웹 워커 프로세스의 백그라운드 스레드(AI_JOB_THREADS 개)가 큐를 비움
+  → 15~30초 걸리는 Gemini 호출이 요청 처리 워커를 붙잡지 않음
+- 작업은 임대(lease) 방식으로 가져감: 처리하는 동안 임대를 주기적으로 연장하고,
+  워커가 죽어 연장이 멈추면 임대 만료 후 다른 워커가 재시도 (처리 시간과 무관하게 짧은 임대)
+- 작업 종류별 처리 함수는 register_handler 로 등록 (app.py 가 응답 생성 함수를 등록)
+- 낮은 우선순위 종류(선행 생성 등)는 대기 중인 일반 작업이 없을 때만, 전체 워커 합계
+  AI_JOB_LOW_PRIORITY_RUNNING 개까지만 실행 (사용자 작업이 스레드를 기다리지 않도록)
+
+단독 실행 (웹 워커와 별도로 큐만 비우는 프로세스):
+    python ai_jobs.py
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+
+AI_JOBS_PATH = os.environ.get(
+    'AI_JOBS_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ai_jobs.sqlite3'))
+AI_JOB_THREADS = int(os.environ.get('AI_JOB_THREADS', 2))
+AI_JOB_LEASE = 60               # 초 - 처리 중에는 AI_JOB_RENEW_INTERVAL 마다 연장
+AI_JOB_RENEW_INTERVAL = AI_JOB_LEASE / 3
+AI_JOB_MAX_ATTEMPTS = 3
+AI_JOB_RETENTION = 86400        # 끝난 작업 보관 시간 (초)
+AI_JOB_POLL_INTERVAL = 1.0      # 다른 프로세스가 넣은 작업 확인 주기 (초)
+AI_JOB_LOW_PRIORITY_RUNNING = 1  # 동시에 실행하는 낮은 우선순위 작업 수 (전체 워커 합계)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    result TEXT,
+    error TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    created REAL NOT NULL,
+    lease_until REAL,
+    finished REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_status_created ON jobs (status, created);
+"""
+
+_handlers = {}
+_low_priority = set()
+_local = threading.local()
+_wakeup = threading.Condition()
+_started_pid = None
+
+
+def register_handler(kind, func, low_priority=False):
+    """작업 종류 → 처리 함수(payload dict → 결과 dict) 등록"""
+    _handlers[kind] = func
+    if low_priority:
+        _low_priority.add(kind)
+
+
+def _connect():
+    # 프로세스·스레드마다 연결 (preload 마스터에서 연 연결은 fork 후 재사용하지 않음)
+    conn = getattr(_local, 'conn', None)
+    if conn is not None and _local.pid == os.getpid():
+        return conn
+    conn = sqlite3.connect(AI_JOBS_PATH, timeout=10, isolation_level=None, check_same_thread=False)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.executescript(_SCHEMA)
+    _local.conn, _local.pid = conn, os.getpid()
+    return conn
+
+
+# ============================================================
+# 큐 조작
+# ============================================================
+
+def enqueue(kind, payload):
+    """작업을 넣고 작업 id 반환 (이 프로세스의 작업 스레드가 없으면 시작)"""
+    if kind not in _handlers:
+        raise ValueError(f'알 수 없는 작업 종류: {kind}')
+    job_id = uuid.uuid4().hex
+    now = time.time()
+    conn = _connect()
+    conn.execute('INSERT INTO jobs (id, kind, payload, status, created) VALUES (?, ?, ?, ?, ?)',
+                 (job_id, kind, json.dumps(payload, ensure_ascii=False), 'queued', now))
+    conn.execute("DELETE FROM jobs WHERE status IN ('done', 'failed') AND finished < ?",
+                 (now - AI_JOB_RETENTION,))
+    start_workers()
+    with _wakeup:
+        _wakeup.notify()
+    return job_id
+
+
+def _claim():
+    """대기 중이거나 임대가 만료된 작업 하나를 가져옴 (없으면 None)"""
+    conn = _connect()
+    now = time.time()
+    low = tuple(_low_priority)
+    marks = ','.join('?' * len(low))
+    conn.execute('BEGIN IMMEDIATE')
+    try:
+        # 일반 작업 먼저, 낮은 우선순위 작업은 실행 중인 수가 한도 미만일 때만
+        busy = conn.execute(
+            f"SELECT COUNT(*) FROM jobs WHERE status = 'running' AND lease_until >= ? AND kind IN ({marks})",
+            (now,) + low).fetchone()[0]
+        row = conn.execute(
+            "SELECT id, kind, payload, attempts FROM jobs "
+            "WHERE (status = 'queued' OR (status = 'running' AND lease_until < ?)) "
+            f"AND (kind NOT IN ({marks}) OR ?) "
+            f"ORDER BY kind IN ({marks}), created LIMIT 1",
+            (now,) + low + (busy < AI_JOB_LOW_PRIORITY_RUNNING,) + low).fetchone()
+        if row is None:
+            conn.execute('COMMIT')
+            return None
+        job_id, kind, payload, attempts = row
+        if attempts >= AI_JOB_MAX_ATTEMPTS:
+            conn.execute("UPDATE jobs SET status = 'failed', error = ?, finished = ? WHERE id = ?",
+                         ('작업 처리 중 워커가 반복해서 중단되었습니다.', now, job_id))
+            conn.execute('COMMIT')
+            return _claim()
+        conn.execute("UPDATE jobs SET status = 'running', attempts = attempts + 1, lease_until = ? WHERE id = ?",
+                     (now + AI_JOB_LEASE, job_id))
+        conn.execute('COMMIT')
+    except Exception:
+        conn.execute('ROLLBACK')
+        raise
+    return job_id, kind, json.loads(payload), attempts + 1
+
+
+def _renew_lease(job_id, attempt, stop):
+    """
+    처리 중인 작업의 임대 연장 (stop 이 설정될 때까지)
+    attempt 가 다르면 임대가 이미 만료되어 다른 워커가 가져간 것 → 연장하지 않음
+    """
+    while not stop.wait(AI_JOB_RENEW_INTERVAL):
+        try:
+            _connect().execute(
+                "UPDATE jobs SET lease_until = ? WHERE id = ? AND status = 'running' AND attempts = ?",
+                (time.time() + AI_JOB_LEASE, job_id, attempt))
+        except sqlite3.Error as e:
+            print(f"[작업] 임대 연장 오류: {e}")
+
+
+def _finish(job_id, attempt, result=None, error=None):
+    """
+    결과 기록 → 기록했으면 True
+    attempt 가 다르면 임대가 만료되어 다른 워커가 가져간 것 → 새 담당 워커의 결과를 덮어쓰지 않음
+    """
+    cursor = _connect().execute(
+        'UPDATE jobs SET status = ?, result = ?, error = ?, finished = ?, lease_until = NULL '
+        "WHERE id = ? AND status = 'running' AND attempts = ?",
+        ('failed' if error else 'done',
+         None if result is None else json.dumps(result, ensure_ascii=False),
+         error, time.time(), job_id, attempt))
+    return cursor.rowcount > 0
+
+
+def get_job(job_id):
+    """작업 상태 dict (없으면 None) - 끝난 작업은 result / error 포함"""
+    row = _connect().execute(
+        'SELECT id, kind, status, result, error, created, finished FROM jobs WHERE id = ?',
+        (job_id,)).fetchone()
+    if row is None:
+        return None
+    job_id, kind, status, result, error, created, finished = row
+    job = {'job_id': job_id, 'kind': kind, 'status': status}
+    if status == 'queued':
+        job['position'] = _connect().execute(
+            "SELECT COUNT(*) FROM jobs WHERE status = 'queued' AND created < ?", (created,)).fetchone()[0]
+    if result is not None:
+        job['result'] = json.loads(result)
+    if error:
+        job['error'] = error
+    if finished:
+        job['elapsed'] = round(finished - created, 2)
+    return job
+
+
+def wait_job(job_id, timeout):
+    """작업이 끝나거나 timeout 초가 지날 때까지 기다린 뒤 상태 반환 (롱 폴링)"""
+    deadline = time.monotonic() + timeout
+    while True:
+        job = get_job(job_id)
+        if job is None or job['status'] in ('done', 'failed') or time.monotonic() >= deadline:
+            return job
+        time.sleep(min(0.25, max(0.0, deadline - time.monotonic())))
+
+
+def stats():
+    rows = _connect().execute('SELECT status, COUNT(*) FROM jobs GROUP BY status').fetchall()
+    return {status: count for status, count in rows}
+
+
+# ============================================================
+# 작업 스레드
+# ============================================================
+
+def _worker_loop():
+    while True:
+        try:
+            job = _claim()
+        except sqlite3.Error as e:
+            print(f"[작업] 큐 오류: {e}")
+            job = None
+        if job is None:
+            with _wakeup:
+                _wakeup.wait(AI_JOB_POLL_INTERVAL)
+            continue
+        try:
+            _run(job)
+        except Exception as e:  # 스레드가 죽으면 다시 시작되지 않음
+            print(f"[작업] 처리 오류: {job[0]} - {str(e)[:100]}")
+
+
+def _run(job):
+    """가져온 작업 하나 처리 (처리하는 동안 별도 스레드가 임대 연장)"""
+    job_id, kind, payload, attempt = job
+    print(f"[작업] 시작: {job_id} ({kind})")
+    stop = threading.Event()
+    threading.Thread(target=_renew_lease, args=(job_id, attempt, stop),
+                     name=f'ai-job-lease-{job_id[:8]}', daemon=True).start()
+    try:
+        try:
+            if _finish(job_id, attempt, result=_handlers[kind](payload)):
+                print(f"[작업] 완료: {job_id}")
+            else:
+                print(f"[작업] 임대 만료로 결과 버림: {job_id}")
+        except Exception as e:
+            print(f"[작업] 실패: {job_id} - {str(e)[:100]}")
+            try:
+                _finish(job_id, attempt, error=str(e)[:200])
+            except sqlite3.Error as e:  # 기록 못 한 작업은 임대가 끝나면 다시 실행
+                print(f"[작업] 결과 기록 오류: {job_id} - {e}")
+    finally:
+        stop.set()
+
+
+def start_workers(threads=AI_JOB_THREADS):
+    """이 프로세스의 작업 스레드 시작 (프로세스당 한 번, gunicorn post_fork 에서도 호출)"""
+    global _started_pid
+    with _wakeup:
+        if _started_pid == os.getpid() or threads <= 0:
+            return
+        _started_pid = os.getpid()
+    for i in range(threads):
+        threading.Thread(target=_worker_loop, name=f'ai-job-{i}', daemon=True).start()
+
+
+if __name__ == '__main__':
+    # __main__ 이 아닌 ai_jobs 모듈에 처리 함수가 등록되므로 그쪽으로 실행
+    import ai_jobs
+    import app  # noqa: F401  (작업 처리 함수 등록)
+    ai_jobs.start_workers()
+    print(f"[작업] {AI_JOB_THREADS}개 스레드로 {AI_JOBS_PATH} 처리 중")
+    while True:
+        time.sleep(3600)
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
-from flask import Flask, request, jsonify, send_from_directory, make_response
+from flask import Flask, Response, request, jsonify, send_from_directory, make_response, stream_with_context
+import json
 import os
+import time
 
 def load_env():
     env_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.env')
@@ -14,8 +16,29 @@ def load_env():
 
 load_env()
 
-from saju_engine import analyze_saju
-from ai_interpreter import get_ai_interpretation, get_category_interpretation
+from saju_engine import get_saju_chart, CHART_CACHE
+from chart_json import encode_chart, dumps, CHART_JSON_CACHE
+from ai_interpreter import (
+    get_ai_interpretation, get_category_interpretation,
+    stream_ai_interpretation, stream_category_interpretation,
+    build_saju_prompt, prefetch_headroom, prefetch_category_interpretations,
+    GEMINI_MODELS, GEMINI_LIMIT_WAIT, AI_PREFETCH,
+)
+from chart_store import CHART_STORE, chart_input
+from local_interpreter import local_interpretation, local_category_interpretation
+from rate_limiter import GEMINI_LIMITER
+from model_health import MODEL_HEALTH
+from context_cache import CONTEXT_CACHE
+from ai_cache import AI_CACHE
+import ai_jobs
+from luck_timeline import iter_timeline, TIMELINE_KINDS
+
+TIMELINE_MAX_YEARS = 20
+JOB_MAX_WAIT = 25  # 롱 폴링 최대 대기 (초)
+JOB_LIMIT_WAIT = 120  # 비동기 작업은 요청을 붙잡지 않으므로 호출 한도 토큰을 더 오래 기다림
+CHART_NOT_FOUND_ERROR = '명식 정보가 만료되었습니다. 생년월일을 다시 입력해주세요.'
+# AI 해석 요청 로그 (JSONL 한 줄 = 한 요청, 비우면 기록 안 함) → tools/warm_ai_cache.py 의 입력
+REQUEST_LOG_PATH = os.environ.get('REQUEST_LOG_PATH', '')
 
 app = Flask(__name__, static_folder='static')
 
@@ -36,31 +59,132 @@ def get_saju():
         return make_response('', 204)
     try:
         data = request.get_json()
-        result = analyze_saju(
-            int(data['year']), int(data['month']), int(data['day']),
-            int(data['hour']), data['gender'], data.get('is_lunar', False)
-        )
-        return jsonify(result)
+        chart = chart_from_request(data)
+        # chart_id 는 입력값의 HMAC → 저장·프롬프트 조립은 첫 AI 요청(resolve_chart) 때
+        chart_id = CHART_STORE.chart_id(chart)
+        # jsonify 와 같은 바이트를 미리 렌더링된 조각으로 조립
+        return app.response_class(encode_chart(chart, chart_id), mimetype=app.json.mimetype)
+    except ValueError as e:  # 잘못된 입력
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+def chart_from_request(data):
+    return get_saju_chart(
+        int(data['year']), int(data['month']), int(data['day']),
+        int(data['hour']), data['gender'], data.get('is_lunar', False),
+        data.get('is_leap_month', False)
+    )
+
+def resolve_chart(data):
+    """
+    요청 → (chart_id, 명식, 프롬프트)
+    - chart_id 가 저장소에 있으면 명식 계산·프롬프트 조립 없이 재사용
+    - 없거나 만료됐으면 함께 보낸 생년월일로 계산해 저장 (생년월일도 없으면 ValueError)
+      /api/saju 가 돌려준 id 는 아직 저장 전이므로 첫 AI 요청에는 생년월일도 함께 보내야 함
+    """
+    chart_id = data.get('chart_id')
+    if chart_id:
+        entry = CHART_STORE.get(chart_id, get_saju_chart)
+        if entry is not None:
+            return (chart_id,) + entry
+        if 'year' not in data:
+            raise ValueError(CHART_NOT_FOUND_ERROR)
+    chart = chart_from_request(data)
+    chart_id, prompt = CHART_STORE.put(chart, build_saju_prompt)
+    return chart_id, chart, prompt
+
+def log_request(kind, chart, category=None):
+    """AI 해석 요청 한 건을 REQUEST_LOG_PATH 에 추가 (chart_id 만 보낸 요청도 생년월일로 기록)"""
+    if not REQUEST_LOG_PATH:
+        return
+    entry = dict(chart_input(chart), kind=kind, ts=int(time.time()))
+    if category:
+        entry['category'] = category
+    try:
+        # 한 줄을 한 번에 append → 워커 여러 개가 같은 파일에 써도 줄이 섞이지 않음
+        with open(REQUEST_LOG_PATH, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+    except OSError as e:
+        print(f"[요청 로그] 기록 실패: {e}")
+
+def full_result(data, limit_wait=GEMINI_LIMIT_WAIT):
+    """/api/saju/full 응답 본문 (동기 요청과 비동기 작업이 공유)"""
+    chart_id, chart, prompt = resolve_chart(data)
+    log_request('full', chart)
+    ai_res = get_ai_interpretation(chart, limit_wait, prompt)
+    saju_result = chart.to_dict()
+    saju_result['chart_id'] = chart_id
+    saju_result['ai_interpretation'] = {
+        'available': ai_res['success'],
+        'text': ai_res.get('interpretation', '') or '',
+        'message': ai_res.get('error', '') or ''
+    }
+    if ai_res['success']:
+        schedule_prefetch(data, chart_id)
+    else:
+        # AI 를 쓸 수 없으면 규칙 기반 기본 풀이로 대신
+        saju_result['ai_interpretation']['local_text'] = local_interpretation(chart)
+    return saju_result
+
+def detail_result(data, limit_wait=GEMINI_LIMIT_WAIT):
+    """/api/saju/detail 응답 본문 (동기 요청과 비동기 작업이 공유)"""
+    chart_id, chart, prompt = resolve_chart(data)
+    category = data.get('category', 'love')
+    log_request('detail', chart, category)
+    ai_res = get_category_interpretation(chart, category, limit_wait, prompt)
+    result = {
+        'chart_id': chart_id,
+        'category': category,
+        'available': ai_res['success'],
+        'interpretation': ai_res.get('interpretation', '') or '',
+        'message': ai_res.get('error', '') or ''
+    }
+    if not ai_res['success']:
+        result['local_interpretation'] = local_category_interpretation(chart, category)
+    return result
+
+def local_text(kind, data, chart):
+    """AI 결과를 기다리는 동안 먼저 보여줄 규칙 기반 기본 풀이 (종합 또는 카테고리)"""
+    if kind == 'full':
+        return local_interpretation(chart)
+    return local_category_interpretation(chart, data.get('category', 'love'))
+
+def schedule_prefetch(data, chart_id):
+    """종합 해석 성공 후 카테고리 선행 생성 작업 예약 (AI_PREFETCH=1 이고 호출 한도 여유가 있을 때만)"""
+    if not AI_PREFETCH or not prefetch_headroom():
+        return
+    try:
+        ai_jobs.enqueue('prefetch', dict(data, chart_id=chart_id))
+    except Exception as e:
+        print(f"[선행 생성] 예약 실패: {str(e)[:100]}")
+
+def prefetch_result(data):
+    chart_id, chart, prompt = resolve_chart(data)
+    return {'chart_id': chart_id, 'prefetched': prefetch_category_interpretations(chart, prompt)}
+
+ai_jobs.register_handler('full', lambda data: full_result(data, JOB_LIMIT_WAIT))
+ai_jobs.register_handler('detail', lambda data: detail_result(data, JOB_LIMIT_WAIT))
+ai_jobs.register_handler('prefetch', prefetch_result, low_priority=True)
+
+def enqueue_response(kind, data):
+    """비동기 모드: 입력만 검증하고 작업 id 를 바로 반환 (결과는 /api/jobs/<id>)"""
+    _, chart, _ = resolve_chart(data)  # 잘못된 입력·만료된 chart_id 는 작업을 만들지 않고 바로 오류
+    job_id = ai_jobs.enqueue(kind, data)
+    return jsonify({'job_id': job_id, 'status': 'queued', 'result_url': f'/api/jobs/{job_id}',
+                    'local': local_text(kind, data, chart)}), 202
+
 @app.route('/api/saju/full', methods=['POST', 'OPTIONS'])
 def get_saju_full():
     if request.method == 'OPTIONS':
         return make_response('', 204)
     try:
         data = request.get_json()
-        saju_result = analyze_saju(
-            int(data['year']), int(data['month']), int(data['day']),
-            int(data['hour']), data['gender'], data.get('is_lunar', False)
-        )
-        ai_res = get_ai_interpretation(saju_result)
-        saju_result['ai_interpretation'] = {
-            'available': ai_res['success'],
-            'text': ai_res.get('interpretation', '') or '',
-            'message': ai_res.get('error', '') or ''
-        }
-        return jsonify(saju_result)
+        if data.get('async'):
+            return enqueue_response('full', data)
+        return jsonify(full_result(data))
+    except ValueError as e:  # 잘못된 입력
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         import traceback
         traceback.print_exc()
@@ -72,24 +196,133 @@ def get_saju_detail():
         return make_response('', 204)
     try:
         data = request.get_json()
-        saju_result = analyze_saju(
-            int(data['year']), int(data['month']), int(data['day']),
-            int(data['hour']), data['gender'], data.get('is_lunar', False)
-        )
-        ai_res = get_category_interpretation(saju_result, data.get('category', 'love'))
+        if data.get('async'):
+            return enqueue_response('detail', data)
+        return jsonify(detail_result(data))
+    except ValueError as e:  # 잘못된 입력
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def get_job_status(job_id):
+    """작업 상태/결과 조회 - ?wait=초 를 주면 끝날 때까지 최대 그만큼 대기 (롱 폴링)"""
+    try:
+        wait = min(max(float(request.args.get('wait', 0)), 0.0), JOB_MAX_WAIT)
+        job = ai_jobs.wait_job(job_id, wait) if wait else ai_jobs.get_job(job_id)
+        if job is None:
+            return jsonify({'error': '작업을 찾을 수 없습니다.'}), 404
+        return jsonify(job)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+def sse_event(event, data):
+    """Server-Sent Events 한 건 (data: JSON 바이트 또는 직렬화할 객체, 한 줄)"""
+    if not isinstance(data, bytes):
+        data = dumps(data)
+    return b'event: ' + event.encode() + b'\ndata: ' + data + b'\n\n'
+
+def sse_response(chart_id, chart, local, stream, on_success=None):
+    """
+    명식 JSON(chart_id 포함)과 기본 풀이(local)를 먼저 보내고 AI 해석 조각을 받는 대로 전달
+    (성공하면 on_success 호출)
+    """
+    def events():
+        yield sse_event('chart', encode_chart(chart, chart_id).rstrip(b'\n'))
+        if local:
+            yield sse_event('local', {'text': local})
+        for kind, payload in stream:
+            if kind == 'chunk':
+                yield sse_event('chunk', {'text': payload})
+            else:
+                yield sse_event('done', {'available': payload['success'], 'message': payload['error'] or ''})
+                if payload['success'] and on_success is not None:
+                    on_success()
+    return Response(stream_with_context(events()), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+@app.route('/api/saju/full/stream', methods=['POST', 'OPTIONS'])
+def stream_saju_full():
+    if request.method == 'OPTIONS':
+        return make_response('', 204)
+    try:
+        data = request.get_json()
+        chart_id, chart, prompt = resolve_chart(data)
+        log_request('full', chart)
+    except ValueError as e:  # 잘못된 입력
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+    return sse_response(chart_id, chart, local_text('full', data, chart), stream_ai_interpretation(chart, prompt),
+                        lambda: schedule_prefetch(data, chart_id))
+
+@app.route('/api/saju/detail/stream', methods=['POST', 'OPTIONS'])
+def stream_saju_detail():
+    if request.method == 'OPTIONS':
+        return make_response('', 204)
+    try:
+        data = request.get_json()
+        chart_id, chart, prompt = resolve_chart(data)
+        log_request('detail', chart, data.get('category', 'love'))
+    except ValueError as e:  # 잘못된 입력
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+    return sse_response(chart_id, chart, local_text('detail', data, chart),
+                        stream_category_interpretation(chart, data.get('category', 'love'), prompt))
+
+@app.route('/api/saju/timeline', methods=['POST', 'OPTIONS'])
+def get_saju_timeline():
+    """대운/세운/월운 타임라인 - from_year 부터 years 년치 페이지 단위"""
+    if request.method == 'OPTIONS':
+        return make_response('', 204)
+    try:
+        data = request.get_json()
+        chart = chart_from_request(data)
+        from_year = int(data.get('from_year', chart.solar_date.year))
+        years = max(1, min(TIMELINE_MAX_YEARS, int(data.get('years', 10))))
+        kinds = data.get('kinds', TIMELINE_KINDS)
+        if not isinstance(kinds, (list, tuple)):
+            raise ValueError(f"kinds 는 {', '.join(TIMELINE_KINDS)} 중에서 고른 목록이어야 합니다.")
+        kinds = [k for k in kinds if k in TIMELINE_KINDS]
+        to_year = from_year + years - 1
         return jsonify({
-            'category': data.get('category', 'love'),
-            'available': ai_res['success'],
-            'interpretation': ai_res.get('interpretation', '') or '',
-            'message': ai_res.get('error', '') or ''
+            'from_year': from_year,
+            'to_year': to_year,
+            'next_from_year': to_year + 1,
+            'items': list(iter_timeline(chart, from_year, to_year, kinds)),
         })
+    except ValueError as e:  # 잘못된 입력
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/health', methods=['GET'])
 def health():
     key = os.environ.get('GEMINI_API_KEY', '')
-    return jsonify({'status': 'ok', 'ai_enabled': bool(key)})
+    return jsonify({'status': 'ok', 'ai_enabled': bool(key), 'chart_cache': CHART_CACHE.stats(),
+                    'chart_json_cache': CHART_JSON_CACHE.stats(), 'chart_store': CHART_STORE.stats(),
+                    'ai_cache': AI_CACHE.stats(),
+                    'ai_jobs': ai_jobs.stats(), 'gemini_limits': GEMINI_LIMITER.stats(GEMINI_MODELS),
+                    'gemini_models': MODEL_HEALTH.stats(GEMINI_MODELS),
+                    'gemini_context_cache': CONTEXT_CACHE.stats(GEMINI_MODELS)})
+
+# ============================================================
+# 기동 최적화 (gunicorn.conf.py 훅에서 호출)
+# ============================================================
+WARM_UP_REQUEST = {'year': 1990, 'month': 5, 'day': 17, 'hour': 14, 'gender': '남'}
+
+def preload_shared():
+    """마스터 프로세스에서 한 번: 워커가 지연 임포트할 모듈을 미리 올려 fork 후 공유"""
+    import requests  # noqa: F401  (ai_interpreter 가 첫 AI 호출 때 임포트)
+
+def warm_up():
+    """워커 fork 직후 샘플 요청 한 번으로 라우팅·JSON 직렬화·차트 경로를 데움"""
+    try:
+        with app.test_client() as client:
+            client.post('/api/saju', json=WARM_UP_REQUEST)
+    except Exception as e:
+        print(f"[warm-up] 실패: {str(e)[:100]}")
 
 if __name__ == '__main__':
     os.makedirs('static', exist_ok=True)
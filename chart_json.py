@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""
+명식 응답 JSON 직렬화기 (사전 렌더링 조각 이어 붙이기)
+- flask.jsonify(chart.to_dict()) 와 바이트 단위로 같은 결과
+  (키 정렬, ensure_ascii, 압축 구분자, 끝 개행)
+- 60갑자 기둥/대운 조각, 십신·지장간·띠·일간 오행 이름은 import 시 한 번 렌더링
+- input 을 제외한 본문은 cache_key 기준 LRU 에 (input 앞, input 뒤) 바이트로 보관
+"""
+
+import json
+import os
+
+from saju_engine import (
+    CHEONGAN, CHEONGAN_KR, JIJI, JIJI_KR, CHEONGAN_OHAENG, OHAENG_NAME, ZODIAC_ANIMALS,
+    JIJANGGAN, SIPSIN_NAME, SIPSIN_TABLE, SIPSIN_JI_TABLE, HOUR_JI_NAMES,
+    pillar_dict, pillar_label, get_daeun_start, get_daeun_pillar,
+)
+from memo import LRUCache
+
+
+def dumps(obj):
+    """jsonify 와 같은 설정의 JSON 문자열 → UTF-8 바이트"""
+    return json.dumps(obj, ensure_ascii=True, sort_keys=True, separators=(',', ':')).encode()
+
+
+# ============================================================
+# 사전 렌더링 조각 (60갑자 번호 = gan, ji 가 같은 k: k % 10, k % 12)
+# ============================================================
+
+GANZHI = [(k % 10, k % 12) for k in range(60)]
+
+PILLAR_JSON = {gz: dumps(pillar_dict(*gz)) for gz in GANZHI}
+
+# 대운 항목은 age/year 만 바뀜 → 정렬된 키 순서상 가운데 조각을 미리 렌더링
+DAEUN_JSON = {
+    (g, j): dumps({
+        'gan': g, 'ji': j, 'gan_char': CHEONGAN[g], 'ji_char': JIJI[j],
+        'gan_kr': CHEONGAN_KR[g], 'ji_kr': JIJI_KR[j], 'label': pillar_label(g, j),
+    })[1:-1]
+    for g, j in GANZHI
+}
+
+SIPSIN_JSON = [dumps(name) for name in SIPSIN_NAME]
+DAY_GAN_SIPSIN_JSON = dumps('일주')
+HOUR_NAME_JSON = [dumps(name) for name in HOUR_JI_NAMES]
+ZODIAC_JSON = [dumps(name) for name in ZODIAC_ANIMALS]
+ILGAN_OHAENG_JSON = [dumps(OHAENG_NAME[CHEONGAN_OHAENG[g]]) for g in range(10)]
+JIJANGGAN_JSON = [
+    dumps([(CHEONGAN_KR[CHEONGAN.index(g)], g, days) for g, days in JIJANGGAN.get(ji, [])])
+    for ji in JIJI
+]
+BOOL_JSON = {True: b'true', False: b'false'}
+
+# 명식 본문 바이트 캐시 - SajuChart.cache_key 기준
+CHART_JSON_CACHE = LRUCache(maxsize=int(os.environ.get('SAJU_CHART_CACHE_SIZE', 4096)))
+
+
+# ============================================================
+# 조립
+# ============================================================
+
+def _render_body(chart):
+    """input 앞/뒤 본문 바이트 (최상위 키 정렬 순서: current_year, daeun, ilgan_ohaeng, input, ...)"""
+    gans, jis = chart.gans, chart.jis
+    ilgan = chart.day_gan
+
+    solar = chart.solar_date
+    forward, start_age = get_daeun_start(chart.year_gan, solar, chart.gender)
+    daeun = []
+    for i in range(10):
+        age = start_age + i * 10
+        gz = get_daeun_pillar(chart.month_gan, chart.month_ji, forward, i)
+        daeun.append(b'{"age":%d,%s,"year":%d}' % (age, DAEUN_JSON[gz], solar.year + age))
+
+    head = b''.join((
+        b'{"current_year":', dumps(chart.current_year_info),
+        b',"daeun":{"list":[', b','.join(daeun), b'],"start_age":%d}' % start_age,
+        b',"ilgan_ohaeng":', ILGAN_OHAENG_JSON[ilgan],
+        b',"input":',
+    ))
+
+    # 정렬 순서: day, hour, month, year / 지장간은 년지, 시지, 월지, 일지
+    y, m, d, h = zip(gans, jis)
+    tail = b''.join((
+        b',"jijanggan":{"\\ub144\\uc9c0":', JIJANGGAN_JSON[y[1]],
+        b',"\\uc2dc\\uc9c0":', JIJANGGAN_JSON[h[1]],
+        b',"\\uc6d4\\uc9c0":', JIJANGGAN_JSON[m[1]],
+        b',"\\uc77c\\uc9c0":', JIJANGGAN_JSON[d[1]],
+        b'},"ohaeng":', dumps(chart.ohaeng),
+        b',"pillars":{"day":', PILLAR_JSON[d], b',"hour":', PILLAR_JSON[h],
+        b',"month":', PILLAR_JSON[m], b',"year":', PILLAR_JSON[y],
+        b'},"relations":', dumps(chart.relations),
+        b',"sinsal":', dumps(chart.sinsal),
+        b',"sipsin":{"day_gan":', DAY_GAN_SIPSIN_JSON,
+        b',"day_ji":', SIPSIN_JSON[SIPSIN_JI_TABLE[ilgan][d[1]]],
+        b',"hour_gan":', SIPSIN_JSON[SIPSIN_TABLE[ilgan][h[0]]],
+        b',"hour_ji":', SIPSIN_JSON[SIPSIN_JI_TABLE[ilgan][h[1]]],
+        b',"month_gan":', SIPSIN_JSON[SIPSIN_TABLE[ilgan][m[0]]],
+        b',"month_ji":', SIPSIN_JSON[SIPSIN_JI_TABLE[ilgan][m[1]]],
+        b',"year_gan":', SIPSIN_JSON[SIPSIN_TABLE[ilgan][y[0]]],
+        b',"year_ji":', SIPSIN_JSON[SIPSIN_JI_TABLE[ilgan][y[1]]],
+        b'},"yongsin":', dumps(chart.yongsin),
+        b',"zodiac":', ZODIAC_JSON[chart.year_ji],
+        b'}\n',
+    ))
+    return head, tail
+
+
+def _render_input(chart):
+    is_lunar = chart.is_lunar
+    return b'{"day":%d,"gender":%s,"hour":%d,"hour_name":%s,"is_lunar":%s,"lunar_info":%s,"month":%d,"year":%d}' % (
+        chart.day, dumps(chart.gender), chart.hour, HOUR_NAME_JSON[chart.hour_ji],
+        BOOL_JSON[is_lunar] if isinstance(is_lunar, bool) else dumps(is_lunar),
+        dumps(chart.lunar_info), chart.month, chart.year,
+    )
+
+
+def encode_chart(chart, chart_id=None):
+    """
+    SajuChart → API 응답 바이트 (jsonify(chart.to_dict()) 본문과 동일)
+    chart_id 가 있으면 첫 키로 추가 (정렬 순서상 current_year 앞)
+    """
+    head, tail = CHART_JSON_CACHE.get_or_compute(chart.cache_key, lambda: _render_body(chart))
+    if chart_id is not None:
+        head = b'{"chart_id":' + dumps(chart_id) + b',' + head[1:]
+    return head + _render_input(chart) + tail
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""
+명식 핸들(chart_id) 저장소
+- AI 해석 요청(/api/saju/full, detail, 스트리밍)이 명식과 정규 프롬프트를 저장하고 chart_id 를 돌려줌
+  → 다음 요청은 생년월일 대신 chart_id 만 보내면 명식 계산·프롬프트 조립을 건너뜀
+- /api/saju 는 chart_id 만 계산해 돌려주고 저장하지 않음 (명식만 보는 빠른 경로에서 DB 쓰기 제외)
+- chart_id 는 입력값 + 기준 연도의 HMAC (같은 입력이면 같은 id, 저장은 갱신)
+  키는 CHART_ID_SECRET, 없으면 처음 쓴 워커가 만들어 DB 에 둔 무작위 키 → 생년월일로 id 를 추측할 수 없음
+- 기준 연도도 입력값과 함께 저장 → 다른 워커가 다시 계산해도 저장할 때와 같은 세운·프롬프트
+- 워커 간 공유: SQLite(WAL) 에 입력값 JSON 과 프롬프트 텍스트를 보관하고,
+  프로세스 안에서는 LRU 에 (명식, 프롬프트) 객체를 그대로 둠
+- 저장(또는 다른 워커의 조회) 후 CHART_STORE_TTL 초가 지나면 만료
+- DB 오류 시에는 저장을 건너뛰고 조회는 None (클라이언트가 생년월일로 다시 요청)
+"""
+
+import hashlib
+import hmac
+import json
+import os
+import secrets
+import sqlite3
+import threading
+import time
+
+from memo import LRUCache
+
+CHART_STORE_PATH = os.environ.get(
+    'CHART_STORE_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'chart_store.sqlite3'))
+CHART_STORE_TTL = float(os.environ.get('CHART_STORE_TTL', 86400))
+CHART_STORE_LOCAL_SIZE = 1024   # 프로세스 내 LRU 크기
+CHART_ID_SECRET = os.environ.get('CHART_ID_SECRET', '')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS charts (
+    id TEXT PRIMARY KEY,
+    input TEXT NOT NULL,
+    prompt TEXT NOT NULL,
+    expires REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS charts_expires ON charts (expires);
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# get_saju_chart 인자 순서 (입력값 JSON 의 키)
+INPUT_FIELDS = ('year', 'month', 'day', 'hour', 'gender', 'is_lunar', 'is_leap_month')
+
+
+def chart_input(chart):
+    """명식을 다시 계산할 입력값 dict"""
+    return {name: getattr(chart, name) for name in INPUT_FIELDS}
+
+
+class ChartStore:
+    """chart_id → (명식, 프롬프트) - 프로세스 내 LRU + 워커 공유 SQLite"""
+
+    def __init__(self, path=CHART_STORE_PATH, ttl=CHART_STORE_TTL, local_size=CHART_STORE_LOCAL_SIZE,
+                 secret=CHART_ID_SECRET):
+        self.path = path
+        self.ttl = ttl
+        self.local = LRUCache(maxsize=local_size, ttl=ttl)
+        self._local = threading.local()
+        self._secret = secret.encode() if secret else None
+
+    def _connect(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+        conn = sqlite3.connect(self.path, timeout=5, isolation_level=None, check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.executescript(_SCHEMA)
+        self._local.conn, self._local.pid = conn, os.getpid()
+        return conn
+
+    def secret(self):
+        """chart_id 서명 키 (설정이 없으면 워커들이 DB 에서 공유하는 무작위 키, DB 오류면 이 프로세스만의 키)"""
+        if self._secret is None:
+            try:
+                conn = self._connect()
+                conn.execute('INSERT OR IGNORE INTO meta (name, value) VALUES (?, ?)',
+                             ('chart_id_secret', secrets.token_hex(32)))
+                value = conn.execute("SELECT value FROM meta WHERE name = 'chart_id_secret'").fetchone()[0]
+            except sqlite3.Error as e:
+                print(f"[명식 저장소] 키 조회 오류: {e}")
+                value = secrets.token_hex(32)
+            self._secret = value.encode()
+        return self._secret
+
+    def chart_id(self, chart):
+        # 기준 연도가 바뀌면 세운·프롬프트가 달라지므로 id 도 달라짐
+        message = json.dumps(chart_input(chart), sort_keys=True) + f'|{chart.current_year}'
+        return hmac.new(self.secret(), message.encode(), hashlib.sha256).hexdigest()[:32]
+
+    def put(self, chart, build_prompt):
+        """
+        명식 저장 → (chart_id, 프롬프트)
+        이 프로세스에서 이미 저장한 id 면 프롬프트 조립(build_prompt)과 DB 쓰기를 생략
+        """
+        chart_id = self.chart_id(chart)
+        entry = self.local.get(chart_id)
+        if entry is not None:
+            return chart_id, entry[1]
+        prompt = build_prompt(chart)
+        self.local.put(chart_id, (chart, prompt))
+        try:
+            conn = self._connect()
+            now = time.time()
+            conn.execute('INSERT OR REPLACE INTO charts (id, input, prompt, expires) VALUES (?, ?, ?, ?)',
+                         (chart_id, json.dumps(dict(chart_input(chart), as_of=chart.current_year), ensure_ascii=False),
+                          prompt, now + self.ttl))
+            conn.execute('DELETE FROM charts WHERE expires < ?', (now,))
+        except sqlite3.Error as e:
+            print(f"[명식 저장소] 저장 오류: {e}")
+        return chart_id, prompt
+
+    def get(self, chart_id, build_chart):
+        """
+        chart_id → (명식, 프롬프트), 없거나 만료면 None
+        다른 워커가 저장한 id 는 입력값으로 build_chart(**입력값, as_of=기준 연도) 호출 (명식 캐시 적중이면 즉시)
+        """
+        entry = self.local.get(chart_id)
+        if entry is not None:
+            return entry
+        try:
+            conn = self._connect()
+            now = time.time()
+            row = conn.execute('SELECT input, prompt FROM charts WHERE id = ? AND expires >= ?',
+                               (chart_id, now)).fetchone()
+            if row is None:
+                return None
+            conn.execute('UPDATE charts SET expires = ? WHERE id = ?', (now + self.ttl, chart_id))
+        except sqlite3.Error as e:
+            print(f"[명식 저장소] 조회 오류: {e}")
+            return None
+        entry = (build_chart(**json.loads(row[0])), row[1])
+        self.local.put(chart_id, entry)
+        return entry
+
+    def stats(self):
+        try:
+            size = self._connect().execute('SELECT COUNT(*) FROM charts WHERE expires >= ?',
+                                           (time.time(),)).fetchone()[0]
+        except sqlite3.Error as e:
+            return {'error': str(e)}
+        return {'size': size, 'ttl': self.ttl, 'local': self.local.stats()}
+
+
+CHART_STORE = ChartStore()
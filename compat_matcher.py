@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+궁합(宮合) 매칭 엔진
+- 한 사람의 사주를 수만~수십만 명의 사주 풀과 비교해 궁합 상위 k명을 찾음
+- 풀은 saju_batch 결과(정수 코드 구조화 배열)를 그대로 색인으로 사용
+- 점수: 천간합 + 지지육합 + 삼합 - 지지충 + 오행 보완 + 용신 상호 보완
+"""
+
+import numpy as np
+
+from saju_engine import (
+    GAN_REL, JI_REL, SAMHAP_MASKS, REL_HAP, REL_YUKHAP, REL_CHUNG,
+)
+from saju_batch import SAJU_BATCH_DTYPE
+
+# 점수 가중치
+COMPAT_WEIGHTS = {
+    'gan_hap': 1.0,         # 천간합 (4×4 쌍)
+    'day_gan_hap': 2.0,     # 일간끼리의 합 (가산)
+    'ji_yukhap': 1.0,       # 지지육합 (4×4 쌍)
+    'samhap': 2.0,          # 두 사람의 지지가 합쳐져야 완성되는 삼합
+    'ji_chung': -1.5,       # 지지충 (4×4 쌍)
+    'ohaeng_balance': 0.5,  # 두 사람 오행 합계의 균형 (치우칠수록 감점)
+    'yongsin': 1.0,         # 상대 원국에 내 용신 오행이 있는 개수 (양방향)
+}
+
+_GAN_HAP = (np.array(GAN_REL, dtype=np.uint8) & REL_HAP) > 0
+_JI_YUKHAP = (np.array(JI_REL, dtype=np.uint8) & REL_YUKHAP) > 0
+_JI_CHUNG = (np.array(JI_REL, dtype=np.uint8) & REL_CHUNG) > 0
+_SAMHAP = np.array([mask for mask, _ in SAMHAP_MASKS], dtype=np.uint16)
+
+
+class CompatPool:
+    """궁합 검색용 사주 풀 색인 (saju_batch 결과 배열로 생성)"""
+
+    def __init__(self, charts, ids=None, genders=None):
+        charts = np.asarray(charts)
+        if charts.dtype != SAJU_BATCH_DTYPE:
+            raise ValueError('saju_batch.analyze_saju_batch 결과 배열이어야 합니다.')
+        self.size = len(charts)
+        self.ids = np.asarray(ids) if ids is not None else np.arange(self.size)
+        self.male = None if genders is None else np.asarray(genders) == '남'
+
+        self.gan = np.ascontiguousarray(charts['gan'], dtype=np.intp)
+        self.ji = np.ascontiguousarray(charts['ji'], dtype=np.intp)
+        self.day_gan = self.gan[:, 2].copy()
+        self.ohaeng = charts['ohaeng'].astype(np.int16)
+        self.yongsin = charts['yongsin'].astype(np.intp)
+        self.ji_bits = np.bitwise_or.reduce(np.left_shift(1, self.ji), axis=1).astype(np.uint16)
+        # 각 사람이 자기 원국만으로 이미 완성한 삼합 (상대 덕분에 완성되는 것만 가산)
+        self.own_samhap = (self.ji_bits[:, None] & _SAMHAP) == _SAMHAP
+
+    def score(self, chart, weights=COMPAT_WEIGHTS):
+        """chart(SajuChart) 와 풀 전체의 궁합 점수 및 항목별 값"""
+        q_gan, q_ji = np.array(chart.gans), np.array(chart.jis)
+        q_ohaeng = np.array(chart.ohaeng_values, dtype=np.int16)
+        q_yongsin = chart.yongsin['yongsin_idx']
+
+        # 질의 쪽 4글자를 미리 합산한 행 → 풀 쪽은 한 번의 gather 로 4×4 쌍 개수
+        parts = {
+            'gan_hap': _GAN_HAP[q_gan].sum(axis=0)[self.gan].sum(axis=1),
+            'day_gan_hap': _GAN_HAP[chart.day_gan][self.day_gan].astype(np.int16),
+            'ji_yukhap': _JI_YUKHAP[q_ji].sum(axis=0)[self.ji].sum(axis=1),
+            'ji_chung': _JI_CHUNG[q_ji].sum(axis=0)[self.ji].sum(axis=1),
+        }
+
+        q_bits = np.uint16(sum(1 << int(j) for j in set(chart.jis)))
+        union = self.ji_bits | q_bits
+        q_own = (q_bits & _SAMHAP) == _SAMHAP
+        parts['samhap'] = (((union[:, None] & _SAMHAP) == _SAMHAP) & ~self.own_samhap & ~q_own).sum(axis=1)
+
+        # 16글자 합계가 오행별 평균(3.2)에서 벗어난 정도
+        parts['ohaeng_balance'] = -np.abs((self.ohaeng + q_ohaeng) - 3.2).sum(axis=1)
+        parts['yongsin'] = self.ohaeng[:, q_yongsin] + q_ohaeng[self.yongsin]
+
+        total = np.zeros(self.size, dtype=np.float64)
+        for key, value in parts.items():
+            total += weights[key] * value
+        return total, parts
+
+    def top_k(self, chart, k=10, gender=None, exclude=None, weights=COMPAT_WEIGHTS):
+        """
+        궁합 점수 상위 k명
+
+        Args:
+            chart: 기준 SajuChart
+            gender: '남'/'여' 로 풀 성별 제한 (풀 생성 시 genders 필요)
+            exclude: 제외할 id 목록 (본인 등)
+        """
+        total, parts = self.score(chart, weights)
+        if gender is not None:
+            if self.male is None:
+                raise ValueError('성별 필터를 쓰려면 풀 생성 시 genders 를 넘겨야 합니다.')
+            total[self.male != (gender == '남')] = -np.inf
+        if exclude is not None:
+            total[np.isin(self.ids, exclude)] = -np.inf
+
+        k = min(k, self.size)
+        top = np.argpartition(-total, k - 1)[:k] if k < self.size else np.arange(self.size)
+        top = top[np.argsort(-total[top], kind='stable')]
+        top = top[np.isfinite(total[top])]
+        return [{
+            'id': self.ids[i].item(),
+            'score': round(float(total[i]), 3),
+            **{key: round(float(value[i]), 3) for key, value in parts.items()},
+        } for i in top]
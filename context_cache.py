@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+Gemini 컨텍스트 캐시 핸들 레지스트리 (시스템 프롬프트 cachedContent, 워커 간 공유)
+- 모델마다 시스템 프롬프트를 cachedContents 로 한 번 올리고 핸들 이름·만료 시각을 SQLite 에 기록
+  → 모든 워커가 같은 핸들로 generateContent 호출 (system_instruction 대신 cachedContent)
+- 만료 refresh 초 전부터 '갱신 필요' → 임대를 얻은 한 곳만 갱신(연장 또는 새로 생성),
+  그동안 다른 호출은 기존 핸들이나 인라인 프롬프트를 그대로 사용
+- 생성이 거절되면(무료 티어, 최소 토큰 수 미달 등) retry 초 동안은 인라인으로만
+- 핸들은 프롬프트 지문과 함께 저장 → 배포로 시스템 프롬프트가 바뀌면 새로 생성
+- DB 오류 시에는 핸들 없음(인라인)으로 취급
+"""
+
+import os
+import sqlite3
+import threading
+import time
+
+CONTEXT_CACHE_PATH = os.environ.get(
+    'CONTEXT_CACHE_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'context_cache.sqlite3'))
+CONTEXT_CACHE_TTL = int(os.environ.get('GEMINI_CONTEXT_CACHE_TTL', 3600))   # 핸들 수명 (초)
+CONTEXT_CACHE_REFRESH = 300     # 만료 이 시간 전부터 갱신 (초)
+CONTEXT_CACHE_RETRY = 3600      # 생성이 거절된 모델은 이 시간 동안 인라인으로만 (초)
+CONTEXT_CACHE_LEASE = 60        # 갱신 임대 (갱신하던 워커가 죽으면 다른 곳이 이어받음, 초)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS handles (
+    model TEXT PRIMARY KEY,
+    name TEXT,
+    prompt_fp TEXT,
+    expires REAL NOT NULL DEFAULT 0,
+    lease_until REAL NOT NULL DEFAULT 0,
+    disabled_until REAL NOT NULL DEFAULT 0,
+    error TEXT
+);
+"""
+
+
+class ContextCacheRegistry:
+    """모델 → cachedContent 핸들 (생성·연장 HTTP 호출은 ai_interpreter 가 담당)"""
+
+    def __init__(self, path=CONTEXT_CACHE_PATH, ttl=CONTEXT_CACHE_TTL, refresh=CONTEXT_CACHE_REFRESH,
+                 retry=CONTEXT_CACHE_RETRY):
+        self.path = path
+        self.ttl = ttl
+        self.refresh = refresh
+        self.retry = retry
+        self._local = threading.local()
+
+    def _connect(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+        conn = sqlite3.connect(self.path, timeout=5, isolation_level=None, check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.executescript(_SCHEMA)
+        self._local.conn, self._local.pid = conn, os.getpid()
+        return conn
+
+    def _row(self, conn, model):
+        return conn.execute('SELECT name, prompt_fp, expires, lease_until, disabled_until FROM handles '
+                            'WHERE model = ?', (model,)).fetchone()
+
+    def _state(self, row, prompt_fp, now):
+        """(사용할 핸들 또는 None, 갱신이 필요한지)"""
+        if row is None:
+            return None, True
+        name, fp, expires, lease_until, disabled_until = row
+        usable = name if name and fp == prompt_fp and expires > now else None
+        stale = usable is None or expires - now < self.refresh
+        return usable, stale and disabled_until <= now and lease_until <= now
+
+    def lookup(self, model, prompt_fp):
+        """→ (핸들 이름 또는 None, 갱신을 시작해야 하는지)"""
+        try:
+            return self._state(self._row(self._connect(), model), prompt_fp, time.time())
+        except sqlite3.Error as e:
+            print(f"[컨텍스트 캐시] 조회 오류: {e}")
+            return None, False
+
+    def claim(self, model, prompt_fp):
+        """갱신 임대 획득 → 연장할 기존 핸들 이름('' 이면 새로 생성), 다른 곳이 갱신 중이면 None"""
+        try:
+            conn = self._connect()
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                now = time.time()
+                row = self._row(conn, model)
+                usable, stale = self._state(row, prompt_fp, now)
+                if not stale:
+                    conn.execute('COMMIT')
+                    return None
+                conn.execute('INSERT OR IGNORE INTO handles (model) VALUES (?)', (model,))
+                conn.execute('UPDATE handles SET lease_until = ? WHERE model = ?',
+                             (now + CONTEXT_CACHE_LEASE, model))
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+            return usable or ''
+        except sqlite3.Error as e:
+            print(f"[컨텍스트 캐시] 임대 오류: {e}")
+            return None
+
+    def store(self, model, name, prompt_fp):
+        """새로 만들었거나 연장한 핸들 기록 (임대 해제)"""
+        try:
+            self._connect().execute(
+                'UPDATE handles SET name = ?, prompt_fp = ?, expires = ?, lease_until = 0, error = NULL '
+                'WHERE model = ?', (name, prompt_fp, time.time() + self.ttl, model))
+        except sqlite3.Error as e:
+            print(f"[컨텍스트 캐시] 기록 오류: {e}")
+
+    def fail(self, model, error):
+        """생성 거절 → retry 초 동안 인라인으로만 (임대 해제)"""
+        try:
+            self._connect().execute(
+                'UPDATE handles SET name = NULL, lease_until = 0, disabled_until = ?, error = ? WHERE model = ?',
+                (time.time() + self.retry, error[:200], model))
+        except sqlite3.Error as e:
+            print(f"[컨텍스트 캐시] 기록 오류: {e}")
+
+    def invalidate(self, model, name):
+        """서버가 핸들을 거절함 (만료·삭제) → 다음 호출에서 새로 생성"""
+        try:
+            self._connect().execute('UPDATE handles SET name = NULL, expires = 0 WHERE model = ? AND name = ?',
+                                    (model, name))
+        except sqlite3.Error as e:
+            print(f"[컨텍스트 캐시] 기록 오류: {e}")
+
+    def stats(self, models):
+        try:
+            rows = {r[0]: r[1:] for r in self._connect().execute(
+                'SELECT model, name, expires, disabled_until, error FROM handles')}
+        except sqlite3.Error as e:
+            return {'error': str(e)}
+        now = time.time()
+        result = {}
+        for model in models:
+            name, expires, disabled_until, error = rows.get(model, (None, 0, 0, None))
+            result[model] = {
+                'handle': name if name and expires > now else None,
+                'expires_in': round(expires - now) if name and expires > now else 0,
+                'disabled_seconds': round(disabled_until - now) if disabled_until > now else 0,
+                'error': error if disabled_until > now else None,
+            }
+        return result
+
+
+CONTEXT_CACHE = ContextCacheRegistry()
@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+"""
+gunicorn 설정 (Procfile / render.yaml 에서 -c 로 지정)
+- preload_app: 앱·엔진 테이블·만세력 mmap 을 마스터에서 한 번만 로드 → 워커는 fork 로 공유(COW)
+- when_ready: 지연 임포트 모듈을 마스터에 미리 올리고 gc.freeze() 로 공유 페이지 보호
+- post_fork: 워커마다 샘플 요청으로 워밍업 + AI 비동기 작업 스레드 시작
+"""
+
+import gc
+
+timeout = 120
+preload_app = True
+
+
+def when_ready(server):
+    from app import preload_shared
+    preload_shared()
+    # 마스터 객체를 GC 추적에서 제외 → 워커의 GC 가 공유 페이지를 건드려 복사되는 것 방지
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    from app import warm_up
+    import ai_jobs
+    warm_up()
+    ai_jobs.start_workers()
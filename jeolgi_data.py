@@ -0,0 +1,416 @@
+# -*- coding: utf-8 -*-
+"""
+절기(節氣) 입기 시각 테이블 - tools/build_jeolgi_table.py 로 생성 (직접 수정 금지)
+- 1899-12-07 15:32 대설 ~ 2101-01-05 22:06 소한
+- 한국 상용시(Asia/Seoul) 기준, 서기 1년 1월 1일부터의 누적 분
+"""
+
+# JEOL_MINUTES[0] 은 1899년 대설(절 순번 11, 0=소한)
+JEOL_FIRST_YEAR = 1899
+JEOL_FIRST_INDEX = 11
+
+JEOL_MINUTES = (
+    998743172, 998785592, 998828059, 998870930, 998914461, 998958743,
+    999003667, 999048938, 999094159, 999138945, 999183041, 999226388,
+    999269124, 999311541, 999354008, 999396879, 999440412, 999484698,
+    999529625, 999574896, 999620114, 999664898, 999708994, 999752342,
+    999795080, 999837499, 999879966, 999922835, 999966365, 1000010647,
+    1000055568, 1000100834, 1000146050, 1000190834, 1000234933, 1000278286,
+    1000321029, 1000363452, 1000405919, 1000448787, 1000492314, 1000536593,
+    1000581515, 1000626785, 1000672004, 1000716790, 1000760890, 1000804241,
+    1000846983, 1000889405, 1000931872, 1000974740, 1001018267, 1001062547,
+    1001107469, 1001152740, 1001197960, 1001242746, 1001286844, 1001330193,
+    1001372933, 1001415355, 1001457824, 1001500693, 1001544222, 1001588502,
+    1001633422, 1001678688, 1001723905, 1001768690, 1001812788, 1001856138,
+    1001898879, 1001941301, 1001983772, 1002026644, 1002070175, 1002114457,
+    1002159377, 1002204643, 1002249860, 1002294644, 1002338743, 1002382095,
+    1002424837, 1002467259, 1002509727, 1002552595, 1002596123, 1002640402,
+    1002685321, 1002730587, 1002775804, 1002820590, 1002864691, 1002908044,
+    1002950787, 1002993209, 1003035675, 1003078541, 1003122070, 1003166349,
+    1003211269, 1003256538, 1003301757, 1003346542, 1003390641, 1003433992,
+    1003476734, 1003519155, 1003561623, 1003604491, 1003648020, 1003692301,
+    1003737224, 1003782494, 1003827713, 1003872497, 1003916593, 1003959943,
+    1004002685, 1004045108, 1004087577, 1004130447, 1004173973, 1004218250,
+    1004263167, 1004308431, 1004353647, 1004398432, 1004442531, 1004485883,
+    1004528627, 1004571051, 1004613520, 1004656389, 1004699915, 1004744190,
+    1004789108, 1004834375, 1004879595, 1004924383, 1004968485, 1005011837,
+    1005054578, 1005097027, 1005139493, 1005182361, 1005225888, 1005270167,
+    1005315088, 1005360357, 1005405577, 1005450366, 1005494467, 1005537819,
+    1005580559, 1005622978, 1005665443, 1005708309, 1005751836, 1005796115,
+    1005841034, 1005886299, 1005931516, 1005976303, 1006020404, 1006063758,
+    1006106501, 1006148923, 1006191389, 1006234256, 1006277782, 1006322060,
+    1006366980, 1006412247, 1006457465, 1006502253, 1006546355, 1006589711,
+    1006632457, 1006674880, 1006717345, 1006760208, 1006803729, 1006848003,
+    1006892920, 1006938188, 1006983408, 1007028197, 1007072301, 1007115658,
+    1007158404, 1007200828, 1007243294, 1007286157, 1007329678, 1007373950,
+    1007418866, 1007464134, 1007509355, 1007554145, 1007598248, 1007641602,
+    1007684346, 1007726769, 1007769238, 1007812105, 1007855630, 1007899906,
+    1007944823, 1007990090, 1008035310, 1008080100, 1008124202, 1008167557,
+    1008210301, 1008252724, 1008295193, 1008338061, 1008381585, 1008425858,
+    1008470771, 1008516032, 1008561248, 1008606036, 1008650140, 1008693499,
+    1008736246, 1008778671, 1008821139, 1008864005, 1008907529, 1008951802,
+    1008996717, 1009041981, 1009087198, 1009131988, 1009176093, 1009219452,
+    1009262198, 1009304621, 1009347086, 1009389951, 1009433475, 1009477751,
+    1009522671, 1009567939, 1009613158, 1009657947, 1009702049, 1009745405,
+    1009788150, 1009830574, 1009873040, 1009915905, 1009959429, 1010003704,
+    1010048622, 1010093887, 1010139104, 1010183890, 1010227991, 1010271345,
+    1010314091, 1010356517, 1010398986, 1010441854, 1010485378, 1010529653,
+    1010574571, 1010619838, 1010665057, 1010709846, 1010753949, 1010797305,
+    1010840051, 1010882474, 1010924940, 1010967804, 1011011326, 1011055598,
+    1011100515, 1011145782, 1011191005, 1011235797, 1011279903, 1011323260,
+    1011366004, 1011408425, 1011450890, 1011493752, 1011537273, 1011581546,
+    1011626462, 1011671730, 1011716952, 1011761746, 1011805852, 1011849209,
+    1011891953, 1011934373, 1011976837, 1012019700, 1012063223, 1012107498,
+    1012152417, 1012197685, 1012242907, 1012287700, 1012331807, 1012375166,
+    1012417912, 1012460334, 1012502798, 1012545660, 1012589178, 1012633448,
+    1012678362, 1012723626, 1012768844, 1012813636, 1012857745, 1012901108,
+    1012943859, 1012986285, 1013028750, 1013071610, 1013115126, 1013159393,
+    1013204305, 1013249570, 1013294792, 1013339586, 1013383695, 1013427057,
+    1013469806, 1013512231, 1013554696, 1013597557, 1013641075, 1013685344,
+    1013730257, 1013775525, 1013820748, 1013865542, 1013909650, 1013953010,
+    1013995757, 1014038182, 1014080649, 1014123512, 1014167031, 1014211300,
+    1014256211, 1014301472, 1014346689, 1014391480, 1014435587, 1014478947,
+    1014521696, 1014564122, 1014606591, 1014649457, 1014692977, 1014737247,
+    1014782158, 1014827420, 1014872637, 1014917429, 1014961538, 1015004900,
+    1015047651, 1015090076, 1015132541, 1015175402, 1015218920, 1015263190,
+    1015308102, 1015353366, 1015398585, 1015443377, 1015487487, 1015530850,
+    1015573600, 1015616025, 1015658489, 1015701349, 1015744866, 1015789135,
+    1015834048, 1015879312, 1015924532, 1015969323, 1016013430, 1016056790,
+    1016099538, 1016141963, 1016184429, 1016227291, 1016270811, 1016315082,
+    1016359998, 1016405265, 1016450486, 1016495278, 1016539384, 1016582743,
+    1016625491, 1016667916, 1016710384, 1016753246, 1016796764, 1016841031,
+    1016885942, 1016931205, 1016976424, 1017021216, 1017065325, 1017108687,
+    1017151436, 1017193862, 1017236329, 1017279190, 1017322706, 1017366972,
+    1017411882, 1017457146, 1017502368, 1017547164, 1017591276, 1017634638,
+    1017677385, 1017719807, 1017762269, 1017805129, 1017848647, 1017892917,
+    1017937831, 1017983099, 1018028323, 1018073121, 1018117233, 1018160595,
+    1018203342, 1018245764, 1018288225, 1018331084, 1018374601, 1018418871,
+    1018463783, 1018509046, 1018554266, 1018599060, 1018643171, 1018686535,
+    1018729286, 1018771711, 1018814175, 1018857034, 1018900549, 1018944815,
+    1018989727, 1019034992, 1019080213, 1019125008, 1019169121, 1019212488,
+    1019255242, 1019297668, 1019340130, 1019382986, 1019426497, 1019470761,
+    1019515672, 1019560939, 1019606164, 1019650962, 1019695077, 1019738444,
+    1019781197, 1019823624, 1019866087, 1019908944, 1019952455, 1019996716,
+    1020041624, 1020086888, 1020132112, 1020176909, 1020221022, 1020264387,
+    1020307138, 1020349564, 1020392030, 1020434890, 1020478405, 1020522670,
+    1020567579, 1020612843, 1020658066, 1020702864, 1020746978, 1020790344,
+    1020833096, 1020875522, 1020917988, 1020960849, 1021004364, 1021048627,
+    1021093533, 1021138792, 1021184010, 1021228806, 1021272922, 1021316291,
+    1021359047, 1021401475, 1021443940, 1021486799, 1021530311, 1021574573,
+    1021619479, 1021664739, 1021709959, 1021754755, 1021798871, 1021842239,
+    1021884993, 1021927419, 1021969883, 1022012740, 1022056254, 1022100520,
+    1022145431, 1022190696, 1022235919, 1022280716, 1022324829, 1022368195,
+    1022410948, 1022453374, 1022495839, 1022538698, 1022582212, 1022626477,
+    1022671386, 1022716647, 1022761865, 1022806658, 1022850769, 1022894134,
+    1022936888, 1022979316, 1023021784, 1023064645, 1023108159, 1023152422,
+    1023197329, 1023242591, 1023287812, 1023332608, 1023376721, 1023420087,
+    1023462840, 1023505266, 1023547730, 1023590588, 1023634100, 1023678363,
+    1023723271, 1023768536, 1023813761, 1023858561, 1023902677, 1023946044,
+    1023988796, 1024031220, 1024073682, 1024116538, 1024160049, 1024204312,
+    1024249281, 1024294544, 1024339766, 1024384565, 1024428620, 1024471987,
+    1024514738, 1024557161, 1024599623, 1024642479, 1024686052, 1024730317,
+    1024775227, 1024820492, 1024865715, 1024910514, 1024954571, 1024997940,
+    1025040693, 1025083119, 1025125581, 1025168435, 1025212004, 1025256265,
+    1025301171, 1025346433, 1025391655, 1025436454, 1025480512, 1025523884,
+    1025566642, 1025609070, 1025651533, 1025694387, 1025737893, 1025782209,
+    1025827113, 1025872374, 1025917598, 1025962398, 1026006456, 1026049827,
+    1026092582, 1026135010, 1026177473, 1026220327, 1026263835, 1026308094,
+    1026353001, 1026398265, 1026443491, 1026488294, 1026532412, 1026575782,
+    1026618535, 1026660962, 1026703426, 1026746282, 1026789793, 1026834052,
+    1026878956, 1026924215, 1026969435, 1027014233, 1027058350, 1027101721,
+    1027144477, 1027186905, 1027229371, 1027272229, 1027315709, 1027359968,
+    1027404871, 1027450129, 1027495349, 1027540148, 1027584267, 1027627641,
+    1027670398, 1027712826, 1027755288, 1027798141, 1027841649, 1027885968,
+    1027930874, 1027976136, 1028021360, 1028066162, 1028110222, 1028153595,
+    1028196353, 1028238780, 1028281242, 1028324094, 1028367601, 1028411860,
+    1028456826, 1028502088, 1028547310, 1028592109, 1028636166, 1028679536,
+    1028722292, 1028764720, 1028807185, 1028850040, 1028893549, 1028937868,
+    1028982775, 1029028038, 1029073262, 1029118062, 1029162120, 1029205490,
+    1029248246, 1029290674, 1029333139, 1029375995, 1029419502, 1029463819,
+    1029508722, 1029553984, 1029599207, 1029644009, 1029688069, 1029731442,
+    1029774200, 1029816628, 1029859092, 1029901947, 1029945453, 1029989769,
+    1030034670, 1030079930, 1030125154, 1030169958, 1030214020, 1030257392,
+    1030300147, 1030342572, 1030385033, 1030427886, 1030471394, 1030515713,
+    1030560619, 1030605883, 1030651110, 1030695915, 1030739979, 1030783352,
+    1030826108, 1030868532, 1030910992, 1030953845, 1030997352, 1031041611,
+    1031086516, 1031131777, 1031176998, 1031221829, 1031265951, 1031309326,
+    1031352086, 1031394515, 1031436977, 1031479829, 1031523334, 1031567590,
+    1031612491, 1031657751, 1031702974, 1031747775, 1031791898, 1031835275,
+    1031878037, 1031920466, 1031962928, 1032005777, 1032049279, 1032093532,
+    1032138435, 1032183698, 1032228926, 1032273732, 1032317856, 1032361232,
+    1032403993, 1032446422, 1032488885, 1032531736, 1032575238, 1032619491,
+    1032664392, 1032709652, 1032754876, 1032799680, 1032843802, 1032887175,
+    1032929933, 1032972362, 1033014826, 1033057681, 1033101187, 1033145442,
+    1033190342, 1033235602, 1033280825, 1033325628, 1033369751, 1033413127,
+    1033455885, 1033498314, 1033540778, 1033583631, 1033627137, 1033671391,
+    1033716290, 1033761547, 1033806769, 1033851572, 1033895697, 1033939075,
+    1033981838, 1034024268, 1034066731, 1034109582, 1034153085, 1034197338,
+    1034242236, 1034287493, 1034332715, 1034377518, 1034421641, 1034465017,
+    1034507777, 1034550206, 1034592667, 1034635518, 1034679021, 1034723276,
+    1034768179, 1034813442, 1034858667, 1034903472, 1034947594, 1034990969,
+    1035033728, 1035076157, 1035118619, 1035161471, 1035204975, 1035249230,
+    1035294132, 1035339392, 1035384614, 1035429415, 1035473537, 1035516911,
+    1035559671, 1035602102, 1035644566, 1035687418, 1035730922, 1035775174,
+    1035820072, 1035865331, 1035910554, 1035955358, 1035999482, 1036042858,
+    1036085617, 1036128045, 1036170505, 1036213355, 1036256856, 1036301108,
+    1036346009, 1036391271, 1036436500, 1036481310, 1036525439, 1036568817,
+    1036611576, 1036654002, 1036696460, 1036739308, 1036782809, 1036827061,
+    1036871962, 1036917223, 1036962449, 1037007255, 1037051382, 1037094759,
+    1037137519, 1037179945, 1037222404, 1037265253, 1037308754, 1037353006,
+    1037397907, 1037443168, 1037488393, 1037533199, 1037577327, 1037620708,
+    1037663470, 1037705900, 1037748360, 1037791207, 1037834705, 1037878954,
+    1037923852, 1037969111, 1038014337, 1038059145, 1038103275, 1038146658,
+    1038189425, 1038231857, 1038274319, 1038317166, 1038360662, 1038404907,
+    1038449802, 1038495060, 1038540285, 1038585093, 1038629222, 1038672603,
+    1038715366, 1038757797, 1038800259, 1038843108, 1038886606, 1038930855,
+    1038975751, 1039021011, 1039066238, 1039111048, 1039155178, 1039198559,
+    1039241321, 1039283751, 1039326213, 1039369064, 1039412566, 1039456816,
+    1039501712, 1039546968, 1039592190, 1039636996, 1039681124, 1039724506,
+    1039767271, 1039809703, 1039852167, 1039895018, 1039938519, 1039982769,
+    1040027663, 1040072917, 1040118138, 1040162942, 1040207071, 1040250454,
+    1040293220, 1040335651, 1040378112, 1040420960, 1040464458, 1040508707,
+    1040553605, 1040598865, 1040644091, 1040688900, 1040733030, 1040776413,
+    1040819178, 1040861609, 1040904069, 1040946916, 1040990415, 1041034665,
+    1041079564, 1041124824, 1041170049, 1041214854, 1041258979, 1041302358,
+    1041345121, 1041387553, 1041430015, 1041472865, 1041516365, 1041560615,
+    1041605513, 1041650772, 1041695997, 1041740803, 1041784930, 1041828308,
+    1041871071, 1041913502, 1041955965, 1041998815, 1042042313, 1042086560,
+    1042131456, 1042176715, 1042221942, 1042266752, 1042310882, 1042354264,
+    1042397028, 1042439459, 1042481920, 1042524767, 1042568264, 1042612511,
+    1042657406, 1042702663, 1042747890, 1042792700, 1042836831, 1042880212,
+    1042922974, 1042965401, 1043007859, 1043050705, 1043094202, 1043138451,
+    1043183349, 1043228609, 1043273838, 1043318650, 1043362783, 1043406165,
+    1043448928, 1043491355, 1043533812, 1043576656, 1043620154, 1043664403,
+    1043709300, 1043754559, 1043799784, 1043844593, 1043888725, 1043932109,
+    1043974876, 1044017308, 1044059768, 1044102612, 1044146106, 1044190351,
+    1044235245, 1044280501, 1044325726, 1044370535, 1044414667, 1044458053,
+    1044500821, 1044543253, 1044585712, 1044628554, 1044672044, 1044716286,
+    1044761239, 1044806499, 1044851729, 1044896544, 1044940680, 1044984006,
+    1045026772, 1045069203, 1045111663, 1045154507, 1045197999, 1045242242,
+    1045287195, 1045332453, 1045377680, 1045422492, 1045466625, 1045509949,
+    1045552714, 1045595146, 1045637607, 1045680454, 1045723950, 1045768194,
+    1045813085, 1045858340, 1045903564, 1045948374, 1045992507, 1046035893,
+    1046078661, 1046121093, 1046163554, 1046206399, 1046249893, 1046294136,
+    1046339026, 1046384281, 1046429506, 1046474318, 1046518454, 1046561843,
+    1046604614, 1046647048, 1046689508, 1046732352, 1046775845, 1046820087,
+    1046864978, 1046910233, 1046955457, 1047000267, 1047044401, 1047087788,
+    1047130556, 1047172988, 1047215448, 1047258292, 1047301785, 1047346029,
+    1047390922, 1047436180, 1047481408, 1047526218, 1047570351, 1047613737,
+    1047656504, 1047698936, 1047741397, 1047784242, 1047827737, 1047871982,
+    1047916875, 1047962132, 1048007358, 1048052168, 1048096300, 1048139685,
+    1048182454, 1048224888, 1048267351, 1048310198, 1048353692, 1048397934,
+    1048442825, 1048488080, 1048533304, 1048578115, 1048622249, 1048665636,
+    1048708403, 1048750834, 1048793293, 1048836136, 1048879628, 1048923870,
+    1048968763, 1049014021, 1049059252, 1049104069, 1049148207, 1049191595,
+    1049234362, 1049276791, 1049319248, 1049362090, 1049405582, 1049449826,
+    1049494721, 1049539980, 1049585209, 1049630022, 1049674159, 1049717546,
+    1049760314, 1049802744, 1049845202, 1049888044, 1049931536, 1049975780,
+    1050020673, 1050065930, 1050111156, 1050155969, 1050200105, 1050243495,
+    1050286265, 1050328698, 1050371157, 1050413997, 1050457485, 1050501723,
+    1050546614, 1050591871, 1050637100, 1050681916, 1050726056, 1050769448,
+    1050812221, 1050854657, 1050897117, 1050939958, 1050983445, 1051027681,
+    1051072569, 1051117825, 1051163054, 1051207870, 1051252008, 1051295398,
+    1051338167, 1051380601, 1051423060, 1051465903, 1051509392, 1051553630,
+    1051598519, 1051643774, 1051689003, 1051733819, 1051777958, 1051821348,
+    1051864117, 1051906549, 1051949009, 1051991852, 1052035344, 1052079585,
+    1052124474, 1052169727, 1052214952, 1052259766, 1052303905, 1052347297,
+    1052390069, 1052432503, 1052474964, 1052517807, 1052561298, 1052605537,
+    1052650425, 1052695676, 1052740899, 1052785711, 1052829849, 1052873242,
+    1052916014, 1052958448, 1053000905, 1053043745, 1053087233, 1053131471,
+    1053176360, 1053221616, 1053266844, 1053311660, 1053355801, 1053399193,
+    1053441965, 1053484398, 1053526856, 1053569696, 1053613183, 1053657423,
+    1053702314, 1053747571, 1053792800, 1053837613, 1053881749, 1053925138,
+    1053967909, 1054010343, 1054052803, 1054095645, 1054139134, 1054183373,
+    1054228262, 1054273517, 1054318744, 1054363557, 1054407693, 1054451082,
+    1054493853, 1054536287, 1054578747, 1054621589, 1054665075, 1054709311,
+    1054754197, 1054799452, 1054844681, 1054889499, 1054933641, 1054977035,
+    1055019807, 1055062240, 1055104698, 1055147538, 1055191025, 1055235260,
+    1055280147, 1055325402, 1055370631, 1055415450, 1055459591, 1055502984,
+    1055545754, 1055588185, 1055630640, 1055673479, 1055716966, 1055761203,
+    1055806092, 1055851347, 1055896576, 1055941394, 1055985537, 1056028930,
+    1056071702, 1056114134, 1056156590, 1056199427, 1056242914, 1056287151,
+    1056332039, 1056377294, 1056422521, 1056467338, 1056511480, 1056554876,
+    1056597652, 1056640089, 1056682548, 1056725386, 1056768870, 1056813104,
+    1056857990, 1056903243, 1056948469, 1056993285, 1057037426, 1057080822,
+    1057123598, 1057166034, 1057208493, 1057251330, 1057294812, 1057339043,
+    1057383928, 1057429182, 1057474414, 1057519234, 1057563379, 1057606775,
+    1057649549, 1057691984, 1057734442, 1057777281, 1057820766, 1057865000,
+    1057909886, 1057955141, 1058000371, 1058045189, 1058089332, 1058132726,
+    1058175499, 1058217934, 1058260393, 1058303235, 1058346722, 1058390958,
+    1058435843, 1058481095, 1058526320, 1058571136, 1058615278, 1058658674,
+    1058701448, 1058743884, 1058786343, 1058829182, 1058872667, 1058916900,
+    1058961783, 1059007035, 1059052263, 1059097082, 1059141228, 1059184627,
+    1059227404, 1059269840, 1059312298, 1059355136, 1059398619, 1059442853,
+    1059487738, 1059532992, 1059578222, 1059623040, 1059667183, 1059710579,
+    1059753353, 1059795788, 1059838246, 1059881083, 1059924568, 1059968802,
+    1060013689, 1060058944, 1060104173, 1060148991, 1060193133, 1060236528,
+    1060279301, 1060321736, 1060364194, 1060407033, 1060450517, 1060494751,
+    1060539637, 1060584891, 1060630120, 1060674939, 1060719082, 1060762478,
+    1060805253, 1060847689, 1060890148, 1060932988, 1060976473, 1061020705,
+    1061065589, 1061110842, 1061156071, 1061200890, 1061245035, 1061288432,
+    1061331206, 1061373639, 1061416094, 1061458930, 1061502411, 1061546643,
+    1061591527, 1061636781, 1061682013, 1061726837, 1061770986, 1061814384,
+    1061857158, 1061899590, 1061942043, 1061984877, 1062028358, 1062072591,
+    1062117479, 1062162735, 1062207966, 1062252788, 1062296935, 1062340334,
+    1062383109, 1062425543, 1062467999, 1062510834, 1062554315, 1062598547,
+    1062643432, 1062688686, 1062733914, 1062778733, 1062822879, 1062866279,
+    1062909057, 1062951494, 1062993951, 1063036784, 1063080260, 1063124486,
+    1063169366, 1063214618, 1063259849, 1063304672, 1063348822, 1063392225,
+    1063435006, 1063477445, 1063519902, 1063562736, 1063606213, 1063650439,
+    1063695318, 1063740571, 1063785803, 1063830627, 1063874776, 1063918175,
+    1063960953, 1064003389, 1064045847, 1064088683, 1064132162, 1064176390,
+    1064221270, 1064266520, 1064311749, 1064356571, 1064400720, 1064444120,
+    1064486897, 1064529333, 1064571790, 1064614627, 1064658108, 1064702337,
+    1064747217, 1064792465, 1064837692, 1064882512, 1064926661, 1064970064,
+    1065012844, 1065055283, 1065097742, 1065140579, 1065184060, 1065228289,
+    1065273168, 1065318417, 1065363643, 1065408461, 1065452609, 1065496012,
+    1065538792, 1065581230, 1065623686, 1065666519, 1065709997, 1065754225,
+    1065799106, 1065844357, 1065889587, 1065934408, 1065978557, 1066021958,
+    1066064737, 1066107174, 1066149631, 1066192465, 1066235943, 1066280172,
+    1066325056, 1066370310, 1066415541, 1066460362, 1066504508, 1066547907,
+    1066590684, 1066633122, 1066675580, 1066718417, 1066761898, 1066806128,
+    1066851010, 1066896262, 1066941492, 1066986312, 1067030458, 1067073857,
+    1067116634, 1067159070, 1067201528, 1067244363, 1067287841, 1067332066,
+    1067376944, 1067422195, 1067467427, 1067512253, 1067556405, 1067599808,
+    1067642587, 1067685023, 1067727478, 1067770311, 1067813788, 1067858015,
+    1067902896, 1067948149, 1067993383, 1068038210, 1068082363, 1068125765,
+    1068168543, 1068210976, 1068253429, 1068296260, 1068339737, 1068383966,
+    1068428848, 1068474101, 1068519333, 1068564158, 1068608310, 1068651714,
+    1068694493, 1068736928, 1068779381, 1068822212, 1068865688, 1068909914,
+    1068954793, 1069000045, 1069045276, 1069090100, 1069134254, 1069177661,
+    1069220445, 1069262884, 1069305341, 1069348172, 1069391646, 1069435869,
+    1069480747, 1069525998, 1069571229, 1069616054, 1069660207, 1069703613,
+    1069746396, 1069788835, 1069831291, 1069874121, 1069917594, 1069961815,
+    1070006691, 1070051941, 1070097174, 1070142002, 1070186157, 1070229564,
+    1070272345, 1070314783, 1070357239, 1070400071, 1070443546, 1070487769,
+    1070532647, 1070577897, 1070623129, 1070667955, 1070712109, 1070755514,
+    1070798296, 1070840734, 1070883191, 1070926026, 1070969504, 1071013729,
+    1071058607, 1071103855, 1071149083, 1071193905, 1071238057, 1071281464,
+    1071324247, 1071366686, 1071409143, 1071451975, 1071495449, 1071539671,
+    1071584545, 1071629792, 1071675021, 1071719846, 1071764001, 1071807410,
+    1071850196, 1071892636, 1071935092, 1071977923, 1072021395, 1072065618,
+    1072110495, 1072155746, 1072200978, 1072245804, 1072289957, 1072333362,
+    1072376145, 1072418583, 1072461039, 1072503871, 1072547345, 1072591569,
+    1072636448, 1072681699, 1072726930, 1072771754, 1072815905, 1072859309,
+    1072902090, 1072944528, 1072986985, 1073029817, 1073073292, 1073117514,
+    1073162390, 1073207638, 1073252868, 1073297693, 1073341847, 1073385253,
+    1073428035, 1073470475, 1073512932, 1073555765, 1073599240, 1073643463,
+    1073688338, 1073733587, 1073778819, 1073823645, 1073867800, 1073911207,
+    1073953989, 1073996425, 1074038878, 1074081707, 1074125180, 1074169402,
+    1074214278, 1074259528, 1074304760, 1074349590, 1074393747, 1074437155,
+    1074479937, 1074522372, 1074564824, 1074607651, 1074651123, 1074695345,
+    1074740224, 1074785476, 1074830708, 1074875536, 1074919693, 1074963101,
+    1075005885, 1075048322, 1075090776, 1075133605, 1075177077, 1075221299,
+    1075266177, 1075311428, 1075356659, 1075401485, 1075445640, 1075489049,
+    1075531835, 1075574275, 1075616730, 1075659557, 1075703024, 1075747240,
+    1075792112, 1075837360, 1075882593, 1075927423, 1075971582, 1076014994,
+    1076057781, 1076100222, 1076142677, 1076185505, 1076228972, 1076273188,
+    1076318061, 1076363310, 1076408546, 1076453378, 1076497537, 1076540947,
+    1076583730, 1076626169, 1076668624, 1076711454, 1076754925, 1076799144,
+    1076844018, 1076889266, 1076934498, 1076979328, 1077023486, 1077066896,
+    1077109680, 1077152118, 1077194573, 1077237402, 1077280874, 1077325092,
+    1077369963, 1077415208, 1077460438, 1077505265, 1077549424, 1077592838,
+    1077635626, 1077678067, 1077720523, 1077763352, 1077806823, 1077851041,
+    1077895914, 1077941161, 1077986392, 1078031220, 1078075380, 1078118793,
+    1078161581, 1078204021, 1078246475, 1078289301, 1078332769, 1078376987,
+    1078421860, 1078467109, 1078512341, 1078557171, 1078601330, 1078644742,
+    1078687528, 1078729968, 1078772422, 1078815249, 1078858717, 1078902934,
+    1078947809, 1078993060, 1079038293, 1079083122, 1079127279, 1079170689,
+    1079213475, 1079255915, 1079298372, 1079341203, 1079384674, 1079428893,
+    1079473767, 1079519017, 1079564250, 1079609078, 1079653236, 1079696646,
+    1079739431, 1079781872, 1079824327, 1079867155, 1079910622, 1079954837,
+    1079999707, 1080044953, 1080090187, 1080135019, 1080179182, 1080222596,
+    1080265383, 1080307822, 1080350275, 1080393101, 1080436568, 1080480783,
+    1080525655, 1080570905, 1080616141, 1080660975, 1080705138, 1080748552,
+    1080791338, 1080833775, 1080876226, 1080919051, 1080962519, 1081006737,
+    1081051612, 1081096862, 1081142096, 1081186927, 1081231089, 1081274503,
+    1081317290, 1081359729, 1081402182, 1081445006, 1081488472, 1081532686,
+    1081577556, 1081622802, 1081668033, 1081712864, 1081757026, 1081800442,
+    1081843234, 1081885678, 1081928134, 1081970959, 1082014423, 1082058635,
+    1082103504, 1082148751, 1082193985, 1082238817, 1082282981, 1082326396,
+    1082369186, 1082411628, 1082454083, 1082496908, 1082540372, 1082584583,
+    1082629452, 1082674698, 1082719932, 1082764766, 1082808930, 1082852345,
+    1082895133, 1082937573, 1082980027, 1083022853, 1083066319, 1083110532,
+    1083155401, 1083200647, 1083245879, 1083290710, 1083334873, 1083378288,
+    1083421077, 1083463518, 1083505973, 1083548801, 1083592270, 1083636486,
+    1083681356, 1083726602, 1083771832, 1083816662, 1083860824, 1083904239,
+    1083947030, 1083989472, 1084031926, 1084074751, 1084118215, 1084162427,
+    1084207294, 1084252538, 1084297768, 1084342600, 1084386764, 1084430182,
+    1084472974, 1084515416, 1084557870, 1084600694, 1084644156, 1084688368,
+    1084733237, 1084778485, 1084823720, 1084868553, 1084912716, 1084956131,
+    1084998920, 1085041361, 1085083814, 1085126639, 1085170104, 1085214318,
+    1085259190, 1085304439, 1085349674, 1085394506, 1085438667, 1085482081,
+    1085524869, 1085567309, 1085609763, 1085652588, 1085696053, 1085740265,
+    1085785132, 1085830376, 1085875609, 1085920441, 1085964605, 1086008022,
+    1086050812, 1086093254, 1086135709, 1086178533, 1086221997, 1086266208,
+    1086311075, 1086356321, 1086401556, 1086446393, 1086490560, 1086533979,
+    1086576768, 1086619206, 1086661657, 1086704478, 1086747940, 1086792152,
+    1086837021, 1086882269, 1086927505, 1086972342, 1087016510, 1087059930,
+    1087102720, 1087145159, 1087187608, 1087230428, 1087273889, 1087318100,
+    1087362969, 1087408216, 1087453451, 1087498285, 1087542452, 1087585873,
+    1087628665, 1087671108, 1087713560, 1087756382, 1087799843, 1087844054,
+    1087888923, 1087934170, 1087979405, 1088024240, 1088068406, 1088111827,
+    1088154622, 1088197067, 1088239521, 1088282342, 1088325799, 1088370004,
+    1088414867, 1088460112, 1088505346, 1088550183, 1088594353, 1088637775,
+    1088680570, 1088723015, 1088765470, 1088808292, 1088851750, 1088895955,
+    1088940817, 1088986062, 1089031299, 1089076137, 1089120307, 1089163728,
+    1089206520, 1089248962, 1089291416, 1089334240, 1089377703, 1089421913,
+    1089466779, 1089512025, 1089557259, 1089602094, 1089646263, 1089689683,
+    1089732476, 1089774918, 1089817372, 1089860196, 1089903659, 1089947867,
+    1089992730, 1090037970, 1090083200, 1090128033, 1090172201, 1090215623,
+    1090258420, 1090300865, 1090343320, 1090386144, 1090429604, 1090473813,
+    1090518677, 1090563920, 1090609153, 1090653988, 1090698157, 1090741579,
+    1090784374, 1090826817, 1090869270, 1090912091, 1090955550, 1090999759,
+    1091044626, 1091089873, 1091135108, 1091179943, 1091224111, 1091267531,
+    1091310324, 1091352766, 1091395219, 1091438040, 1091481500, 1091525708,
+    1091570574, 1091615820, 1091661054, 1091705888, 1091750054, 1091793473,
+    1091836265, 1091878708, 1091921162, 1091963986, 1092007448, 1092051657,
+    1092096524, 1092141770, 1092187006, 1092231843, 1092276010, 1092319429,
+    1092362222, 1092404664, 1092447117, 1092489937, 1092533395, 1092577601,
+    1092622464, 1092667708, 1092712944, 1092757783, 1092801955, 1092845379,
+    1092888172, 1092930613, 1092973062, 1093015880, 1093059337, 1093103542,
+    1093148405, 1093193651, 1093238889, 1093283730, 1093327903, 1093371326,
+    1093414119, 1093456559, 1093499007, 1093541824, 1093585282, 1093629490,
+    1093674357, 1093719605, 1093764843, 1093809682, 1093853854, 1093897278,
+    1093940073, 1093982515, 1094024965, 1094067782, 1094111236, 1094155439,
+    1094200301, 1094245543, 1094290776, 1094335614, 1094379786, 1094423212,
+    1094466011, 1094508458, 1094550911, 1094593729, 1094637182, 1094681382,
+    1094726242, 1094771485, 1094816721, 1094861562, 1094905737, 1094949163,
+    1094991961, 1095034405, 1095076858, 1095119675, 1095163130, 1095207331,
+    1095252191, 1095297435, 1095342672, 1095387514, 1095431689, 1095475115,
+    1095517911, 1095560354, 1095602806, 1095645624, 1095689080, 1095733282,
+    1095778142, 1095823383, 1095868616, 1095913454, 1095957626, 1096001053,
+    1096043850, 1096086295, 1096128749, 1096171570, 1096215028, 1096259232,
+    1096304094, 1096349336, 1096394569, 1096439407, 1096483580, 1096527007,
+    1096569806, 1096612253, 1096654706, 1096697523, 1096740977, 1096785178,
+    1096830038, 1096875279, 1096920513, 1096965352, 1097009526, 1097052955,
+    1097095755, 1097138202, 1097180654, 1097223471, 1097266924, 1097311124,
+    1097355984, 1097401227, 1097446464, 1097491304, 1097535477, 1097578902,
+    1097621699, 1097664144, 1097706597, 1097749416, 1097792872, 1097837076,
+    1097881939, 1097927185, 1097972423, 1098017263, 1098061436, 1098104860,
+    1098147656, 1098190100, 1098232554, 1098275374, 1098318830, 1098363031,
+    1098407890, 1098453131, 1098498364, 1098543203, 1098587377, 1098630804,
+    1098673602, 1098716048, 1098758501, 1098801321, 1098844775, 1098888976,
+    1098933834, 1098979076, 1099024312, 1099069155, 1099113333, 1099156762,
+    1099199559, 1099242001, 1099284450, 1099327265, 1099370719, 1099414922,
+    1099459785, 1099505030, 1099550269, 1099595113, 1099639291, 1099682720,
+    1099725518, 1099767960, 1099810408, 1099853222, 1099896674, 1099940876,
+    1099985737, 1100030980, 1100076215, 1100121056, 1100165231, 1100208660,
+    1100251460, 1100293906, 1100336358, 1100379174, 1100422625, 1100466826,
+    1100511686, 1100556930, 1100602167, 1100647009, 1100691185, 1100734615,
+    1100777416, 1100819864, 1100862316, 1100905131, 1100948579, 1100992775,
+    1101037631, 1101082873, 1101128111, 1101172955, 1101217135, 1101260566,
+    1101303367, 1101345814, 1101388266, 1101431081, 1101474530, 1101518725,
+    1101563580, 1101608820, 1101654058, 1101698903, 1101743082, 1101786512,
+    1101829311, 1101871755, 1101914206, 1101957022, 1102000475, 1102044675,
+    1102089534, 1102134776, 1102180013, 1102224856, 1102269035, 1102312465,
+    1102355265, 1102397710, 1102440161, 1102482977, 1102526429, 1102570628,
+    1102615483, 1102660721, 1102705952, 1102750792, 1102794970, 1102838403,
+    1102881207, 1102923656, 1102966108, 1103008923, 1103052373, 1103096568,
+    1103141423, 1103186662, 1103231896, 1103276738, 1103320917, 1103364350,
+    1103407152, 1103449598, 1103492049, 1103534862, 1103578311, 1103622508,
+    1103667367, 1103712611, 1103757850, 1103802693, 1103846871, 1103890302,
+    1103933102, 1103975548, 1104017999, 1104060814, 1104104263, 1104148460,
+    1104193317, 1104238558, 1104283793, 1104328635, 1104372810, 1104416239,
+    1104459039, 1104501486,
+)
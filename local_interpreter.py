@@ -0,0 +1,393 @@
+# -*- coding: utf-8 -*-
+"""
+규칙 기반 기본 풀이 (AI 없이 즉시 생성, 1ms 안팎)
+- 명식(SajuChart)의 정수 코드만 보고 표에서 문장을 골라 조립 → 같은 명식이면 항상 같은 글
+- 구성은 SAJU_SYSTEM_PROMPT 의 [해석 구조] 7개 항목과 같음 (## 1. ~ ## 7.)
+- AI 해석을 기다리는 동안 먼저 보여주고, API 키가 없거나 한도 초과 등으로 AI 가 실패하면 그대로 최종 결과
+- 카테고리 상세(love/money/career/health/yearly)는 해당 항목 + 용신 활용 한 줄
+"""
+
+import re
+
+from saju_engine import (
+    CHEONGAN_KR, JIJI_KR, CHEONGAN_OHAENG, JIJI_OHAENG, OHAENG_NAME, OHAENG_KR,
+    SIPSIN_NAME, SIPSIN_TABLE, SIPSIN_JI_TABLE, KE_MAP, pillar_label,
+)
+from luck_timeline import get_interactions
+from memo import LRUCache
+
+# 명식 cache_key → 종합 풀이 (입력값과 무관한 본문만 쓰므로 cache_key 로 충분)
+LOCAL_CACHE = LRUCache(maxsize=1024)
+
+# ============================================================
+# 문장 표
+# ============================================================
+
+# 일간 → (비유, 기질)
+ILGAN_NATURE = [
+    ('하늘로 곧게 뻗는 큰 나무', '곧고 진취적이며 한번 정한 방향은 쉽게 굽히지 않습니다. 앞에 서서 길을 여는 리더십이 있고 자존심이 강한 편입니다.'),
+    ('바람에 휘어도 꺾이지 않는 풀과 덩굴', '유연하고 적응력이 뛰어나며 섬세합니다. 부드러워 보여도 끝까지 버티는 끈기가 있어 주변 환경을 잘 활용합니다.'),
+    ('세상을 비추는 태양', '밝고 열정적이며 솔직합니다. 표현력이 좋아 어디서든 눈에 띄고, 주변에 활기를 불어넣는 사람입니다.'),
+    ('어둠을 밝히는 촛불과 등불', '따뜻하고 세심하며 한 가지에 깊이 집중합니다. 드러내지 않고 사람을 챙기는 헌신적인 면이 있습니다.'),
+    ('묵직하게 자리를 지키는 큰 산', '듬직하고 믿음직스러워 사람들이 기대는 중심이 됩니다. 포용력이 크지만 고집도 그만큼 단단합니다.'),
+    ('곡식을 길러내는 기름진 논밭', '실속 있고 현실감각이 좋으며 주변을 살뜰히 돌봅니다. 사람과 일을 키워내는 힘이 있습니다.'),
+    ('단련되기 전의 단단한 원석과 쇠', '결단력이 있고 의리를 중시하며 강직합니다. 옳고 그름이 분명해 맺고 끊음이 확실합니다.'),
+    ('잘 다듬어진 보석', '예리하고 섬세하며 완벽을 추구합니다. 심미안과 자존심이 높아 스스로에게도 엄격한 편입니다.'),
+    ('넓게 흐르는 큰 강과 바다', '지혜롭고 포부가 크며 자유로움을 사랑합니다. 상황을 넓게 보고 흐름을 읽는 능력이 뛰어납니다.'),
+    ('만물을 적시는 비와 이슬', '총명하고 직관이 뛰어나며 감수성이 풍부합니다. 조용하지만 주변에 스며드는 영향력이 있습니다.'),
+]
+
+# 십신 → 일지(내면·배우자궁)에 있을 때의 성향
+SIPSIN_INNER = [
+    '자립심이 강하고 내 일은 내가 책임지려는',
+    '승부욕과 추진력이 강해 지는 것을 싫어하는',
+    '여유롭고 낙천적이며 자기 재능을 꾸준히 키우는',
+    '재치 있고 표현이 날카로우며 틀에 얽매이기 싫어하는',
+    '활동적이고 사람과 기회를 넓게 다루는',
+    '성실하고 계획적으로 차곡차곡 쌓아가는',
+    '위기에 강하고 결단이 빠른',
+    '원칙과 명예를 중시하는 반듯한',
+    '직관이 독특하고 한 분야에 깊이 몰입하는',
+    '배움을 즐기고 따뜻한 보살핌을 주고받는',
+]
+
+# 십신 그룹 (번호 // 2): 비겁, 식상, 재성, 관성, 인성
+GROUP_NAMES = ['비겁(比劫·나와 같은 기운)', '식상(食傷·표현하는 기운)', '재성(財星·재물의 기운)',
+               '관성(官星·나를 다스리는 기운)', '인성(印星·나를 돕는 기운)']
+GROUP_SHORT = ['비겁', '식상', '재성', '관성', '인성']
+GROUP_TRAIT = [
+    '독립심과 주체성', '표현력과 창의성', '현실 감각과 관리 능력', '책임감과 규범 의식', '학습 능력과 사려 깊음',
+]
+GROUP_LACK = [
+    '스스로를 믿고 밀어붙이는 힘', '생각을 밖으로 드러내는 표현', '돈과 시간을 관리하는 습관',
+    '규칙적인 생활과 자기 관리', '배우고 쉬며 충전하는 시간',
+]
+GROUP_CAREER = [
+    '독립적으로 움직이는 창업·프리랜서, 동료와 함께 성과를 내는 팀 단위 업무',
+    '기획·콘텐츠·교육·기술처럼 재능을 결과물로 만들어내는 분야',
+    '금융·유통·영업·사업 운영처럼 돈과 자원의 흐름을 다루는 분야',
+    '공직·대기업·법률·관리직처럼 체계와 책임이 분명한 조직',
+    '연구·교육·상담·전문 자격처럼 지식과 신뢰가 자산이 되는 분야',
+]
+GROUP_YEAR = [
+    '자기 주도로 일을 벌이고 사람들과 어깨를 나란히 하는 해입니다. 경쟁이 생기기 쉽고 지출이 늘 수 있으니 돈 관리에 신경 쓰세요.',
+    '하고 싶은 말과 재능을 마음껏 펼치는 해입니다. 새로운 시도와 결과물이 빛나지만, 말실수와 과로는 조심하세요.',
+    '재물의 기회와 활동 범위가 넓어지는 해입니다. 수입이 늘어날 수 있으나 무리한 투자보다 실속을 챙기세요.',
+    '책임과 평가가 따르는 해입니다. 승진·이동 같은 변화가 생길 수 있고, 압박이 느껴질수록 원칙을 지키는 것이 답입니다.',
+    '배움과 문서, 도움의 기운이 들어오는 해입니다. 자격·계약·학업에 유리하니 준비해 온 일을 매듭지으세요.',
+]
+
+# 오행별 (관련 장기, 색, 방향, 생활 습관)
+OHAENG_BODY = ['간·담·눈·근육', '심장·소장·혈액순환', '비위(소화기)', '폐·대장·호흡기·피부', '신장·방광·허리']
+OHAENG_COLOR_KR = ['초록·청색', '빨강·주황', '노랑·베이지', '흰색·은색', '검정·남색']
+OHAENG_DIRECTION = ['동쪽', '남쪽', '중앙', '서쪽', '북쪽']
+OHAENG_ACTIVITY = [
+    '숲길 산책, 식물 가꾸기, 새로운 공부 시작하기',
+    '꾸준한 유산소 운동, 사람 만나기, 햇볕 충분히 쬐기',
+    '규칙적인 식사, 저축과 기록, 명상처럼 중심을 잡는 습관',
+    '정리정돈, 계획표 세우기, 악기·공예처럼 손을 다듬는 취미',
+    '독서, 충분한 수면, 물가 산책과 반신욕',
+]
+
+# 신살 → 현대적 해석 (신살 문자열 앞부분으로 찾음)
+SINSAL_TEXT = {
+    '도화살': '**도화살(桃花殺)**은 사람을 끄는 매력과 인기를 뜻합니다. 대인관계·서비스·예술 분야에서 큰 장점이 되며, 인연이 많은 만큼 관계의 선을 분명히 하면 좋습니다.',
+    '역마살': '**역마살(驛馬殺)**은 이동과 변화의 기운입니다. 출장·해외·이동이 잦은 일에서 오히려 기회가 열리고, 한곳에 머물면 답답함을 느끼기 쉽습니다.',
+    '화개살': '**화개살(華蓋殺)**은 예술성과 학문·종교적 깊이를 뜻합니다. 혼자 몰입하는 시간이 재능을 키우는 원천입니다.',
+    '귀문관살': '**귀문관살(鬼門關殺)**은 예민한 직관과 감수성을 뜻합니다. 남다른 통찰력이 있지만 신경이 쉽게 지치니 충분한 휴식이 필요합니다.',
+}
+
+SECTION_TITLES = [
+    '타고난 성격과 기질', '재물운과 직업운', '대인관계와 연애운', '건강 주의점',
+    '올해 운세', '대운 흐름', '종합 조언',
+]
+
+# 카테고리 → 상세 풀이 제목 (money/career 는 종합 풀이 2번 항목의 절반씩)
+CATEGORY_TITLES = {'love': '대인관계와 연애운', 'money': '재물운', 'career': '직업운',
+                   'health': '건강 주의점', 'yearly': '올해 운세'}
+
+# ============================================================
+# 명식 요약
+# ============================================================
+
+def _layout(chart):
+    """일간 기준 십신 배치 → (7자리 십신 번호, 그룹별 개수)"""
+    ilgan = chart.day_gan
+    codes = [SIPSIN_TABLE[ilgan][chart.year_gan], SIPSIN_TABLE[ilgan][chart.month_gan],
+             SIPSIN_TABLE[ilgan][chart.hour_gan]]
+    codes += [SIPSIN_JI_TABLE[ilgan][j] for j in chart.jis]
+    groups = [0] * 5
+    for code in codes:
+        groups[code // 2] += 1
+    return codes, groups
+
+
+def _relation_kinds(items):
+    """합충형 문자열 목록 → (합 개수, 충 개수, 형 개수)"""
+    hap = sum(1 for s in items if s.split(':', 1)[0].endswith('합'))
+    chung = sum(1 for s in items if s.split(':', 1)[0].endswith('충'))
+    hyung = sum(1 for s in items if s.split(':', 1)[0].endswith('형'))
+    return hap, chung, hyung
+
+
+# '재성(財星)이(가)' → '재성(財星)이' (괄호 병기·굵게 표시를 건너뛰고 앞 한글의 받침으로 조사 선택)
+_JOSA = re.compile(r'([가-힣])((?:\([^()]*\))?\**)(이\(가\)|은\(는\)|을\(를\))')
+
+
+def _fix_josa(text):
+    def pick(m):
+        final = (ord(m.group(1)) - 0xAC00) % 28
+        particle = m.group(3)
+        return m.group(1) + m.group(2) + (particle[0] if final else particle[2])
+    return _JOSA.sub(pick, text)
+
+
+def _sinsal_names(chart):
+    return {s.split('(', 1)[0] for s in chart.sinsal}
+
+
+def _strong(chart):
+    return chart.yongsin['strength'].startswith('신강')
+
+
+def _current_daeun(chart):
+    """(현재 나이, 현재 대운 번호 또는 -1(대운 시작 전), 대운 목록)"""
+    daeun = chart.daeun['list']
+    age = chart.current_year - chart.solar_date.year
+    index = -1
+    for i, d in enumerate(daeun):
+        if age >= d['age']:
+            index = i
+    return age, index, daeun
+
+
+def _group_of(chart, gan):
+    return SIPSIN_TABLE[chart.day_gan][gan] // 2
+
+# ============================================================
+# 항목별 문단
+# ============================================================
+
+def _personality(chart, codes, groups):
+    image, nature = ILGAN_NATURE[chart.day_gan]
+    lines = [
+        f"**{pillar_label(chart.day_gan, chart.day_ji)} 일주**로 태어나셨습니다. "
+        f"일간 {CHEONGAN_KR[chart.day_gan]}{OHAENG_KR[CHEONGAN_OHAENG[chart.day_gan]]}은(는) {image}에 비유됩니다. {nature}",
+        f"일지(日支·내면과 배우자 자리)에는 {SIPSIN_NAME[codes[5]]}이(가) 있어 속마음은 {SIPSIN_INNER[codes[5]]} 사람입니다.",
+    ]
+    if _strong(chart):
+        lines.append("스스로 밀고 나가는 힘이 강한 **신강(身強·일간의 기운이 강함)** 사주라 주도적인 자리에서 능력이 살아납니다.")
+    else:
+        lines.append("주변의 도움과 협력 속에서 힘을 얻는 **신약(身弱·일간의 기운이 약함)** 사주라 좋은 사람과 환경을 고르는 것이 중요합니다.")
+    top = max(range(5), key=lambda g: groups[g])
+    lines.append(f"원국에 {GROUP_NAMES[top]}이(가) {groups[top]}개로 가장 많아 {GROUP_TRAIT[top]}이(가) 두드러집니다.")
+    missing = [g for g in range(5) if groups[g] == 0]
+    if missing:
+        names = ', '.join(GROUP_SHORT[g] for g in missing)
+        lacks = ', '.join(GROUP_LACK[g] for g in missing)
+        lines.append(f"반면 {names}이(가) 없으니 {lacks}을(를) 의식적으로 채우면 균형이 잡힙니다.")
+    if '화개살' in _sinsal_names(chart):
+        lines.append(SINSAL_TEXT['화개살'])
+    return lines
+
+
+def _money(chart, codes, groups):
+    wealth, output, rivals = groups[2], groups[1], groups[0]
+    if wealth == 0:
+        if output:
+            lines = ["재성(財星)이 원국에 드러나지 않지만 식상(食傷·재능)이 있어, 실력과 결과물이 곧 재물로 이어지는 구조입니다. "
+                     "돈을 직접 쫓기보다 기술과 전문성을 쌓는 것이 가장 빠른 길입니다."]
+        else:
+            lines = ["재성(財星)이 원국에 드러나지 않아 큰 한 방보다는 안정적인 수입 구조를 먼저 만드는 것이 유리합니다. "
+                     "고정 수입과 자동 저축으로 기반을 다지세요."]
+    elif wealth >= 3:
+        lines = [f"재성이 {wealth}개로 많아 재물과 기회가 자주 찾아옵니다."]
+        lines.append("다만 일간의 힘이 약한 편이라 벌어들인 만큼 지키는 관리력이 관건입니다. 무리한 확장보다 선택과 집중이 필요합니다."
+                     if not _strong(chart) else
+                     "일간의 힘도 충분해 기회를 직접 잡아 키울 수 있는 구조입니다. 사업·투자 감각을 살려 보세요.")
+    else:
+        lines = [f"재성이 {wealth}개로 적당히 자리해 재물 흐름이 안정적인 편입니다."]
+    pyeon, jeong = codes.count(4), codes.count(5)
+    if pyeon > jeong:
+        lines.append("편재(偏財)가 앞서 있어 사업·투자·영업처럼 움직이는 돈에 감각이 있습니다. 수입의 일부는 반드시 묶어 두세요.")
+    elif jeong > pyeon:
+        lines.append("정재(正財)가 앞서 있어 월급·저축·부동산처럼 차곡차곡 쌓이는 재물이 잘 맞습니다.")
+    if rivals >= 3:
+        lines.append("비겁(比劫)이 많아 동업·보증이나 주변 사람 때문에 나가는 돈이 생기기 쉬우니 돈 거래는 문서로 분명히 하세요.")
+    return lines
+
+
+def _career(chart, codes, groups, sinsal):
+    top = max(range(5), key=lambda g: groups[g])
+    lines = [f"직업 적성은 {GROUP_SHORT[top]}의 기운을 따라 **{GROUP_CAREER[top]}**에서 강점이 살아납니다."]
+    month_ji = codes[4]
+    lines.append(f"사회 활동의 자리인 월지에는 {SIPSIN_NAME[month_ji]}이(가) 있어 일터에서는 {SIPSIN_INNER[month_ji]} 모습이 드러납니다.")
+    officers = groups[3]
+    if officers == 0:
+        lines.append("관성(官星)이 없어 정해진 틀보다 자율성이 보장되는 환경에서 능률이 오릅니다.")
+    elif officers >= 3:
+        lines.append("관성(官星)이 많아 조직에서 인정받기 쉽지만 책임이 몰리기 쉬우니, 맡을 일과 거절할 일을 구분하세요.")
+    else:
+        lines.append("관성(官星)이 적당해 조직 안에서 꾸준히 신뢰를 쌓으며 자리를 넓혀 가기 좋습니다.")
+    if '역마살' in sinsal:
+        lines.append("역마살이 있어 이동·출장·해외와 관련된 일에서 기회가 커집니다.")
+    return lines
+
+
+def _relationships(chart, codes, groups, sinsal):
+    spouse = (2, '재성(財星)') if chart.gender == '남' else (3, '관성(官星)')
+    count = groups[spouse[0]]
+    lines = [f"배우자 자리인 일지에 {SIPSIN_NAME[codes[5]]}이(가) 있어 {SIPSIN_INNER[codes[5]]} 상대와 잘 어울립니다."]
+    if count == 0:
+        lines.append(f"배우자를 뜻하는 {spouse[1]}이(가) 원국에 드러나지 않아 인연이 늦게 오거나 천천히 깊어지는 편입니다. "
+                     "서두르기보다 오래 알고 지낸 사람 가운데 인연을 찾는 것이 좋습니다.")
+    elif count >= 3:
+        lines.append(f"배우자를 뜻하는 {spouse[1]}이(가) {count}개로 많아 인연이 풍부합니다. 선택의 폭이 넓은 만큼 신중함이 필요합니다.")
+    else:
+        lines.append(f"배우자를 뜻하는 {spouse[1]}이(가) 자리하고 있어 인연의 흐름이 자연스럽습니다.")
+    day_rel = [s for s in chart.relations if '일간' in s or '일지' in s]
+    hap, chung, hyung = _relation_kinds(day_rel)
+    if hap:
+        lines.append("일주가 다른 기둥과 **합(合)**을 이루어 사람을 끌어당기고 관계를 부드럽게 이어 가는 힘이 있습니다.")
+    if chung or hyung:
+        lines.append("일주에 **충(沖)·형(刑)**이 걸려 있어 가까운 관계에서 부딪힘이 생기기 쉽습니다. "
+                     "갈등이 생기면 바로 결론 내기보다 한 박자 쉬어 가는 것이 관계를 지키는 비결입니다.")
+    for name in ('도화살', '귀문관살'):
+        if name in sinsal:
+            lines.append(SINSAL_TEXT[name])
+    return lines
+
+
+def _health(chart):
+    values = chart.ohaeng_values
+    low = min(values)
+    weak = [i for i in range(5) if values[i] == low]
+    excess = [i for i in range(5) if values[i] >= 4]
+    lines = []
+    for i in weak:
+        state = '없어' if low == 0 else '약해'
+        lines.append(f"{OHAENG_NAME[i]} 기운이 {state} **{OHAENG_BODY[i]}** 쪽이 약해지기 쉽습니다.")
+    for i in excess:
+        lines.append(f"{OHAENG_NAME[i]} 기운이 {values[i]}개로 넘쳐 {OHAENG_BODY[i]}에 무리가 가기 쉽고, "
+                     f"{OHAENG_NAME[KE_MAP[i]]}이(가) 눌려 {OHAENG_BODY[KE_MAP[i]]} 관리도 함께 필요합니다.")
+    if not excess and low > 0:
+        lines.append("오행이 고르게 분포해 타고난 체력의 균형은 좋은 편입니다.")
+    yongsin = chart.yongsin['yongsin_idx']
+    lines.append(f"평소 {OHAENG_ACTIVITY[yongsin]} 같은 {OHAENG_KR[yongsin]}의 생활 습관이 몸의 균형을 잡아 줍니다. "
+                 "증상이 있으면 사주보다 전문의 진료가 먼저입니다.")
+    return lines
+
+
+def _luck_relation(interactions):
+    """운과 원국의 합충형 → 한 문장 (없으면 None)"""
+    hap, chung, hyung = _relation_kinds(interactions)
+    parts = []
+    if hap:
+        parts.append('합(合)으로 협력과 새로운 인연이')
+    if chung:
+        parts.append('충(沖)으로 이사·이직 같은 변화가')
+    if hyung:
+        parts.append('형(刑)으로 서류·건강·관계의 마찰이')
+    if not parts:
+        return None
+    return '원국과 만나 ' + ', '.join(parts) + ' 생기기 쉬우니 흐름에 맞춰 유연하게 움직이세요.'
+
+
+def _yearly(chart):
+    gan, ji = chart.current_year_gan, chart.current_year_ji
+    yongsin = chart.yongsin['yongsin_idx']
+    group = _group_of(chart, gan)
+    lines = [f"{chart.current_year}년은 **{pillar_label(gan, ji)}년**으로, 일간에게 {SIPSIN_NAME[SIPSIN_TABLE[chart.day_gan][gan]]}"
+             f"({GROUP_SHORT[group]})의 해입니다. {GROUP_YEAR[group]}"]
+    if yongsin in (CHEONGAN_OHAENG[gan], JIJI_OHAENG[ji]):
+        lines.append(f"올해는 용신인 {OHAENG_NAME[yongsin]} 기운이 들어와 전반적으로 힘을 받는 해입니다. 미뤄 둔 계획을 실행에 옮기기 좋습니다.")
+    else:
+        lines.append("올해는 용신의 기운이 직접 들어오지 않으니 큰 승부보다 내실을 다지는 쪽이 유리합니다.")
+    relation = _luck_relation(get_interactions(chart, gan, ji))
+    if relation:
+        lines.append(relation)
+    return lines
+
+
+def _daeun_flow(chart):
+    age, index, daeun = _current_daeun(chart)
+    yongsin = chart.yongsin['yongsin_idx']
+    if index < 0:
+        first = daeun[0]
+        return [f"아직 첫 대운({first['age']}세, {first['label']}) 전이며, {first['year']}년 무렵부터 본격적인 대운의 흐름이 시작됩니다."]
+    current = daeun[index]
+    group = _group_of(chart, current['gan'])
+    lines = [f"지금은 {current['age']}세부터 이어지는 **{current['label']} 대운**으로, {GROUP_SHORT[group]}의 10년입니다. "
+             f"{GROUP_TRAIT[group]}이(가) 삶의 중심 과제가 되는 시기입니다."]
+    if yongsin in (CHEONGAN_OHAENG[current['gan']], JIJI_OHAENG[current['ji']]):
+        lines.append(f"용신인 {OHAENG_NAME[yongsin]} 기운이 함께하는 대운이라 노력한 만큼 결실을 거두기 좋습니다.")
+    relation = _luck_relation(get_interactions(chart, current['gan'], current['ji']))
+    if relation:
+        lines.append(relation)
+    if index + 1 < len(daeun):
+        upcoming = daeun[index + 1]
+        next_group = _group_of(chart, upcoming['gan'])
+        lines.append(f"다음 전환점은 {upcoming['year']}년 무렵({upcoming['age']}세) 시작되는 {upcoming['label']} 대운으로, "
+                     f"{GROUP_SHORT[next_group]}의 흐름으로 바뀌며 {GROUP_TRAIT[next_group]}이(가) 새로운 과제가 됩니다.")
+    return lines
+
+
+def _advice(chart):
+    yongsin = chart.yongsin
+    idx = yongsin['yongsin_idx']
+    return [
+        yongsin['advice'],
+        f"**용신 활용법** - 색: {OHAENG_COLOR_KR[idx]} / 방향: {OHAENG_DIRECTION[idx]} / 습관: {OHAENG_ACTIVITY[idx]}",
+        "사주는 타고난 기질과 흐름을 보여 줄 뿐, 그 위에 무엇을 쌓을지는 오늘의 선택이 정합니다. "
+        "강점은 살리고 부족한 기운은 생활 습관으로 채워 가세요.",
+    ]
+
+# ============================================================
+# 조립
+# ============================================================
+
+def _sections(chart):
+    codes, groups = _layout(chart)
+    sinsal = _sinsal_names(chart)
+    return [
+        _personality(chart, codes, groups),
+        _money(chart, codes, groups) + _career(chart, codes, groups, sinsal),
+        _relationships(chart, codes, groups, sinsal),
+        _health(chart),
+        _yearly(chart),
+        _daeun_flow(chart),
+        _advice(chart),
+    ]
+
+
+def _render(number, title, lines):
+    return f"## {number}. {title}\n" + '\n'.join(lines)
+
+
+def local_interpretation(chart):
+    """7개 항목 종합 풀이 (마크다운)"""
+    def build():
+        return _fix_josa('\n\n'.join(_render(i + 1, SECTION_TITLES[i], lines)
+                                       for i, lines in enumerate(_sections(chart))))
+    return LOCAL_CACHE.get_or_compute(chart.cache_key, build)
+
+
+def local_category_interpretation(chart, category):
+    """카테고리 상세 풀이 (마크다운), 잘못된 카테고리면 None"""
+    if category not in CATEGORY_TITLES:
+        return None
+    codes, groups = _layout(chart)
+    sinsal = _sinsal_names(chart)
+    if category == 'love':
+        lines = _relationships(chart, codes, groups, sinsal)
+    elif category == 'money':
+        lines = _money(chart, codes, groups)
+    elif category == 'career':
+        lines = _career(chart, codes, groups, sinsal)
+    elif category == 'health':
+        lines = _health(chart)
+    else:
+        lines = _yearly(chart)
+    idx = chart.yongsin['yongsin_idx']
+    lines = lines + [f"용신인 {OHAENG_NAME[idx]} 기운을 가까이하세요 - {OHAENG_COLOR_KR[idx]} 계열, {OHAENG_ACTIVITY[idx]}."]
+    return _fix_josa(f"## {CATEGORY_TITLES[category]}\n" + '\n'.join(lines))
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+운세 타임라인 엔진 (대운/세운/월운)
+- 제너레이터로 필요한 구간만 지연 계산 (100년 = 대운 10 + 세운 100 + 월운 1,200)
+- 각 운의 간지와 원국 8글자 사이의 합/충/형 관계를 함께 제공
+- 시작 연도로 바로 건너뛸 수 있어 API 페이지 단위 조회에 그대로 사용
+"""
+
+from saju_engine import (
+    CHEONGAN, CHEONGAN_KR, JIJI, JIJI_KR,
+    CHEONGAN_HAP, CHEONGAN_CHUNG, JIJI_YUKHAP, JIJI_CHUNG, JIJI_HYUNG,
+    GAN_REL, JI_REL, SAMHAP_MASKS, REL_HAP, REL_YUKHAP, REL_CHUNG, REL_HYUNG,
+    PILLAR_JI_NAMES, get_month_pillar, get_solar_term_date,
+    get_daeun_start, get_daeun_pillar, pillar_label,
+)
+
+PILLAR_GAN_NAMES = ['년간', '월간', '일간', '시간']
+TIMELINE_KINDS = ('daeun', 'seun', 'wolun')
+
+
+def get_interactions(chart, gan, ji):
+    """운의 간지(gan, ji)와 원국 사이의 합/충/형 관계"""
+    interactions = []
+    for name, natal in zip(PILLAR_GAN_NAMES, chart.gans):
+        rel = GAN_REL[gan][natal]
+        if rel & REL_HAP:
+            interactions.append(f'천간합: {name} - {CHEONGAN_HAP[(gan, natal)]}')
+        if rel & REL_CHUNG:
+            interactions.append(f'천간충: {name} - {CHEONGAN_CHUNG[(gan, natal)]}')
+
+    natal_bits = 0
+    for name, natal in zip(PILLAR_JI_NAMES, chart.jis):
+        natal_bits |= 1 << natal
+        rel = JI_REL[ji][natal]
+        if rel & REL_YUKHAP:
+            interactions.append(f'지지육합: {name} - {JIJI_YUKHAP[(ji, natal)]}')
+        if rel & REL_CHUNG:
+            interactions.append(f'지지충: {name} - {JIJI_CHUNG[(ji, natal)]}')
+        if rel & REL_HYUNG:
+            interactions.append(f'지지형: {name} - {JIJI_HYUNG[(ji, natal)]}')
+
+    # 운의 지지가 들어와서 새로 완성되는 삼합
+    for mask, value in SAMHAP_MASKS:
+        if mask >> ji & 1 and (natal_bits | 1 << ji) & mask == mask and natal_bits & mask != mask:
+            interactions.append(f'지지삼합: {value}')
+    return interactions
+
+
+def _item(chart, kind, gan, ji, **extra):
+    item = {'kind': kind, **extra}
+    item.update({
+        'gan': CHEONGAN[gan], 'ji': JIJI[ji],
+        'gan_kr': CHEONGAN_KR[gan], 'ji_kr': JIJI_KR[ji],
+        'label': pillar_label(gan, ji),
+        'interactions': get_interactions(chart, gan, ji),
+    })
+    return item
+
+
+def iter_timeline(chart, start_year, end_year=None, kinds=TIMELINE_KINDS):
+    """
+    start_year 부터 연도 순으로 운을 하나씩 생성합니다. (end_year 포함, 생략 시 무한)
+
+    한 해의 순서: 그해 시작하는 대운 → 세운 → 월운(인월~축월)
+    start_year 가 대운 도중이면 진행 중인 대운을 맨 앞에 한 번 내보냅니다.
+    """
+    solar = chart.solar_date
+    forward, start_age = get_daeun_start(chart.year_gan, solar, chart.gender)
+    first_daeun_year = solar.year + start_age
+
+    year = start_year
+    if 'daeun' in kinds and year > first_daeun_year and (year - first_daeun_year) % 10:
+        i = (year - first_daeun_year) // 10
+        yield _daeun_item(chart, forward, start_age, i)
+
+    while end_year is None or year <= end_year:
+        if 'daeun' in kinds and year >= first_daeun_year and (year - first_daeun_year) % 10 == 0:
+            yield _daeun_item(chart, forward, start_age, (year - first_daeun_year) // 10)
+
+        year_gan, year_ji = (year - 4) % 10, (year - 4) % 12
+        if 'seun' in kinds:
+            yield _item(chart, 'seun', year_gan, year_ji, year=year,
+                        start=f'{get_solar_term_date(year, 1):%Y-%m-%dT%H:%M}')
+
+        if 'wolun' in kinds:
+            for saju_month in range(1, 13):
+                month_gan, month_ji = get_month_pillar(year_gan, saju_month)
+                # 축월(12)은 이듬해 소한에 시작
+                start = get_solar_term_date(year + 1 if saju_month == 12 else year, saju_month)
+                yield _item(chart, 'wolun', month_gan, month_ji, year=year, month=saju_month,
+                            start=f'{start:%Y-%m-%dT%H:%M}')
+        year += 1
+
+
+def _daeun_item(chart, forward, start_age, i):
+    gan, ji = get_daeun_pillar(chart.month_gan, chart.month_ji, forward, i)
+    age = start_age + i * 10
+    return _item(chart, 'daeun', gan, ji, index=i, age=age, year=chart.solar_date.year + age)
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+프로세스 내 메모이제이션 캐시
+- 크기 제한 LRU + 선택적 TTL
+- 적중/미스/축출 카운터 제공 (헬스 체크에서 노출)
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+
+class LRUCache:
+    """스레드 안전한 크기 제한 LRU 캐시 (ttl 초가 지나면 만료)"""
+
+    def __init__(self, maxsize=4096, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()  # key → (만료 시각, 값)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                expires, value = entry
+                if expires is None or expires > time.monotonic():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+                self.evictions += 1
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        expires = time.monotonic() + self.ttl if self.ttl else None
+        with self._lock:
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(self, key, compute):
+        """캐시에 있으면 그대로, 없으면 compute() 결과를 저장 후 반환"""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'size': len(self._data),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+_MISSING = object()
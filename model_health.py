@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+"""
+Gemini 모델 상태 레지스트리 (워커 간 공유)
+- 모델별 최근 호출 결과(성공/오류/429/404)와 지연 시간을 SQLite 에 기록
+- 최근 구간의 p50/p90 지연, 오류율, 429 비율 집계 → /api/health, 헤지 요청 지연 기준
+- 서킷 브레이커: 404 는 즉시, 오류·429 는 연속 BREAKER_THRESHOLD 회면 일정 시간 건너뜀
+  (쿨다운이 끝난 뒤 첫 호출이 실패하면 바로 다시 열림 = half-open)
+- rank(): 최근 실패율(오류·404·429) → p90 지연 → 마지막 성공 순 (모든 워커 공통),
+  브레이커가 열린 모델은 제외 → 호출 순서와 헤지 대상(다음 순위 모델)
+"""
+
+import os
+import sqlite3
+import threading
+import time
+
+MODEL_HEALTH_PATH = os.environ.get(
+    'MODEL_HEALTH_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'model_health.sqlite3'))
+
+HEALTH_WINDOW = 3600        # 집계 구간 (초)
+LATENCY_SAMPLES = 50        # p50/p90 계산에 쓰는 최근 성공 호출 수
+BREAKER_THRESHOLD = 3       # 연속 실패 몇 번이면 브레이커를 열지
+BREAKER_COOLDOWN = 60       # 오류·429 로 열렸을 때 건너뛰는 시간 (초)
+NOT_FOUND_COOLDOWN = 3600   # 404(모델 없음)로 열렸을 때 건너뛰는 시간 (초)
+
+# 호출 결과 종류
+OK = 'ok'
+ERROR = 'error'
+RATE_LIMITED = 'rate_limited'
+NOT_FOUND = 'not_found'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    model TEXT NOT NULL,
+    ts REAL NOT NULL,
+    outcome TEXT NOT NULL,
+    latency REAL
+);
+CREATE INDEX IF NOT EXISTS events_model_ts ON events (model, ts);
+CREATE TABLE IF NOT EXISTS breakers (
+    model TEXT PRIMARY KEY,
+    failures INTEGER NOT NULL DEFAULT 0,
+    open_until REAL NOT NULL DEFAULT 0,
+    reason TEXT,
+    last_ok REAL NOT NULL DEFAULT 0
+);
+"""
+
+
+def _percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+class ModelHealthRegistry:
+    """모델별 호출 결과 기록 + 서킷 브레이커 (DB 오류 시에는 기록을 건너뛰고 모든 모델 허용)"""
+
+    def __init__(self, path=MODEL_HEALTH_PATH):
+        self.path = path
+        self._local = threading.local()
+
+    def _connect(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+        conn = sqlite3.connect(self.path, timeout=10, isolation_level=None, check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.executescript(_SCHEMA)
+        self._local.conn, self._local.pid = conn, os.getpid()
+        return conn
+
+    def record(self, model, outcome, latency=None):
+        """호출 한 번의 결과 기록 및 브레이커 갱신"""
+        try:
+            conn = self._connect()
+            now = time.time()
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                conn.execute('INSERT INTO events (model, ts, outcome, latency) VALUES (?, ?, ?, ?)',
+                             (model, now, outcome, latency))
+                conn.execute('DELETE FROM events WHERE model = ? AND ts < ?', (model, now - HEALTH_WINDOW))
+                conn.execute('INSERT OR IGNORE INTO breakers (model) VALUES (?)', (model,))
+                if outcome == OK:
+                    conn.execute('UPDATE breakers SET failures = 0, open_until = 0, reason = NULL, last_ok = ? '
+                                 'WHERE model = ?', (now, model))
+                elif outcome == NOT_FOUND:
+                    conn.execute('UPDATE breakers SET failures = failures + 1, open_until = ?, reason = ? '
+                                 'WHERE model = ?', (now + NOT_FOUND_COOLDOWN, outcome, model))
+                else:
+                    conn.execute(
+                        'UPDATE breakers SET failures = failures + 1, '
+                        'open_until = CASE WHEN failures + 1 >= ? THEN ? ELSE open_until END, '
+                        'reason = CASE WHEN failures + 1 >= ? THEN ? ELSE reason END WHERE model = ?',
+                        (BREAKER_THRESHOLD, now + BREAKER_COOLDOWN, BREAKER_THRESHOLD, outcome, model))
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+        except sqlite3.Error as e:
+            print(f"[모델 상태] 기록 오류: {e}")
+
+    def rank(self, models):
+        """
+        호출 순서: 최근 HEALTH_WINDOW 실패율(오류·404·429) 낮은 순 → p90 지연 짧은 순
+        (표본이 부족하면 뒤로) → 마지막 성공이 최근인 순 → models 순서
+        브레이커가 열린 모델은 제외 (전부 열려 있으면 models 그대로)
+        """
+        try:
+            conn = self._connect()
+            now = time.time()
+            rows = conn.execute('SELECT model, open_until, last_ok FROM breakers').fetchall()
+            counts = {model: (calls, failed) for model, calls, failed in conn.execute(
+                'SELECT model, COUNT(*), SUM(outcome != ?) FROM events WHERE ts >= ? GROUP BY model',
+                (OK, now - HEALTH_WINDOW))}
+        except sqlite3.Error as e:
+            print(f"[모델 상태] 조회 오류: {e}")
+            return list(models)
+        state = {model: (open_until, last_ok) for model, open_until, last_ok in rows}
+        usable = [m for m in models if state.get(m, (0, 0))[0] <= now]
+        if not usable:
+            return list(models)
+
+        def key(model):
+            calls, failed = counts.get(model, (0, 0))
+            p90 = self.latency_percentile(model, 0.9)
+            return (failed / calls if calls else 0.0,
+                    p90 if p90 is not None else float('inf'),
+                    -state.get(model, (0, 0))[1])
+        return sorted(usable, key=key)  # 같으면 models 순서 (안정 정렬)
+
+    def latency_percentile(self, model, q=0.9, min_samples=5):
+        """최근 성공 호출 지연의 q 분위수 (표본이 부족하면 None)"""
+        try:
+            rows = self._connect().execute(
+                'SELECT latency FROM events WHERE model = ? AND outcome = ? ORDER BY ts DESC LIMIT ?',
+                (model, OK, LATENCY_SAMPLES)).fetchall()
+        except sqlite3.Error:
+            return None
+        if len(rows) < min_samples:
+            return None
+        return _percentile([r[0] for r in rows], q)
+
+    def stats(self, models):
+        try:
+            conn = self._connect()
+            now = time.time()
+            breakers = {m: (o, r) for m, o, r in conn.execute('SELECT model, open_until, reason FROM breakers')}
+            result = {}
+            for model in models:
+                counts = dict(conn.execute(
+                    'SELECT outcome, COUNT(*) FROM events WHERE model = ? AND ts >= ? GROUP BY outcome',
+                    (model, now - HEALTH_WINDOW)).fetchall())
+                calls = sum(counts.values())
+                open_until, reason = breakers.get(model, (0, None))
+                p50, p90 = (self.latency_percentile(model, q, 1) for q in (0.5, 0.9))
+                result[model] = {
+                    'calls': calls,
+                    'p50': round(p50, 2) if p50 is not None else None,
+                    'p90': round(p90, 2) if p90 is not None else None,
+                    'error_rate': round((counts.get(ERROR, 0) + counts.get(NOT_FOUND, 0)) / calls, 4) if calls else 0.0,
+                    'rate_limited_rate': round(counts.get(RATE_LIMITED, 0) / calls, 4) if calls else 0.0,
+                    'breaker': 'open' if open_until > now else 'closed',
+                    'open_seconds': round(open_until - now) if open_until > now else 0,
+                    'reason': reason if open_until > now else None,
+                }
+            return result
+        except sqlite3.Error as e:
+            return {'error': str(e)}
+
+
+MODEL_HEALTH = ModelHealthRegistry()
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""
+사주 역검색 색인 (Reverse Pillar Index)
+- 주어진 사주(년/월/일/시 간지)가 나오는 출생 일시를 1900~2100년에서 찾음
+- 전체 일치("庚午 辛巳 庚辰 癸未")와 부분 일치("일주 甲子 + 월지 寅") 모두 지원
+- 년주·월주는 절(節) 구간마다 일정하므로 구간 단위로 색인,
+  일주는 60일 주기, 시주는 일간 묶음(甲己/乙庚...)과 시지로 산술 계산
+
+사용법:
+    python pillar_index.py 庚午 辛巳 庚辰 癸未
+    python pillar_index.py '?' '?寅' 甲子 '?'
+"""
+
+from datetime import datetime, timedelta
+
+from saju_engine import (
+    CHEONGAN, CHEONGAN_KR, JIJI, JIJI_KR, JEOL_MINUTES,
+    get_year_pillar, get_saju_month, get_month_pillar, get_day_pillar, get_hour_pillar,
+)
+
+INDEX_FIRST = datetime(1900, 1, 1)
+INDEX_LAST = datetime(2100, 12, 31)
+
+# 60갑자 번호 ↔ (천간, 지지)
+GANZHI = [(k % 10, k % 12) for k in range(60)]
+GANZHI_INDEX = {gz: k for k, gz in enumerate(GANZHI)}
+
+# 시간 구간은 "시 슬롯" 정수로 표현: 서수(ordinal) * 24 + 시 (analyze_saju 는 시 단위 입력)
+_SLOT_FIRST = INDEX_FIRST.toordinal() * 24
+_SLOT_END = (INDEX_LAST.toordinal() + 1) * 24
+
+_segments = None        # [(시작 슬롯, 끝 슬롯, 년주 번호, 월주 번호)]
+_by_year = None         # 년주 번호 → 구간 목록
+_by_month = None        # 월주 번호 → 구간 목록
+_day_ref = None         # 일주 번호가 0(甲子)인 기준 서수
+_hour_ganzhi = None     # [일간 % 5][시] → 시주 번호
+
+
+def _build():
+    """절기 테이블의 구간마다 saju_engine 의 연주/월주 함수를 한 번씩 호출해 색인 생성"""
+    global _segments, _by_year, _by_month, _day_ref, _hour_ganzhi
+
+    # 절입 시각(분) → 그 시각 이후 첫 시 슬롯
+    starts = [-(-m // 60) for m in JEOL_MINUTES]
+    segments = []
+    for start, end in zip(starts, starts[1:]):
+        start, end = max(start, _SLOT_FIRST), min(end, _SLOT_END)
+        if start >= end:
+            continue
+        at = datetime.fromordinal(start // 24).replace(hour=start % 24)
+        year_gan, year_ji = get_year_pillar(at)
+        month_gz = get_month_pillar(year_gan, get_saju_month(at))
+        segments.append((start, end, GANZHI_INDEX[(year_gan, year_ji)], GANZHI_INDEX[month_gz]))
+
+    by_year, by_month = {}, {}
+    for seg in segments:
+        by_year.setdefault(seg[2], []).append(seg)
+        by_month.setdefault(seg[3], []).append(seg)
+
+    base = INDEX_FIRST.toordinal()
+    _day_ref = base - GANZHI_INDEX[get_day_pillar(INDEX_FIRST)]
+    _hour_ganzhi = [[GANZHI_INDEX[get_hour_pillar(g, h)] for h in range(24)] for g in range(5)]
+    _segments, _by_year, _by_month = segments, by_year, by_month
+
+
+def parse_pillar(pattern):
+    """
+    간지 패턴 → 허용되는 60갑자 번호 집합
+    '庚午' / '경오' (전체), '?寅' / '?인' (지지만), '甲?' (천간만), '?' 또는 None (전부)
+    """
+    if pattern in (None, '', '?', '??'):
+        return set(range(60))
+    if len(pattern) != 2:
+        raise ValueError(f'간지 패턴은 두 글자여야 합니다: {pattern}')
+
+    def lookup(ch, hanja, hangul, kind):
+        if ch == '?':
+            return None
+        for table in (hanja, hangul):
+            if ch in table:
+                return table.index(ch)
+        raise ValueError(f'알 수 없는 {kind}: {ch}')
+
+    gan = lookup(pattern[0], CHEONGAN, CHEONGAN_KR, '천간')
+    ji = lookup(pattern[1], JIJI, JIJI_KR, '지지')
+    return {k for k, (g, j) in enumerate(GANZHI)
+            if (gan is None or g == gan) and (ji is None or j == ji)}
+
+
+def _hour_runs(hours):
+    """허용 시(0~23) 목록 → 연속 구간 [(시작, 끝)]"""
+    runs = []
+    for h in hours:
+        if runs and runs[-1][1] == h:
+            runs[-1][1] = h + 1
+        else:
+            runs.append([h, h + 1])
+    return runs
+
+
+def find_birth_slots(year=None, month=None, day=None, hour=None):
+    """
+    조건에 맞는 출생 시각을 시 슬롯 구간 [(시작, 끝)] 으로 반환 (끝은 미포함)
+    각 인자는 parse_pillar 패턴
+    """
+    if _segments is None:
+        _build()
+
+    years, months = parse_pillar(year), parse_pillar(month)
+    days, hours = parse_pillar(day), parse_pillar(hour)
+
+    # 년주/월주 중 더 좁은 쪽 색인으로 후보 구간 선택
+    if len(years) <= len(months):
+        candidates = [s for k in sorted(years) for s in _by_year.get(k, ())]
+    else:
+        candidates = [s for k in sorted(months) for s in _by_month.get(k, ())]
+    candidates = sorted(s for s in candidates if s[2] in years and s[3] in months)
+
+    # 일주 번호별 허용 시간 구간 (시주는 일간 묶음과 시지로 결정)
+    day_runs = {}
+    for k in days:
+        runs = _hour_runs([h for h in range(24) if _hour_ganzhi[GANZHI[k][0] % 5][h] in hours])
+        if runs:
+            day_runs[k] = runs
+
+    found = []
+    for start, end, _, _ in candidates:
+        first_day, last_day = start // 24, (end - 1) // 24
+        for k, runs in day_runs.items():
+            o = first_day + (k - (first_day - _day_ref)) % 60
+            while o <= last_day:
+                for h0, h1 in runs:
+                    lo, hi = max(o * 24 + h0, start), min(o * 24 + h1, end)
+                    if lo < hi:
+                        found.append((lo, hi))
+                o += 60
+
+    found.sort()
+    merged = []
+    for lo, hi in found:
+        if merged and merged[-1][1] >= lo:
+            merged[-1][1] = max(merged[-1][1], hi)
+        else:
+            merged.append([lo, hi])
+    return [(lo, hi) for lo, hi in merged]
+
+
+def slot_to_datetime(slot):
+    return datetime.fromordinal(slot // 24) + timedelta(hours=slot % 24)
+
+
+def find_birth_ranges(year=None, month=None, day=None, hour=None):
+    """조건에 맞는 출생 일시 구간 [(시작 datetime, 끝 datetime)] (끝은 미포함)"""
+    return [(slot_to_datetime(lo), slot_to_datetime(hi))
+            for lo, hi in find_birth_slots(year, month, day, hour)]
+
+
+if __name__ == '__main__':
+    import sys
+    import time
+    args = (sys.argv[1:] + [None] * 4)[:4]
+    t = time.perf_counter()
+    ranges = find_birth_ranges(*args)
+    elapsed = (time.perf_counter() - t) * 1000
+    for lo, hi in ranges:
+        print(f'{lo:%Y-%m-%d %H:%M} ~ {hi:%Y-%m-%d %H:%M}')
+    print(f'{len(ranges)}개 구간, {elapsed:.1f}ms')
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+워커 간 공유 토큰 버킷 (Gemini 모델별 분당 호출 한도)
+- 버킷 상태(남은 토큰, 갱신 시각)를 SQLite 에 두고 BEGIN IMMEDIATE 로 원자적으로 차감
+  → 모든 gunicorn 워커·작업 스레드가 같은 한도를 나눠 씀
+- acquire(model, timeout): 토큰이 생길 때까지 최대 timeout 초 대기 (0 이면 즉시 실패)
+- 429 를 받으면 drain(model) 로 버킷을 비워 다른 워커도 함께 물러나게 함
+
+한도 설정 (분당 호출 수):
+    GEMINI_RPM=15                                   # 모든 모델 기본값
+    GEMINI_RPM_LIMITS=gemini-2.5-flash=10,gemini-2.0-flash-lite=30
+"""
+
+import os
+import sqlite3
+import threading
+import time
+
+RATE_LIMIT_PATH = os.environ.get(
+    'RATE_LIMIT_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'rate_limit.sqlite3'))
+DEFAULT_RPM = float(os.environ.get('GEMINI_RPM', 15))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS buckets (
+    name TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    updated REAL NOT NULL
+);
+"""
+
+
+def parse_limits(text):
+    """'모델=분당호출수,...' → dict"""
+    limits = {}
+    for item in (text or '').split(','):
+        if '=' in item:
+            name, rpm = item.split('=', 1)
+            limits[name.strip()] = float(rpm)
+    return limits
+
+
+class TokenBucketLimiter:
+    """이름(모델)별 토큰 버킷 - 용량 = 분당 호출 수, 초당 rpm/60 개씩 충전"""
+
+    def __init__(self, path=RATE_LIMIT_PATH, default_rpm=DEFAULT_RPM, limits=None):
+        self.path = path
+        self.default_rpm = default_rpm
+        self.limits = limits or {}
+        self._local = threading.local()
+
+    def _connect(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+        conn = sqlite3.connect(self.path, timeout=10, isolation_level=None, check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.executescript(_SCHEMA)
+        self._local.conn, self._local.pid = conn, os.getpid()
+        return conn
+
+    def rpm(self, name):
+        return self.limits.get(name, self.default_rpm)
+
+    def _take(self, name, take):
+        """
+        충전 후 토큰 1개 차감 시도 (take=False 면 조회만)
+        반환: (성공 여부, 남은 토큰, 다음 토큰까지 대기 초)
+        """
+        rate = self.rpm(name) / 60.0
+        capacity = self.rpm(name)
+        conn = self._connect()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            now = time.time()  # 잠금을 얻은 뒤의 시각 (앞선 갱신 시각보다 과거가 되지 않도록)
+            row = conn.execute('SELECT tokens, updated FROM buckets WHERE name = ?', (name,)).fetchone()
+            tokens = capacity if row is None else min(capacity, row[0] + max(0.0, now - row[1]) * rate)
+            ok = take and tokens >= 1
+            if ok:
+                tokens -= 1
+            conn.execute('INSERT OR REPLACE INTO buckets (name, tokens, updated) VALUES (?, ?, ?)',
+                         (name, tokens, now))
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        wait = 0.0 if tokens >= 1 else (1 - tokens) / rate
+        return ok, tokens, wait
+
+    def acquire(self, name, timeout=0.0):
+        """토큰 1개 획득 - timeout 초 안에 못 얻으면 False (DB 오류 시에는 제한 없이 통과)"""
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                ok, _, wait = self._take(name, True)
+            except sqlite3.Error as e:
+                print(f"[한도] 버킷 오류: {e}")
+                return True
+            if ok:
+                return True
+            remaining = deadline - time.monotonic()
+            if wait > remaining:
+                return False
+            time.sleep(wait)
+
+    def headroom(self, name):
+        """지금 바로 쓸 수 있는 토큰 수 (소수점 포함)"""
+        try:
+            return self._take(name, False)[1]
+        except sqlite3.Error:
+            return float(self.rpm(name))
+
+    def drain(self, name):
+        """서버가 429 를 돌려줬을 때: 버킷을 비워 모든 워커가 충전 시간만큼 물러남"""
+        try:
+            self._connect().execute('INSERT OR REPLACE INTO buckets (name, tokens, updated) VALUES (?, 0, ?)',
+                                    (name, time.time()))
+        except sqlite3.Error as e:
+            print(f"[한도] 버킷 오류: {e}")
+
+    def stats(self, names):
+        return {name: {'rpm': self.rpm(name), 'available': round(self.headroom(name), 2)} for name in names}
+
+
+GEMINI_LIMITER = TokenBucketLimiter(limits=parse_limits(os.environ.get('GEMINI_RPM_LIMITS')))
@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+"""
+사주 일괄 계산 엔진 (NumPy 벡터화)
+- 고객 전체 재채점용: 생년월일시 컬럼 배열을 받아 한 번에 사주 원국 산출
+- 결과는 정수 코드로 된 구조화 배열(structured array), 문자열은 필요할 때만 렌더링
+- 계산 규칙은 saju_engine.analyze_saju 와 동일 (같은 테이블을 그대로 사용)
+"""
+
+import numpy as np
+
+from saju_engine import (
+    CHEONGAN, CHEONGAN_KR, JIJI, JIJI_KR, CHEONGAN_OHAENG, CHEONGAN_EUMYANG, JIJI_OHAENG,
+    OHAENG_NAME, SIPSIN_NAME,
+    JEOLGI_DATES, JEOL_MINUTES, JEOL_BASE,
+    LUNAR_FIRST_YEAR, LUNAR_LAST_YEAR, LUNAR_YEAR_FIRST_MONTH, LUNAR_LEAP_MONTH,
+    LUNAR_MONTH_START, lunar_to_solar,
+    CHEONGAN_HAP, CHEONGAN_CHUNG, JIJI_YUKHAP, JIJI_CHUNG, JIJI_HYUNG,
+    GAN_PAIRS, JI_PAIRS, PILLAR_JI_NAMES, SINSAL_NAMES,
+    SIPSIN_TABLE, JIJI_BONGI, GAN_REL, JI_REL, SAMHAP_MASKS, SINSAL_TARGETS,
+    REL_HAP, REL_YUKHAP, REL_CHUNG, REL_HYUNG, REL_GWIMUN,
+)
+
+# ============================================================
+# 1. 결과 레이아웃
+# ============================================================
+
+# gan/ji: [년, 월, 일, 시]
+# sipsin: [년간, 월간, 일간, 시간, 년지, 월지, 일지, 시지] (SIPSIN_NAME 번호, 일간 자리는 -1)
+# gan_rel: 천간 6쌍 × (합, 충) 비트
+# ji_rel: 지지 6쌍 × (육합, 충, 형) 비트 + 삼합 4비트
+# sinsal: (도화, 역마, 화개) × (년지, 월지, 시지) 비트 + 귀문관살 6쌍 비트
+SAJU_BATCH_DTYPE = np.dtype([
+    ('solar_year', '<i2'), ('solar_month', 'u1'), ('solar_day', 'u1'),
+    ('gan', 'u1', (4,)), ('ji', 'u1', (4,)),
+    ('ohaeng', 'u1', (5,)),
+    ('sipsin', 'i1', (8,)),
+    ('gan_rel', '<u2'), ('ji_rel', '<u4'), ('sinsal', '<u2'),
+    ('strong', '?'), ('yongsin', 'u1'),
+    ('daeun_forward', '?'), ('daeun_start_age', 'u1'),
+])
+
+PILLAR_PAIRS = [(i, j) for i, j, _ in GAN_PAIRS]
+GAN_PAIR_NAMES = [name for _, _, name in GAN_PAIRS]
+JI_PAIR_NAMES = [name for _, _, name in JI_PAIRS]
+SINSAL_POSITIONS = [0, 1, 3]  # 일지 기준 신살은 일지 자신을 제외
+SAMHAP_BIT = 18
+
+# ============================================================
+# 2. 조회 테이블 (임포트 시 한 번 생성)
+# ============================================================
+
+_JEOL_MINUTES = np.array(JEOL_MINUTES, dtype=np.int64)
+# 범위 밖 근사용: 소한(0)~대설(11)의 (월*100+일)
+_JEOL_APPROX_MD = np.array([m * 100 + d for m, d in (JEOLGI_DATES[k or 12] for k in range(12))])
+
+_LUNAR_YEAR_FIRST_MONTH = np.frombuffer(LUNAR_YEAR_FIRST_MONTH, dtype=np.uint16).astype(np.int64)
+_LUNAR_LEAP_MONTH = np.frombuffer(LUNAR_LEAP_MONTH, dtype=np.uint8).astype(np.int64)
+_LUNAR_MONTH_START = np.array(LUNAR_MONTH_START, dtype=np.int64)
+
+_GAN_OHAENG = np.array(CHEONGAN_OHAENG, dtype=np.uint8)
+_JI_OHAENG = np.array(JIJI_OHAENG, dtype=np.uint8)
+_GAN_EUMYANG = np.array(CHEONGAN_EUMYANG, dtype=np.uint8)
+
+# saju_engine 조회 커널을 그대로 배열화
+_SIPSIN = np.array(SIPSIN_TABLE, dtype=np.int8)
+_JI_BONGI = np.array(JIJI_BONGI, dtype=np.uint8)
+
+_GAN_REL = np.array(GAN_REL, dtype=np.uint8)
+_JI_REL = np.array(JI_REL, dtype=np.uint8)
+_GAN_HAP = (_GAN_REL & REL_HAP) > 0
+_GAN_CHUNG = (_GAN_REL & REL_CHUNG) > 0
+_JI_YUKHAP = (_JI_REL & REL_YUKHAP) > 0
+_JI_CHUNG = (_JI_REL & REL_CHUNG) > 0
+_JI_HYUNG = (_JI_REL & REL_HYUNG) > 0
+_GWIMUN = (_JI_REL & REL_GWIMUN) > 0
+
+_SAMHAP_MASKS = [mask for mask, _ in SAMHAP_MASKS]
+_SAMHAP_NAMES = [name for _, name in SAMHAP_MASKS]
+
+_SINSAL_TARGETS = [np.array(t, dtype=np.int8) for t in zip(*SINSAL_TARGETS)]
+
+_ORDINAL_1970 = 719163           # datetime(1970, 1, 1).toordinal()
+_DAY_PILLAR_REF = 711847         # datetime(1949, 12, 21).toordinal() = 甲子일
+
+# ============================================================
+# 3. 일괄 계산
+# ============================================================
+
+def _civil_to_ordinal(years, months, days):
+    """양력 (년, 월, 일) 배열 → 서수(ordinal). 없는 날짜는 ValueError"""
+    d64 = (years - 1970).astype('datetime64[Y]') + (months - 1).astype('timedelta64[M]')
+    d64 = d64.astype('datetime64[D]') + (days - 1).astype('timedelta64[D]')
+    bad = (months < 1) | (months > 12) | (days < 1) | (d64.astype('datetime64[M]') != (
+        (years - 1970) * 12 + months - 1).astype('datetime64[M]'))
+    if bad.any():
+        i = int(np.flatnonzero(bad)[0])
+        raise ValueError(f'{i}번째 행: 양력 {years[i]}년 {months[i]}월 {days[i]}일은 없는 날짜입니다.')
+    return d64.astype(np.int64) + _ORDINAL_1970
+
+
+def _lunar_to_ordinal(years, months, days, is_leap):
+    """음력 (년, 월, 일, 윤달) 배열 → 서수(ordinal). 변환 불가 날짜는 ValueError"""
+    early = years < LUNAR_FIRST_YEAR  # 색인 이전 → 행마다 lunar_to_solar (라이브러리)
+    bad = early | (years > LUNAR_LAST_YEAR) | (months < 1) | (months > 12)
+    y = np.where(bad, 0, years - LUNAR_FIRST_YEAR)
+    leap = _LUNAR_LEAP_MONTH[y]
+    bad |= is_leap & (leap != months)
+    idx = _LUNAR_YEAR_FIRST_MONTH[y] + months - 1 + ((leap > 0) & ((months > leap) | is_leap))
+    idx = np.where(bad, 0, idx)
+    start = _LUNAR_MONTH_START[idx]
+    bad |= (days < 1) | (days > _LUNAR_MONTH_START[idx + 1] - start)
+    ordinals = start + days - 1
+    for i in np.flatnonzero(early):
+        try:
+            ordinals[i] = lunar_to_solar(int(years[i]), int(months[i]), int(days[i]), bool(is_leap[i])).toordinal()
+            bad[i] = False
+        except ValueError:
+            pass
+    if bad.any():
+        i = int(np.flatnonzero(bad)[0])
+        leap_label = '윤' if is_leap[i] else ''
+        raise ValueError(f'{i}번째 행: 음력 {years[i]}년 {leap_label}{months[i]}월 {days[i]}일은 변환할 수 없습니다.')
+    return ordinals
+
+
+def analyze_saju_batch(years, months, days, hours, genders, is_lunar=False, is_leap_month=False):
+    """
+    사주를 일괄 분석합니다.
+
+    Args:
+        years, months, days, hours: 출생 연/월/일/시 배열 (길이 N)
+        genders: '남' 또는 '여' 배열
+        is_lunar: 음력 여부 (배열 또는 스칼라)
+        is_leap_month: 음력 윤달 여부 (배열 또는 스칼라)
+
+    Returns:
+        np.ndarray: SAJU_BATCH_DTYPE 구조화 배열 (길이 N)
+    """
+    years = np.asarray(years, dtype=np.int64)
+    months = np.asarray(months, dtype=np.int64)
+    days = np.asarray(days, dtype=np.int64)
+    hours = np.asarray(hours, dtype=np.int64)
+    n = len(years)
+    male = np.broadcast_to(np.asarray(genders) == '남', (n,))
+    is_lunar = np.broadcast_to(np.asarray(is_lunar, dtype=bool), (n,))
+    is_leap_month = np.broadcast_to(np.asarray(is_leap_month, dtype=bool), (n,))
+
+    if ((hours < 0) | (hours > 23)).any():
+        i = int(np.flatnonzero((hours < 0) | (hours > 23))[0])
+        raise ValueError(f'{i}번째 행: 출생 시 {hours[i]}는 0~23 범위를 벗어났습니다.')
+
+    # 음력→양력 변환 후 양력 (년, 월, 일) 복원
+    ordinal = np.empty(n, dtype=np.int64)
+    solar = ~is_lunar
+    if solar.any():
+        ordinal[solar] = _civil_to_ordinal(years[solar], months[solar], days[solar])
+    if is_lunar.any():
+        ordinal[is_lunar] = _lunar_to_ordinal(years[is_lunar], months[is_lunar],
+                                              days[is_lunar], is_leap_month[is_lunar])
+    d64 = (ordinal - _ORDINAL_1970).astype('datetime64[D]')
+    m64 = d64.astype('datetime64[M]')
+    s_year = m64.astype(np.int64) // 12 + 1970
+    s_month = m64.astype(np.int64) % 12 + 1
+    s_day = (d64 - m64.astype('datetime64[D]')).astype(np.int64) + 1
+
+    # 1. 사주 원국: 절기 테이블 bisect (범위 밖은 평균 절기일 근사)
+    i = np.searchsorted(_JEOL_MINUTES, ordinal * 1440 + hours * 60, side='right') - 1
+    in_table = (i >= 0) & (i < len(_JEOL_MINUTES) - 1)
+    approx = s_year * 12 + np.searchsorted(_JEOL_APPROX_MD, s_month * 100 + s_day, side='right') - 1
+    jeol_pos = np.where(in_table, JEOL_BASE + i, approx)
+
+    saju_year = (jeol_pos - 1) // 12
+    saju_month = jeol_pos % 12
+    saju_month[saju_month == 0] = 12
+
+    gan = np.empty((n, 4), dtype=np.int64)
+    ji = np.empty((n, 4), dtype=np.int64)
+    gan[:, 0] = (saju_year - 4) % 10
+    ji[:, 0] = (saju_year - 4) % 12
+    gan[:, 1] = (2 * (gan[:, 0] % 5) + 2 + saju_month - 1) % 10
+    ji[:, 1] = (saju_month + 1) % 12
+    ganzhi = (ordinal - _DAY_PILLAR_REF) % 60
+    gan[:, 2] = ganzhi % 10
+    ji[:, 2] = ganzhi % 12
+    ji[:, 3] = (hours + 1) // 2 % 12
+    gan[:, 3] = (2 * (gan[:, 2] % 5) + ji[:, 3]) % 10
+
+    out = np.zeros(n, dtype=SAJU_BATCH_DTYPE)
+    out['solar_year'] = s_year
+    out['solar_month'] = s_month
+    out['solar_day'] = s_day
+    out['gan'] = gan
+    out['ji'] = ji
+
+    # 2. 오행 분포
+    elements = np.concatenate([_GAN_OHAENG[gan], _JI_OHAENG[ji]], axis=1)
+    ohaeng = (elements[:, :, None] == np.arange(5)).sum(axis=1)
+    out['ohaeng'] = ohaeng
+
+    # 3. 십신 배치
+    ilgan = gan[:, 2]
+    sipsin = np.concatenate([_SIPSIN[ilgan[:, None], gan], _SIPSIN[ilgan[:, None], _JI_BONGI[ji]]], axis=1)
+    sipsin[:, 2] = -1
+    out['sipsin'] = sipsin
+
+    # 4. 합/충/형 비트마스크
+    gan_rel = np.zeros(n, dtype=np.uint16)
+    ji_rel = np.zeros(n, dtype=np.uint32)
+    for p, (a, b) in enumerate(PILLAR_PAIRS):
+        ga, gb, ja, jb = gan[:, a], gan[:, b], ji[:, a], ji[:, b]
+        gan_rel |= _GAN_HAP[ga, gb].astype(np.uint16) << (2 * p)
+        gan_rel |= _GAN_CHUNG[ga, gb].astype(np.uint16) << (2 * p + 1)
+        ji_rel |= _JI_YUKHAP[ja, jb].astype(np.uint32) << (3 * p)
+        ji_rel |= _JI_CHUNG[ja, jb].astype(np.uint32) << (3 * p + 1)
+        ji_rel |= _JI_HYUNG[ja, jb].astype(np.uint32) << (3 * p + 2)
+    ji_bits = np.bitwise_or.reduce(np.left_shift(1, ji), axis=1)
+    for k, mask in enumerate(_SAMHAP_MASKS):
+        ji_rel |= ((ji_bits & mask) == mask).astype(np.uint32) << (SAMHAP_BIT + k)
+    out['gan_rel'] = gan_rel
+    out['ji_rel'] = ji_rel
+
+    # 5. 신살 비트마스크
+    sinsal = np.zeros(n, dtype=np.uint16)
+    for s, targets in enumerate(_SINSAL_TARGETS):
+        target = targets[ji[:, 2]]
+        for q, pos in enumerate(SINSAL_POSITIONS):
+            sinsal |= (ji[:, pos] == target).astype(np.uint16) << (3 * s + q)
+    for p, (a, b) in enumerate(PILLAR_PAIRS):
+        sinsal |= _GWIMUN[ji[:, a], ji[:, b]].astype(np.uint16) << (9 + p)
+    out['sinsal'] = sinsal
+
+    # 6. 용신 (일간 + 인성 4 이상이면 신강 → 식상, 아니면 인성)
+    my = _GAN_OHAENG[ilgan].astype(np.int64)
+    rows = np.arange(n)
+    strong = ohaeng[rows, my] + ohaeng[rows, (my + 4) % 5] >= 4
+    out['strong'] = strong
+    out['yongsin'] = np.where(strong, (my + 1) % 5, (my + 4) % 5)
+
+    # 7. 대운 순행/역행 및 시작 나이 (calculate_daeun 과 동일한 간략식)
+    forward = (_GAN_EUMYANG[gan[:, 0]] == 0) == male
+    out['daeun_forward'] = forward
+    out['daeun_start_age'] = np.clip(np.where(forward, 30 - s_day, s_day) // 3, 1, 9)
+
+    return out
+
+# ============================================================
+# 4. 문자열 렌더링 (필요할 때만)
+# ============================================================
+
+PILLAR_KEYS = ['year', 'month', 'day', 'hour']
+SIPSIN_KEYS = ['year_gan', 'month_gan', 'day_gan', 'hour_gan', 'year_ji', 'month_ji', 'day_ji', 'hour_ji']
+
+
+def render_relations(row):
+    """비트마스크 → analyze_saju 의 relations 문자열 목록 (같은 순서)"""
+    gan, ji = row['gan'], row['ji']
+    gan_rel, ji_rel = int(row['gan_rel']), int(row['ji_rel'])
+    relations = []
+    for p, ((a, b), name) in enumerate(zip(PILLAR_PAIRS, GAN_PAIR_NAMES)):
+        pair = (int(gan[a]), int(gan[b]))
+        if gan_rel >> (2 * p) & 1:
+            relations.append(f'천간합: {name} - {CHEONGAN_HAP[pair]}')
+        if gan_rel >> (2 * p + 1) & 1:
+            relations.append(f'천간충: {name} - {CHEONGAN_CHUNG[pair]}')
+    for p, ((a, b), name) in enumerate(zip(PILLAR_PAIRS, JI_PAIR_NAMES)):
+        pair = (int(ji[a]), int(ji[b]))
+        if ji_rel >> (3 * p) & 1:
+            relations.append(f'지지육합: {name} - {JIJI_YUKHAP[pair]}')
+        if ji_rel >> (3 * p + 1) & 1:
+            relations.append(f'지지충: {name} - {JIJI_CHUNG[pair]}')
+        if ji_rel >> (3 * p + 2) & 1:
+            relations.append(f'지지형: {name} - {JIJI_HYUNG[pair]}')
+    for k, value in enumerate(_SAMHAP_NAMES):
+        if ji_rel >> (SAMHAP_BIT + k) & 1:
+            relations.append(f'지지삼합: {value}')
+    return relations
+
+
+def render_sinsal(row):
+    """비트마스크 → analyze_saju 의 sinsal 문자열 목록 (같은 순서)"""
+    sinsal = int(row['sinsal'])
+    result = []
+    for s, name in enumerate(SINSAL_NAMES):
+        for q, pos in enumerate(SINSAL_POSITIONS):
+            if sinsal >> (3 * s + q) & 1:
+                result.append(f'{name} - {PILLAR_JI_NAMES[pos]}')
+    for p, (a, b) in enumerate(PILLAR_PAIRS):
+        if sinsal >> (9 + p) & 1:
+            result.append(f'귀문관살(鬼門關殺) - {PILLAR_JI_NAMES[a]}/{PILLAR_JI_NAMES[b]}')
+    return result
+
+
+def render_row(row):
+    """구조화 배열의 한 행을 사람이 읽을 수 있는 dict 로 변환합니다."""
+    gan, ji = row['gan'], row['ji']
+    ohaeng = [int(v) for v in row['ohaeng']]
+    yongsin = int(row['yongsin'])
+    return {
+        'solar_date': f"{int(row['solar_year'])}-{int(row['solar_month']):02d}-{int(row['solar_day']):02d}",
+        'pillars': {k: f"{CHEONGAN_KR[gan[i]]}{JIJI_KR[ji[i]]}({CHEONGAN[gan[i]]}{JIJI[ji[i]]})"
+                    for i, k in enumerate(PILLAR_KEYS)},
+        'ohaeng': {OHAENG_NAME[i]: ohaeng[i] for i in range(5)},
+        'sipsin': {k: SIPSIN_NAME[c] if c >= 0 else '일주' for k, c in zip(SIPSIN_KEYS, row['sipsin'])},
+        'relations': render_relations(row),
+        'sinsal': render_sinsal(row),
+        'yongsin': {
+            'strength': '신강(身強)' if row['strong'] else '신약(身弱)',
+            'yongsin_ohaeng': OHAENG_NAME[yongsin],
+        },
+    }
@@ -6,9 +6,18 @@
 - 대운/세운 계산
 """
 
+from array import array
+from bisect import bisect_right
 from datetime import datetime, timedelta
 from korean_lunar_calendar import KoreanLunarCalendar
 import math
+import mmap
+import os
+import struct
+import zlib
+
+from jeolgi_data import JEOL_MINUTES, JEOL_FIRST_YEAR, JEOL_FIRST_INDEX
+from memo import LRUCache
 
 # ============================================================
 # 1. 기본 데이터: 천간(天干), 지지(地支), 오행(五行)
@@ -68,48 +77,41 @@ JIJANGGAN = {
 
 SIPSIN_NAME = ['비견', '겁재', '식신', '상관', '편재', '정재', '편관', '정관', '편인', '정인']
 
-def get_sipsin(ilgan_idx, target_idx):
-    """일간 기준으로 다른 천간과의 십신 관계를 구합니다."""
+# 오행 상생/상극 (0=목, 1=화, 2=토, 3=금, 4=수)
+SHENG_MAP = {0: 1, 1: 2, 2: 3, 3: 4, 4: 0}  # 목→화, 화→토...
+KE_MAP = {0: 2, 1: 3, 2: 4, 3: 0, 4: 1}     # 목→토, 화→금...
+
+def _sipsin_code(ilgan_idx, target_idx):
+    """일간과 대상 천간의 십신 번호 (SIPSIN_NAME 인덱스) - 조회 커널 생성용"""
     ilgan_ohaeng = CHEONGAN_OHAENG[ilgan_idx]
-    ilgan_eum = CHEONGAN_EUMYANG[ilgan_idx]
     target_ohaeng = CHEONGAN_OHAENG[target_idx]
-    target_eum = CHEONGAN_EUMYANG[target_idx]
-    
-    same_eum = (ilgan_eum == target_eum)
+    diff_eum = int(CHEONGAN_EUMYANG[ilgan_idx] != CHEONGAN_EUMYANG[target_idx])
     
     # 오행 관계 판단
     if ilgan_ohaeng == target_ohaeng:
-        return '비견' if same_eum else '겁재'
-    
+        return 0 + diff_eum   # 비견/겁재
     # 내가 생하는 것 (식상)
-    sheng_map = {0: 1, 1: 2, 2: 3, 3: 4, 4: 0}  # 목→화, 화→토...
-    if sheng_map[ilgan_ohaeng] == target_ohaeng:
-        return '식신' if same_eum else '상관'
-    
+    if SHENG_MAP[ilgan_ohaeng] == target_ohaeng:
+        return 2 + diff_eum   # 식신/상관
     # 내가 극하는 것 (재성)
-    ke_map = {0: 2, 1: 3, 2: 4, 3: 0, 4: 1}  # 목→토, 화→금...
-    if ke_map[ilgan_ohaeng] == target_ohaeng:
-        return '편재' if same_eum else '정재'
-    
+    if KE_MAP[ilgan_ohaeng] == target_ohaeng:
+        return 4 + diff_eum   # 편재/정재
     # 나를 극하는 것 (관성)
-    if ke_map[target_ohaeng] == ilgan_ohaeng:
-        return '편관' if same_eum else '정관'
-    
+    if KE_MAP[target_ohaeng] == ilgan_ohaeng:
+        return 6 + diff_eum   # 편관/정관
     # 나를 생하는 것 (인성)
-    if sheng_map[target_ohaeng] == ilgan_ohaeng:
-        return '편인' if same_eum else '정인'
-    
-    return '비견'
+    return 8 + diff_eum       # 편인/정인
+
+def get_sipsin(ilgan_idx, target_idx):
+    """일간 기준으로 다른 천간과의 십신 관계를 구합니다."""
+    return SIPSIN_NAME[SIPSIN_TABLE[ilgan_idx][target_idx]]
 
 def get_sipsin_for_jiji(ilgan_idx, jiji_char):
     """지지의 지장간 본기 기준으로 십신을 구합니다."""
-    jjg = JIJANGGAN.get(jiji_char, [])
-    if not jjg:
+    bongi_idx = JIJI_BONGI_BY_CHAR.get(jiji_char)
+    if bongi_idx is None:
         return '비견'
-    # 본기 (마지막 또는 가장 큰 비율)
-    bongi = jjg[-1][0]
-    bongi_idx = CHEONGAN.index(bongi)
-    return get_sipsin(ilgan_idx, bongi_idx)
+    return SIPSIN_NAME[SIPSIN_TABLE[ilgan_idx][bongi_idx]]
 
 # ============================================================
 # 4. 절기(節氣) 데이터 및 월주 계산
@@ -125,6 +127,7 @@ JEOLGI_MONTHS = {
 
 # 절기 대략적 날짜 (매년 약간씩 다름, 평균값 사용)
 # (월, 일) - 절기가 시작되는 대략적 날짜
+# ※ 1900~2100년은 jeolgi_data 의 실측 입기 시각을 쓰고, 이 값은 범위 밖 근사용
 JEOLGI_DATES = {
     1: (2, 4),    # 입춘 2/4
     2: (3, 6),    # 경칩 3/6
@@ -140,50 +143,147 @@ JEOLGI_DATES = {
     12: (1, 6),   # 소한 1/6 (다음해 기준이지만, 전년도 12월로 처리)
 }
 
-# 더 정확한 절기 계산 (태양 황경 기반 근사)
+# 절(節) 누적 순번 = 양력연도*12 + 절 순번(0=소한, 1=입춘, ... 11=대설)
+# JEOL_MINUTES[i] 는 누적 순번 JEOL_BASE + i 인 절의 입기 시각 (분 단위, 한국 상용시)
+JEOL_BASE = JEOL_FIRST_YEAR * 12 + JEOL_FIRST_INDEX
+
+
+def _jeol_position(solar_date):
+    """solar_date 시점에 이미 들어온 마지막 절(節)의 누적 순번"""
+    key = solar_date.toordinal() * 1440 + solar_date.hour * 60 + solar_date.minute
+    i = bisect_right(JEOL_MINUTES, key) - 1
+    if 0 <= i < len(JEOL_MINUTES) - 1:
+        return JEOL_BASE + i
+    
+    # 테이블 범위(1900~2100) 밖 → 평균 절기일로 근사
+    md = (solar_date.month, solar_date.day)
+    for k in range(11, -1, -1):
+        if md >= JEOLGI_DATES[k or 12]:
+            return solar_date.year * 12 + k
+    return solar_date.year * 12 - 1  # 소한 이전 → 전년도 대설
+
+
 def get_solar_term_date(year, month_idx):
-    """절기 시작 날짜를 좀 더 정확하게 계산합니다."""
-    base_dates = JEOLGI_DATES[month_idx]
-    # 기본 절기 날짜 반환 (더 정확한 계산을 위해서는 천문 데이터 필요)
-    m, d = base_dates
-    if month_idx == 12:
-        return datetime(year, m, d)
+    """year 년에 month_idx 월(인월=1 ~ 축월=12)을 여는 절기의 입기 시각"""
+    i = year * 12 + month_idx % 12 - JEOL_BASE
+    if 0 <= i < len(JEOL_MINUTES):
+        minutes = JEOL_MINUTES[i]
+        return datetime.fromordinal(minutes // 1440) + timedelta(minutes=minutes % 1440)
+    m, d = JEOLGI_DATES[month_idx]
     return datetime(year, m, d)
 
 def get_saju_month(solar_date):
     """양력 날짜로 사주의 월(인월=1월~축월=12월)을 구합니다."""
-    year = solar_date.year
-    month = solar_date.month
-    day = solar_date.day
-    
-    # 절기 경계 확인
-    # 소한(1/6) → 12월(축월)
-    # 입춘(2/4) → 1월(인월)
-    # 경칩(3/6) → 2월(묘월)
-    # ...
-    
-    boundaries = [
-        (1, 6, 12),   # 소한 이후 = 축월(12월)
-        (2, 4, 1),    # 입춘 이후 = 인월(1월)
-        (3, 6, 2),    # 경칩 이후 = 묘월(2월)
-        (4, 5, 3),    # 청명 이후 = 진월(3월)
-        (5, 6, 4),    # 입하 이후 = 사월(4월)
-        (6, 6, 5),    # 망종 이후 = 오월(5월)
-        (7, 7, 6),    # 소서 이후 = 미월(6월)
-        (8, 7, 7),    # 입추 이후 = 신월(7월)
-        (9, 8, 8),    # 백로 이후 = 유월(8월)
-        (10, 8, 9),   # 한로 이후 = 술월(9월)
-        (11, 7, 10),  # 입동 이후 = 해월(10월)
-        (12, 7, 11),  # 대설 이후 = 자월(11월)
-    ]
-    
-    saju_month = 12  # 기본값 (축월)
-    for bm, bd, sm in reversed(boundaries):
-        if month > bm or (month == bm and day >= bd):
-            saju_month = sm
-            break
-    
-    return saju_month
+    # 소한 이후 = 축월(12월), 입춘 이후 = 인월(1월), ... 대설 이후 = 자월(11월)
+    return _jeol_position(solar_date) % 12 or 12
+
+# ============================================================
+# 4-1. 음력↔양력 변환 색인
+# ============================================================
+
+# korean_lunar_calendar 의 연도별 비트 데이터를 임포트 시 한 번만 풀어서
+# 음력 월 단위 배열로 보관 → 변환은 배열 두어 번 읽기로 끝남
+# (array 는 버퍼 프로토콜을 지원하므로 numpy.frombuffer 로 일괄 변환에도 그대로 사용)
+# 색인 이전(음력 1000~1899년)은 드물어서 색인에 넣지 않고 라이브러리로 직접 변환
+LUNAR_FIRST_YEAR = 1900
+LUNAR_LAST_YEAR = 2050   # korean_lunar_calendar 지원 한계 (양력 2050-12-31)
+LUNAR_LIBRARY_FIRST_YEAR = KoreanLunarCalendar.KOREAN_LUNAR_BASE_YEAR  # 라이브러리 지원 시작 (음력 1000년)
+LUNAR_FIRST_NEW_YEAR = datetime(1900, 1, 31)  # 음력 1900년 1월 1일
+
+
+def _build_lunar_index():
+    ordinal = LUNAR_FIRST_NEW_YEAR.toordinal()
+    last_ordinal = datetime(LUNAR_LAST_YEAR, 12, 31).toordinal()
+    
+    year_first_month = array('H')  # 연도별 1월의 월 순번
+    leap_months = array('B')       # 연도별 윤달 (0=없음)
+    month_start = array('l')       # 월 순번별 초하루의 양력 서수(ordinal)
+    month_year = array('H')
+    month_num = array('B')
+    month_leap = array('B')
+    day_month = array('H')         # 양력 일자별 월 순번
+    
+    for year in range(LUNAR_FIRST_YEAR, LUNAR_LAST_YEAR + 1):
+        data = KoreanLunarCalendar.KOREAN_LUNAR_DATA[year - KoreanLunarCalendar.KOREAN_LUNAR_BASE_YEAR]
+        leap = (data >> 12) & 0x0F
+        year_first_month.append(len(month_start))
+        leap_months.append(leap)
+        
+        months = []
+        for m in range(1, 13):
+            months.append((m, 0, 30 if (data >> (12 - m)) & 0x01 else 29))
+            if m == leap:
+                months.append((m, 1, 30 if (data >> 16) & 0x01 else 29))
+        
+        for m, is_leap, days in months:
+            day_month.extend(array('H', [len(month_start)]) * days)
+            month_start.append(ordinal)
+            month_year.append(year)
+            month_num.append(m)
+            month_leap.append(is_leap)
+            ordinal += days
+    
+    month_start.append(ordinal)  # 마지막 달의 끝 (길이 계산용)
+    del day_month[last_ordinal - month_start[0] + 1:]
+    return (year_first_month, leap_months, month_start,
+            month_year, month_num, month_leap, day_month)
+
+
+(LUNAR_YEAR_FIRST_MONTH, LUNAR_LEAP_MONTH, LUNAR_MONTH_START,
+ LUNAR_MONTH_YEAR, LUNAR_MONTH_NUM, LUNAR_MONTH_LEAP, LUNAR_DAY_MONTH) = _build_lunar_index()
+
+SOLAR_ORDINAL_MIN = LUNAR_MONTH_START[0]
+SOLAR_ORDINAL_MAX = SOLAR_ORDINAL_MIN + len(LUNAR_DAY_MONTH) - 1
+
+
+def _library_lunar_to_solar(year, month, day, is_leap):
+    """색인 이전 음력 날짜를 korean_lunar_calendar 로 변환합니다. (없는 날짜는 ValueError)"""
+    data = KoreanLunarCalendar.KOREAN_LUNAR_DATA[year - LUNAR_LIBRARY_FIRST_YEAR]
+    if is_leap and (data >> 12) & 0x0F != month:
+        raise ValueError(f'음력 {year}년에는 윤{month}월이 없습니다.')
+    cal = KoreanLunarCalendar()
+    if not cal.setLunarDate(year, month, day, is_leap):
+        raise ValueError(f'음력 {year}년 {"윤" if is_leap else ""}{month}월에는 {day}일이 없습니다.')
+    return datetime(cal.solarYear, cal.solarMonth, cal.solarDay)
+
+
+def lunar_to_solar(year, month, day, is_leap=False):
+    """음력 날짜를 양력 datetime 으로 변환합니다. (범위 밖/없는 날짜는 ValueError)"""
+    if not LUNAR_LIBRARY_FIRST_YEAR <= year <= LUNAR_LAST_YEAR or not 1 <= month <= 12:
+        raise ValueError(f'음력 {year}년 {month}월은 변환 가능 범위'
+                         f'({LUNAR_LIBRARY_FIRST_YEAR}~{LUNAR_LAST_YEAR}년)를 벗어났습니다.')
+    if year < LUNAR_FIRST_YEAR:
+        return _library_lunar_to_solar(year, month, day, is_leap)
+    
+    y = year - LUNAR_FIRST_YEAR
+    leap = LUNAR_LEAP_MONTH[y]
+    if is_leap and leap != month:
+        raise ValueError(f'음력 {year}년에는 윤{month}월이 없습니다.')
+    
+    idx = LUNAR_YEAR_FIRST_MONTH[y] + month - 1 + (1 if leap and (month > leap or is_leap) else 0)
+    start = LUNAR_MONTH_START[idx]
+    if not 1 <= day <= LUNAR_MONTH_START[idx + 1] - start:
+        raise ValueError(f'음력 {year}년 {"윤" if is_leap else ""}{month}월에는 {day}일이 없습니다.')
+    
+    ordinal = start + day - 1
+    if ordinal > SOLAR_ORDINAL_MAX:
+        raise ValueError(f'음력 {year}년 {month}월 {day}일은 변환 가능 범위를 벗어났습니다.')
+    return datetime.fromordinal(ordinal)
+
+
+def solar_to_lunar(solar_date):
+    """양력 날짜를 음력 (년, 월, 일, 윤달여부) 로 변환합니다. 범위 밖이면 None"""
+    ordinal = solar_date.toordinal()
+    if ordinal < SOLAR_ORDINAL_MIN:  # 색인 이전 → 라이브러리 (지원 범위 밖이면 None)
+        cal = KoreanLunarCalendar()
+        if not cal.setSolarDate(solar_date.year, solar_date.month, solar_date.day):
+            return None
+        return cal.lunarYear, cal.lunarMonth, cal.lunarDay, bool(cal.isIntercalation)
+    if ordinal > SOLAR_ORDINAL_MAX:
+        return None
+    idx = LUNAR_DAY_MONTH[ordinal - SOLAR_ORDINAL_MIN]
+    return (LUNAR_MONTH_YEAR[idx], LUNAR_MONTH_NUM[idx],
+            ordinal - LUNAR_MONTH_START[idx] + 1, bool(LUNAR_MONTH_LEAP[idx]))
 
 # ============================================================
 # 5. 연주/월주/일주/시주 계산
@@ -191,13 +291,8 @@ def get_saju_month(solar_date):
 
 def get_year_pillar(solar_date):
     """연주(年柱) 계산 - 입춘 기준"""
-    year = solar_date.year
-    month = solar_date.month
-    day = solar_date.day
-    
-    # 입춘 이전이면 전년도로 계산
-    if month < 2 or (month == 2 and day < 4):
-        year -= 1
+    # 입춘 이전(소한 구간 포함)이면 전년도로 계산
+    year = (_jeol_position(solar_date) - 1) // 12
     
     # 천간: (year - 4) % 10
     gan_idx = (year - 4) % 10
@@ -260,46 +355,7 @@ def get_hour_pillar(day_gan_idx, birth_hour):
     # 01:00~03:00 = 丑시(1)
     # ...
     
-    hour_ji_map = [
-        (23, 1, 0),   # 子시
-        (1, 3, 1),    # 丑시
-        (3, 5, 2),    # 寅시
-        (5, 7, 3),    # 卯시
-        (7, 9, 4),    # 辰시
-        (9, 11, 5),   # 巳시
-        (11, 13, 6),  # 午시
-        (13, 15, 7),  # 未시
-        (15, 17, 8),  # 申시
-        (17, 19, 9),  # 酉시
-        (19, 21, 10), # 戌시
-        (21, 23, 11), # 亥시
-    ]
-    
-    hour_ji_idx = 0
-    if birth_hour >= 23 or birth_hour < 1:
-        hour_ji_idx = 0
-    elif birth_hour >= 1 and birth_hour < 3:
-        hour_ji_idx = 1
-    elif birth_hour >= 3 and birth_hour < 5:
-        hour_ji_idx = 2
-    elif birth_hour >= 5 and birth_hour < 7:
-        hour_ji_idx = 3
-    elif birth_hour >= 7 and birth_hour < 9:
-        hour_ji_idx = 4
-    elif birth_hour >= 9 and birth_hour < 11:
-        hour_ji_idx = 5
-    elif birth_hour >= 11 and birth_hour < 13:
-        hour_ji_idx = 6
-    elif birth_hour >= 13 and birth_hour < 15:
-        hour_ji_idx = 7
-    elif birth_hour >= 15 and birth_hour < 17:
-        hour_ji_idx = 8
-    elif birth_hour >= 17 and birth_hour < 19:
-        hour_ji_idx = 9
-    elif birth_hour >= 19 and birth_hour < 21:
-        hour_ji_idx = 10
-    else:
-        hour_ji_idx = 11
+    hour_ji_idx = HOUR_TO_JI[birth_hour] if 0 <= birth_hour < 24 else 0
     
     # 시간 산출 (일간 기준)
     day_gan_group = day_gan_idx % 5
@@ -309,6 +365,77 @@ def get_hour_pillar(day_gan_idx, birth_hour):
     
     return hour_gan_idx, hour_ji_idx
 
+# ============================================================
+# 5-1. 만세력 파일 (mmap)
+# ============================================================
+# tools/build_manseryeok.py 가 1900~2100년 하루당 고정 크기 레코드를 기록
+# 레코드: 일주·연주·월주 60갑자 번호(00:00 기준), 플래그, 그날 절입 시각(분),
+#         음력 연/월/일 (플래그 bit0 = 윤달, bit1 = 음력 정보 있음)
+# 절입 시각 이후는 월주 +1, 새 월지가 寅이면 연주도 +1
+# 양력→음력(lunar_info)도 레코드의 음력 필드로 (음력→양력은 양력 서수로 찾을 수 없어 계산)
+
+MANSERYEOK_PATH = os.environ.get(
+    'SAJU_MANSERYEOK_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'manseryeok.bin'))
+MANSERYEOK_MAGIC = b'MSRY'
+MANSERYEOK_VERSION = 1
+MANSERYEOK_HEADER = struct.Struct('<4sHHIII12x')   # 매직, 버전, 레코드 크기, 첫 서수, 일수, 절기 CRC
+MANSERYEOK_RECORD = struct.Struct('<BBBBHHBB')
+MANSERYEOK_NO_JEOL = 0xFFFF
+MANSERYEOK_LEAP = 1
+MANSERYEOK_HAS_LUNAR = 2
+
+def jeol_table_crc():
+    """절기 테이블 체크섬 (테이블을 다시 만들면 만세력 파일도 다시 만들어야 함)"""
+    return zlib.crc32(array('q', JEOL_MINUTES).tobytes())
+
+def _open_manseryeok(path=MANSERYEOK_PATH):
+    """만세력 파일을 읽기 전용 mmap 으로 열기 (없거나 절기 테이블과 맞지 않으면 None)"""
+    try:
+        with open(path, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None, 0, 0
+    if len(mm) < MANSERYEOK_HEADER.size:
+        mm.close()
+        return None, 0, 0
+    magic, version, record_size, first, count, crc = MANSERYEOK_HEADER.unpack_from(mm)
+    if (magic != MANSERYEOK_MAGIC or version != MANSERYEOK_VERSION
+            or record_size != MANSERYEOK_RECORD.size or crc != jeol_table_crc()
+            or len(mm) < MANSERYEOK_HEADER.size + count * record_size):
+        mm.close()
+        return None, 0, 0
+    return mm, first, count
+
+MANSERYEOK, MANSERYEOK_FIRST, MANSERYEOK_DAYS = _open_manseryeok()
+
+def read_manseryeok(solar_date):
+    """양력 날짜의 만세력 레코드 (파일이 없거나 범위 밖이면 None)"""
+    i = solar_date.toordinal() - MANSERYEOK_FIRST
+    if MANSERYEOK is None or not 0 <= i < MANSERYEOK_DAYS:
+        return None
+    return MANSERYEOK_RECORD.unpack_from(MANSERYEOK, MANSERYEOK_HEADER.size + i * MANSERYEOK_RECORD.size)
+
+def get_pillars_from_manseryeok(solar_date, hour):
+    """만세력 레코드로 (연간, 연지, 월간, 월지, 일간, 일지) 계산. 레코드가 없으면 None"""
+    record = read_manseryeok(solar_date)
+    if record is None:
+        return None
+    day_gz, year_gz, month_gz, _, jeol_minute = record[:5]
+    if hour * 60 >= jeol_minute:
+        month_gz = (month_gz + 1) % 60
+        if month_gz % 12 == 2:  # 입춘
+            year_gz = (year_gz + 1) % 60
+    return (year_gz % 10, year_gz % 12, month_gz % 10, month_gz % 12,
+            day_gz % 10, day_gz % 12)
+
+def get_lunar_from_manseryeok(solar_date):
+    """만세력 레코드로 음력 (년, 월, 일, 윤달여부). 레코드나 음력 정보가 없으면 None"""
+    record = read_manseryeok(solar_date)
+    if record is None or not record[3] & MANSERYEOK_HAS_LUNAR:
+        return None
+    return record[5], record[6], record[7], bool(record[3] & MANSERYEOK_LEAP)
+
 # ============================================================
 # 6. 합/충/형/파/해 관계
 # ============================================================
@@ -371,89 +498,149 @@ JIJI_HYUNG = {
     (9, 9): '유유 자형', (11, 11): '해해 자형',
 }
 
+GAN_PAIRS = [(0,1,'년간-월간'), (0,2,'년간-일간'), (0,3,'년간-시간'),
+             (1,2,'월간-일간'), (1,3,'월간-시간'), (2,3,'일간-시간')]
+JI_PAIRS = [(0,1,'년지-월지'), (0,2,'년지-일지'), (0,3,'년지-시지'),
+            (1,2,'월지-일지'), (1,3,'월지-시지'), (2,3,'일지-시지')]
+
+def get_relations(all_gan, all_ji):
+    """원국 천간/지지의 합·충·형 관계를 구합니다. (조회 커널 비트마스크 사용)"""
+    relations = []
+    
+    # 천간 합/충
+    for i, j, name in GAN_PAIRS:
+        pair = (all_gan[i], all_gan[j])
+        rel = GAN_REL[pair[0]][pair[1]]
+        if rel & REL_HAP:
+            relations.append(f'천간합: {name} - {CHEONGAN_HAP[pair]}')
+        if rel & REL_CHUNG:
+            relations.append(f'천간충: {name} - {CHEONGAN_CHUNG[pair]}')
+    
+    # 지지 합/충/형
+    for i, j, name in JI_PAIRS:
+        pair = (all_ji[i], all_ji[j])
+        rel = JI_REL[pair[0]][pair[1]]
+        if rel & REL_YUKHAP:
+            relations.append(f'지지육합: {name} - {JIJI_YUKHAP[pair]}')
+        if rel & REL_CHUNG:
+            relations.append(f'지지충: {name} - {JIJI_CHUNG[pair]}')
+        if rel & REL_HYUNG:
+            relations.append(f'지지형: {name} - {JIJI_HYUNG[pair]}')
+    
+    # 삼합 체크 (지지 존재 비트마스크)
+    ji_bits = (1 << all_ji[0]) | (1 << all_ji[1]) | (1 << all_ji[2]) | (1 << all_ji[3])
+    for mask, value in SAMHAP_MASKS:
+        if ji_bits & mask == mask:
+            relations.append(f'지지삼합: {value}')
+    
+    return relations
+
 # ============================================================
 # 7. 신살(神殺) 데이터
 # ============================================================
 
+# 도화살 (桃花殺) - 일지 기준
+# 인오술 → 卯, 사유축 → 午, 신자진 → 酉, 해묘미 → 子
+DOHUA_MAP = {
+    2: 3, 6: 3, 10: 3,   # 인오술 → 묘
+    5: 6, 9: 6, 1: 6,    # 사유축 → 오  (수정: 오가 맞음)
+    8: 9, 0: 9, 4: 9,    # 신자진 → 유
+    11: 0, 3: 0, 7: 0,   # 해묘미 → 자
+}
+
+# 역마살 (驛馬殺) - 일지 기준
+# 인오술 → 申, 사유축 → 亥, 신자진 → 寅, 해묘미 → 巳
+YEOKMA_MAP = {
+    2: 8, 6: 8, 10: 8,   # 인오술 → 신
+    5: 11, 9: 11, 1: 11,  # 사유축 → 해
+    8: 2, 0: 2, 4: 2,    # 신자진 → 인
+    11: 5, 3: 5, 7: 5,   # 해묘미 → 사
+}
+
+# 화개살 (華蓋殺) - 일지 기준
+# 인오술 → 戌, 사유축 → 丑, 신자진 → 辰, 해묘미 → 未
+HWAGAE_MAP = {
+    2: 10, 6: 10, 10: 10,  # 인오술 → 술
+    5: 1, 9: 1, 1: 1,      # 사유축 → 축
+    8: 4, 0: 4, 4: 4,      # 신자진 → 진
+    11: 7, 3: 7, 7: 7,     # 해묘미 → 미
+}
+
+# 귀문관살 (鬼門關殺)
+GWIMUN_PAIRS = [(0, 7), (1, 6), (2, 5), (3, 4),
+                (8, 11), (9, 10)]
+
+PILLAR_JI_NAMES = ['년지', '월지', '일지', '시지']
+SINSAL_NAMES = ['도화살(桃花殺)', '역마살(驛馬殺)', '화개살(華蓋殺)']
+
 def get_sinsal(year_ji, month_ji, day_ji, hour_ji):
     """주요 신살을 판단합니다."""
     sinsal_list = []
-    all_ji = [year_ji, month_ji, day_ji, hour_ji]
-    pillar_names = ['년지', '월지', '일지', '시지']
-    
-    # 도화살 (桃花殺) - 일지 기준
-    # 인오술 → 卯, 사유축 → 午, 신자진 → 酉, 해묘미 → 子
-    dohua_map = {
-        2: 3, 6: 3, 10: 3,   # 인오술 → 묘
-        5: 6, 9: 6, 1: 6,    # 사유축 → 오  (수정: 오가 맞음)
-        8: 9, 0: 9, 4: 9,    # 신자진 → 유
-        11: 0, 3: 0, 7: 0,   # 해묘미 → 자
-    }
-    # 수정: 도화살 정확한 매핑
-    dohua_map2 = {
-        2: 3, 6: 3, 10: 3,   # 寅午戌 → 卯
-        5: 0, 9: 0, 1: 0,    # 巳酉丑 → 午  
-        8: 9, 0: 9, 4: 9,    # 申子辰 → 酉
-        11: 6, 3: 6, 7: 6,   # 亥卯未 → 午
-    }
-    
-    dohua_target = dohua_map.get(day_ji)
-    if dohua_target is not None:
-        for i, ji in enumerate(all_ji):
-            if i != 2 and ji == dohua_target:
-                sinsal_list.append(f'도화살(桃花殺) - {pillar_names[i]}')
-    
-    # 역마살 (驛馬殺) - 일지 기준
-    # 인오술 → 申, 사유축 → 亥, 신자진 → 寅, 해묘미 → 巳
-    yeokma_map = {
-        2: 8, 6: 8, 10: 8,   # 인오술 → 신
-        5: 11, 9: 11, 1: 11,  # 사유축 → 해
-        8: 2, 0: 2, 4: 2,    # 신자진 → 인
-        11: 5, 3: 5, 7: 5,   # 해묘미 → 사
-    }
-    
-    yeokma_target = yeokma_map.get(day_ji)
-    if yeokma_target is not None:
-        for i, ji in enumerate(all_ji):
-            if i != 2 and ji == yeokma_target:
-                sinsal_list.append(f'역마살(驛馬殺) - {pillar_names[i]}')
-    
-    # 화개살 (華蓋殺) - 일지 기준  
-    # 인오술 → 戌, 사유축 → 丑, 신자진 → 辰, 해묘미 → 未
-    hwagae_map = {
-        2: 10, 6: 10, 10: 10,  # 인오술 → 술
-        5: 1, 9: 1, 1: 1,      # 사유축 → 축
-        8: 4, 0: 4, 4: 4,      # 신자진 → 진
-        11: 7, 3: 7, 7: 7,     # 해묘미 → 미
-    }
+    all_ji = (year_ji, month_ji, day_ji, hour_ji)
     
-    hwagae_target = hwagae_map.get(day_ji)
-    if hwagae_target is not None:
-        for i, ji in enumerate(all_ji):
-            if i != 2 and ji == hwagae_target:
-                sinsal_list.append(f'화개살(華蓋殺) - {pillar_names[i]}')
+    # 일지 기준 신살 (도화살/역마살/화개살) - 일지 자신은 제외
+    for name, target in zip(SINSAL_NAMES, SINSAL_TARGETS[day_ji]):
+        for i in (0, 1, 3):
+            if all_ji[i] == target:
+                sinsal_list.append(f'{name} - {PILLAR_JI_NAMES[i]}')
     
     # 귀문관살 (鬼門關殺)
-    gwimun_pairs = [(0, 7), (1, 6), (2, 5), (3, 4),
-                    (8, 11), (9, 10)]
-    for i in range(4):
-        for j in range(i+1, 4):
-            pair = (all_ji[i], all_ji[j])
-            rpair = (all_ji[j], all_ji[i])
-            for gp in gwimun_pairs:
-                if pair == gp or rpair == gp:
-                    sinsal_list.append(f'귀문관살(鬼門關殺) - {pillar_names[i]}/{pillar_names[j]}')
+    for i, j, _ in JI_PAIRS:
+        if JI_REL[all_ji[i]][all_ji[j]] & REL_GWIMUN:
+            sinsal_list.append(f'귀문관살(鬼門關殺) - {PILLAR_JI_NAMES[i]}/{PILLAR_JI_NAMES[j]}')
     
     # 천을귀인 (天乙貴人) - 일간 기준은 별도 처리
     
     return sinsal_list
 
+# ============================================================
+# 7-1. 십신/관계 조회 커널 (임포트 시 한 번 생성)
+# ============================================================
+
+# 십신: [일간][천간] → SIPSIN_NAME 번호
+SIPSIN_TABLE = tuple(tuple(_sipsin_code(i, j) for j in range(10)) for i in range(10))
+
+# 지지 본기(지장간 마지막 글자)의 천간 번호
+JIJI_BONGI = tuple(CHEONGAN.index(JIJANGGAN[ji][-1][0]) for ji in JIJI)
+JIJI_BONGI_BY_CHAR = dict(zip(JIJI, JIJI_BONGI))
+
+# 십신: [일간][지지] → SIPSIN_NAME 번호
+SIPSIN_JI_TABLE = tuple(tuple(SIPSIN_TABLE[i][b] for b in JIJI_BONGI) for i in range(10))
+
+# 관계 비트
+REL_HAP = 1        # 천간합 / 지지육합
+REL_YUKHAP = 1
+REL_CHUNG = 2      # 천간충 / 지지충
+REL_HYUNG = 4      # 지지형
+REL_GWIMUN = 8     # 귀문관살
+
+def _rel_matrix(size, tables):
+    m = [[0] * size for _ in range(size)]
+    for bit, pairs in tables:
+        for a, b in pairs:
+            m[a][b] |= bit
+    return tuple(tuple(row) for row in m)
+
+# [천간][천간] → 합/충 비트,  [지지][지지] → 육합/충/형/귀문 비트
+GAN_REL = _rel_matrix(10, [(REL_HAP, CHEONGAN_HAP), (REL_CHUNG, CHEONGAN_CHUNG)])
+JI_REL = _rel_matrix(12, [(REL_YUKHAP, JIJI_YUKHAP), (REL_CHUNG, JIJI_CHUNG), (REL_HYUNG, JIJI_HYUNG),
+                          (REL_GWIMUN, GWIMUN_PAIRS + [(b, a) for a, b in GWIMUN_PAIRS])])
+
+# 삼합: (지지 비트마스크, 이름)
+SAMHAP_MASKS = tuple((sum(1 << j for j in key), value) for key, value in JIJI_SAMHAP.items())
+
+# 일지 → (도화, 역마, 화개) 대상 지지
+SINSAL_TARGETS = tuple((DOHUA_MAP[j], YEOKMA_MAP[j], HWAGAE_MAP[j]) for j in range(12))
+
+# 시(0~23) → 시지 (23~01시 子, 01~03시 丑 ...)
+HOUR_TO_JI = tuple((h + 1) // 2 % 12 for h in range(24))
+
 # ============================================================
 # 8. 대운(大運) 계산
 # ============================================================
 
-def calculate_daeun(year_gan, year_ji, month_gan, month_ji, solar_date, gender):
-    """대운을 계산합니다."""
+def get_daeun_start(year_gan, solar_date, gender):
+    """대운 순행 여부와 시작 나이를 구합니다."""
     # 순행/역행 결정
     # 양남음녀 → 순행, 음남양녀 → 역행
     year_eum = CHEONGAN_EUMYANG[year_gan]
@@ -465,7 +652,6 @@ def calculate_daeun(year_gan, year_ji, month_gan, month_ji, solar_date, gender):
     
     # 대운 시작 나이 계산 (간략화)
     # 실제로는 생일~다음/이전 절기까지 일수를 3으로 나눈 값
-    month_num = solar_date.month
     day_num = solar_date.day
     
     # 간략 계산: 대운 시작 나이 (평균적으로 1~9세)
@@ -478,18 +664,22 @@ def calculate_daeun(year_gan, year_ji, month_gan, month_ji, solar_date, gender):
         passed_days = day_num
         start_age = max(1, min(9, passed_days // 3))
     
+    return forward, start_age
+
+def get_daeun_pillar(month_gan, month_ji, forward, i):
+    """i번째(0부터) 대운의 간지 - 월주에서 순행/역행으로 한 칸씩"""
+    step = i + 1 if forward else -(i + 1)
+    return (month_gan + step) % 10, (month_ji + step) % 12
+
+def calculate_daeun(year_gan, year_ji, month_gan, month_ji, solar_date, gender):
+    """대운을 계산합니다."""
+    forward, start_age = get_daeun_start(year_gan, solar_date, gender)
+    
     # 대운 배열 생성 (10개)
     daeun_list = []
-    current_gan = month_gan
-    current_ji = month_ji
     
     for i in range(10):
-        if forward:
-            current_gan = (month_gan + i + 1) % 10
-            current_ji = (month_ji + i + 1) % 12
-        else:
-            current_gan = (month_gan - i - 1) % 10
-            current_ji = (month_ji - i - 1) % 12
+        current_gan, current_ji = get_daeun_pillar(month_gan, month_ji, forward, i)
         
         age = start_age + (i * 10)
         year = solar_date.year + age
@@ -503,7 +693,7 @@ def calculate_daeun(year_gan, year_ji, month_gan, month_ji, solar_date, gender):
             'ji_char': JIJI[current_ji],
             'gan_kr': CHEONGAN_KR[current_gan],
             'ji_kr': JIJI_KR[current_ji],
-            'label': f"{CHEONGAN_KR[current_gan]}{JIJI_KR[current_ji]}({CHEONGAN[current_gan]}{JIJI[current_ji]})",
+            'label': pillar_label(current_gan, current_ji),
         })
     
     return start_age, daeun_list
@@ -550,12 +740,244 @@ def determine_yongsin(ilgan_idx, ohaeng_count):
     }
 
 # ============================================================
-# 10. 메인 사주 분석 함수
+# 10. 사주 명식 객체
 # ============================================================
 
-def analyze_saju(year, month, day, hour, gender, is_lunar=False):
+PILLAR_KEYS = ['year', 'month', 'day', 'hour']
+
+# 시간대 이름
+HOUR_JI_NAMES = ['자시(23~01시)', '축시(01~03시)', '인시(03~05시)', '묘시(05~07시)',
+                 '진시(07~09시)', '사시(09~11시)', '오시(11~13시)', '미시(13~15시)',
+                 '신시(15~17시)', '유시(17~19시)', '술시(19~21시)', '해시(21~23시)']
+
+# 명식 본문(input 제외) 렌더링 결과 캐시 - SajuChart.cache_key 기준
+CHART_CACHE = LRUCache(maxsize=int(os.environ.get('SAJU_CHART_CACHE_SIZE', 4096)))
+
+def pillar_label(gan, ji):
+    """간지 표기 - 예: 경오(庚午)"""
+    return f"{CHEONGAN_KR[gan]}{JIJI_KR[ji]}({CHEONGAN[gan]}{JIJI[ji]})"
+
+def pillar_dict(gan, ji):
+    return {
+        'gan': CHEONGAN[gan], 'ji': JIJI[ji],
+        'gan_kr': CHEONGAN_KR[gan], 'ji_kr': JIJI_KR[ji],
+        'gan_idx': gan, 'ji_idx': ji,
+        'gan_ohaeng': OHAENG_KR[CHEONGAN_OHAENG[gan]],
+        'ji_ohaeng': OHAENG_KR[JIJI_OHAENG[ji]],
+        'label': pillar_label(gan, ji),
+    }
+
+
+class SajuChart:
+    """
+    사주 명식 (정수 코드만 보관)
+    - 입력값과 8글자 인덱스, 오행 개수만 슬롯에 저장
+    - 라벨/dict 는 속성 접근 시 렌더링, to_dict() 는 analyze_saju 결과와 동일
+    - input 을 제외한 본문은 cache_key 가 같으면 동일하므로 CHART_CACHE 에서 재사용
     """
-    사주를 분석합니다.
+    
+    __slots__ = (
+        'year', 'month', 'day', 'hour', 'gender', 'is_lunar', 'is_leap_month',
+        'solar_ordinal', 'current_year',
+        'year_gan', 'year_ji', 'month_gan', 'month_ji',
+        'day_gan', 'day_ji', 'hour_gan', 'hour_ji',
+        'ohaeng_values', '_relations', '_sinsal',
+    )
+    
+    def __init__(self, year, month, day, hour, gender, is_lunar, is_leap_month,
+                 solar_date, gans, jis, current_year):
+        self.year, self.month, self.day, self.hour = year, month, day, hour
+        self.gender = gender
+        self.is_lunar = is_lunar
+        self.is_leap_month = is_leap_month
+        self.solar_ordinal = solar_date.toordinal()
+        self.current_year = current_year
+        self.year_gan, self.month_gan, self.day_gan, self.hour_gan = gans
+        self.year_ji, self.month_ji, self.day_ji, self.hour_ji = jis
+        
+        ohaeng_count = [0, 0, 0, 0, 0]  # 목, 화, 토, 금, 수
+        for g in gans:
+            ohaeng_count[CHEONGAN_OHAENG[g]] += 1
+        for j in jis:
+            ohaeng_count[JIJI_OHAENG[j]] += 1
+        self.ohaeng_values = tuple(ohaeng_count)
+        
+        self._relations = None
+        self._sinsal = None
+    
+    # ---- 정수 코드 ----
+    
+    @property
+    def gans(self):
+        return (self.year_gan, self.month_gan, self.day_gan, self.hour_gan)
+    
+    @property
+    def jis(self):
+        return (self.year_ji, self.month_ji, self.day_ji, self.hour_ji)
+    
+    @property
+    def solar_date(self):
+        return datetime.fromordinal(self.solar_ordinal)
+    
+    @property
+    def cache_key(self):
+        """
+        본문을 결정하는 정규화 키
+        - 양력 날짜 → 일주·대운, 년지/월지 → 절입 전후, 시지 → 시주
+        - 원시 입력(음력 여부, 정확한 시각)은 input 에만 쓰이므로 제외
+        """
+        return (self.solar_ordinal, self.year_ji, self.month_ji, self.hour_ji,
+                self.gender, self.current_year)
+    
+    @property
+    def current_year_gan(self):
+        return (self.current_year - 4) % 10
+    
+    @property
+    def current_year_ji(self):
+        return (self.current_year - 4) % 12
+    
+    # ---- 렌더링 ----
+    
+    @property
+    def lunar_info(self):
+        solar = self.solar_date
+        if self.is_lunar:
+            leap_label = '윤' if self.is_leap_month else ''
+            return (f"음력 {self.year}년 {leap_label}{self.month}월 {self.day}일 → "
+                    f"양력 {solar.year}년 {solar.month}월 {solar.day}일")
+        # 만세력 파일이 있으면 오프셋 읽기 한 번 (파일 범위 밖·음력 정보 없음이면 계산)
+        lunar = get_lunar_from_manseryeok(solar) or solar_to_lunar(solar)
+        if not lunar:
+            return None
+        l_year, l_month, l_day, l_leap = lunar
+        leap_label = '윤' if l_leap else ''
+        return f"양력 {self.year}년 {self.month}월 {self.day}일 → 음력 {l_year}년 {leap_label}{l_month}월 {l_day}일"
+    
+    @property
+    def hour_name(self):
+        return HOUR_JI_NAMES[self.hour_ji]
+    
+    @property
+    def zodiac(self):
+        return ZODIAC_ANIMALS[self.year_ji]
+    
+    @property
+    def ilgan_ohaeng(self):
+        return OHAENG_NAME[CHEONGAN_OHAENG[self.day_gan]]
+    
+    @property
+    def input(self):
+        return {
+            'year': self.year, 'month': self.month, 'day': self.day,
+            'hour': self.hour, 'gender': self.gender, 'is_lunar': self.is_lunar,
+            'lunar_info': self.lunar_info,
+            'hour_name': self.hour_name,
+        }
+    
+    @property
+    def pillars(self):
+        return {key: pillar_dict(g, j) for key, g, j in zip(PILLAR_KEYS, self.gans, self.jis)}
+    
+    @property
+    def ohaeng(self):
+        values = list(self.ohaeng_values)
+        return {
+            'count': {OHAENG_NAME[i]: values[i] for i in range(5)},
+            'dominant': OHAENG_NAME[values.index(max(values))],
+            'weak': OHAENG_NAME[values.index(min(values))],
+            'values': values,
+        }
+    
+    @property
+    def sipsin(self):
+        ilgan = self.day_gan
+        return {
+            'year_gan': get_sipsin(ilgan, self.year_gan),
+            'month_gan': get_sipsin(ilgan, self.month_gan),
+            'day_gan': '일주',
+            'hour_gan': get_sipsin(ilgan, self.hour_gan),
+            'year_ji': get_sipsin_for_jiji(ilgan, JIJI[self.year_ji]),
+            'month_ji': get_sipsin_for_jiji(ilgan, JIJI[self.month_ji]),
+            'day_ji': get_sipsin_for_jiji(ilgan, JIJI[self.day_ji]),
+            'hour_ji': get_sipsin_for_jiji(ilgan, JIJI[self.hour_ji]),
+        }
+    
+    @property
+    def relations(self):
+        if self._relations is None:
+            self._relations = get_relations(self.gans, self.jis)
+        return self._relations
+    
+    @property
+    def sinsal(self):
+        if self._sinsal is None:
+            self._sinsal = get_sinsal(*self.jis)
+        return self._sinsal
+    
+    @property
+    def yongsin(self):
+        return determine_yongsin(self.day_gan, list(self.ohaeng_values))
+    
+    @property
+    def daeun(self):
+        start_age, daeun_list = calculate_daeun(self.year_gan, self.year_ji, self.month_gan, self.month_ji,
+                                                self.solar_date, self.gender)
+        return {
+            'start_age': start_age,
+            'list': daeun_list,
+        }
+    
+    @property
+    def current_year_info(self):
+        gan, ji = self.current_year_gan, self.current_year_ji
+        return {
+            'year': self.current_year,
+            'gan': CHEONGAN[gan],
+            'ji': JIJI[ji],
+            'gan_kr': CHEONGAN_KR[gan],
+            'ji_kr': JIJI_KR[ji],
+            'label': f"{self.current_year}년 {pillar_label(gan, ji)}",
+        }
+    
+    @property
+    def jijanggan(self):
+        jijanggan_info = {}
+        for pillar_name, ji_idx in zip(PILLAR_JI_NAMES, self.jis):
+            jjg = JIJANGGAN.get(JIJI[ji_idx], [])
+            jijanggan_info[pillar_name] = [(CHEONGAN_KR[CHEONGAN.index(g)], g, days) for g, days in jjg]
+        return jijanggan_info
+    
+    def to_dict(self):
+        """
+        API 응답용 dict (analyze_saju 반환값과 동일한 구조/순서)
+        input 이외의 값은 캐시와 공유되므로 최상위 키 추가만 허용 (내부 수정 금지)
+        """
+        body = CHART_CACHE.get_or_compute(self.cache_key, self._render_body)
+        return {'input': self.input, **body}
+    
+    def _render_body(self):
+        return {
+            'pillars': self.pillars,
+            'ohaeng': self.ohaeng,
+            'sipsin': self.sipsin,
+            'relations': list(self.relations),
+            'sinsal': list(self.sinsal),
+            'yongsin': self.yongsin,
+            'daeun': self.daeun,
+            'current_year': self.current_year_info,
+            'zodiac': self.zodiac,
+            'jijanggan': self.jijanggan,
+            'ilgan_ohaeng': self.ilgan_ohaeng,
+        }
+
+# ============================================================
+# 11. 메인 사주 분석 함수
+# ============================================================
+
+def get_saju_chart(year, month, day, hour, gender, is_lunar=False, is_leap_month=False, as_of=None):
+    """
+    사주 원국을 계산해 SajuChart 로 돌려줍니다.
     
     Args:
         year: 출생 연도
@@ -564,199 +986,52 @@ def analyze_saju(year, month, day, hour, gender, is_lunar=False):
         hour: 출생 시 (0-23)
         gender: '남' 또는 '여'
         is_lunar: 음력 여부
+        is_leap_month: 음력 윤달 여부 (is_lunar 일 때만 사용)
+        as_of: 세운 기준 연도 (생략 시 올해)
     
     Returns:
-        dict: 사주 분석 결과
+        SajuChart: 사주 명식
     """
     
-    # 음력→양력 변환
-    solar_year, solar_month, solar_day = year, month, day
-    lunar_info = None
+    # 만세력 경로와 계산 경로가 같은 입력만 받도록 시각부터 검증 (일괄 엔진과 같은 범위)
+    if not 0 <= hour <= 23:
+        raise ValueError(f'출생 시 {hour}는 0~23 범위를 벗어났습니다.')
     
+    # 음력→양력 변환 (없는 음력 날짜는 ValueError)
     if is_lunar:
-        try:
-            cal = KoreanLunarCalendar()
-            cal.setLunarDate(year, month, day, False)
-            solar_year = cal.solarYear
-            solar_month = cal.solarMonth
-            solar_day = cal.solarDay
-            lunar_info = f"음력 {year}년 {month}월 {day}일 → 양력 {solar_year}년 {solar_month}월 {solar_day}일"
-        except:
-            pass
+        solar_date = lunar_to_solar(year, month, day, is_leap_month)
     else:
-        try:
-            cal = KoreanLunarCalendar()
-            cal.setSolarDate(year, month, day)
-            lunar_info = f"양력 {year}년 {month}월 {day}일 → 음력 {cal.lunarYear}년 {cal.lunarMonth}월 {cal.lunarDay}일"
-        except:
-            pass
-    
-    solar_date = datetime(solar_year, solar_month, solar_day)
-    
-    # 1. 사주 원국 계산
-    year_gan, year_ji = get_year_pillar(solar_date)
-    saju_month = get_saju_month(solar_date)
-    month_gan, month_ji = get_month_pillar(year_gan, saju_month)
-    day_gan, day_ji = get_day_pillar(solar_date)
-    hour_gan, hour_ji = get_hour_pillar(day_gan, hour)
-    
-    # 2. 오행 분석
-    ohaeng_count = [0, 0, 0, 0, 0]  # 목, 화, 토, 금, 수
-    
-    all_gan = [year_gan, month_gan, day_gan, hour_gan]
-    all_ji = [year_ji, month_ji, day_ji, hour_ji]
-    
-    for g in all_gan:
-        ohaeng_count[CHEONGAN_OHAENG[g]] += 1
-    for j in all_ji:
-        ohaeng_count[JIJI_OHAENG[j]] += 1
-    
-    # 3. 십신 배치
-    ilgan = day_gan  # 일간이 기준
-    
-    sipsin = {
-        'year_gan': get_sipsin(ilgan, year_gan),
-        'month_gan': get_sipsin(ilgan, month_gan),
-        'day_gan': '일주',
-        'hour_gan': get_sipsin(ilgan, hour_gan),
-        'year_ji': get_sipsin_for_jiji(ilgan, JIJI[year_ji]),
-        'month_ji': get_sipsin_for_jiji(ilgan, JIJI[month_ji]),
-        'day_ji': get_sipsin_for_jiji(ilgan, JIJI[day_ji]),
-        'hour_ji': get_sipsin_for_jiji(ilgan, JIJI[hour_ji]),
-    }
-    
-    # 4. 합/충 관계 분석
-    relations = []
-    
-    # 천간 합/충
-    gan_pairs = [(0,1,'년간-월간'), (0,2,'년간-일간'), (0,3,'년간-시간'),
-                 (1,2,'월간-일간'), (1,3,'월간-시간'), (2,3,'일간-시간')]
-    for i, j, name in gan_pairs:
-        pair = (all_gan[i], all_gan[j])
-        if pair in CHEONGAN_HAP:
-            relations.append(f'천간합: {name} - {CHEONGAN_HAP[pair]}')
-        if pair in CHEONGAN_CHUNG:
-            relations.append(f'천간충: {name} - {CHEONGAN_CHUNG[pair]}')
+        solar_date = datetime(year, month, day)
     
-    # 지지 합/충/형
-    ji_pairs = [(0,1,'년지-월지'), (0,2,'년지-일지'), (0,3,'년지-시지'),
-                (1,2,'월지-일지'), (1,3,'월지-시지'), (2,3,'일지-시지')]
-    for i, j, name in ji_pairs:
-        pair = (all_ji[i], all_ji[j])
-        if pair in JIJI_YUKHAP:
-            relations.append(f'지지육합: {name} - {JIJI_YUKHAP[pair]}')
-        if pair in JIJI_CHUNG:
-            relations.append(f'지지충: {name} - {JIJI_CHUNG[pair]}')
-        if pair in JIJI_HYUNG:
-            relations.append(f'지지형: {name} - {JIJI_HYUNG[pair]}')
+    # 사주 원국 계산 (만세력 파일이 있으면 고정 오프셋 읽기 한 번)
+    pillars = get_pillars_from_manseryeok(solar_date, hour)
+    if pillars is not None:
+        year_gan, year_ji, month_gan, month_ji, day_gan, day_ji = pillars
+    else:
+        birth_time = solar_date.replace(hour=hour)  # 절입 시각 비교용
+        year_gan, year_ji = get_year_pillar(birth_time)
+        saju_month = get_saju_month(birth_time)
+        month_gan, month_ji = get_month_pillar(year_gan, saju_month)
+        day_gan, day_ji = get_day_pillar(solar_date)
+    hour_gan, hour_ji = get_hour_pillar(day_gan, hour)
     
-    # 삼합 체크
-    ji_set = set(all_ji)
-    for key, value in JIJI_SAMHAP.items():
-        if key.issubset(ji_set):
-            relations.append(f'지지삼합: {value}')
+    return SajuChart(
+        year, month, day, hour, gender, is_lunar, is_leap_month, solar_date,
+        (year_gan, month_gan, day_gan, hour_gan), (year_ji, month_ji, day_ji, hour_ji),
+        as_of or datetime.now().year,  # 세운 기준 연도
+    )
+
+def analyze_saju(year, month, day, hour, gender, is_lunar=False, is_leap_month=False, as_of=None):
+    """
+    사주를 분석합니다.
     
-    # 5. 신살 판단
-    sinsal = get_sinsal(year_ji, month_ji, day_ji, hour_ji)
-    
-    # 6. 용신 판단
-    yongsin = determine_yongsin(ilgan, ohaeng_count)
-    
-    # 7. 대운 계산
-    start_age, daeun_list = calculate_daeun(year_gan, year_ji, month_gan, month_ji, solar_date, gender)
-    
-    # 8. 세운 (올해 운세)
-    current_year = datetime.now().year
-    current_year_gan = (current_year - 4) % 10
-    current_year_ji = (current_year - 4) % 12
-    
-    # 9. 지장간 정보
-    jijanggan_info = {}
-    for pillar_name, ji_idx in [('년지', year_ji), ('월지', month_ji), ('일지', day_ji), ('시지', hour_ji)]:
-        ji_char = JIJI[ji_idx]
-        jjg = JIJANGGAN.get(ji_char, [])
-        jijanggan_info[pillar_name] = [(CHEONGAN_KR[CHEONGAN.index(g)], g, days) for g, days in jjg]
-    
-    # 시간대 이름
-    hour_ji_names = ['자시(23~01시)', '축시(01~03시)', '인시(03~05시)', '묘시(05~07시)',
-                     '진시(07~09시)', '사시(09~11시)', '오시(11~13시)', '미시(13~15시)',
-                     '신시(15~17시)', '유시(17~19시)', '술시(19~21시)', '해시(21~23시)']
-    
-    # 띠
-    zodiac = ZODIAC_ANIMALS[year_ji]
-    
-    # 일주 60갑자 번호
-    day_ganzhi_idx = (day_gan * 6 + day_ji) % 60  # 간략 계산
-    
-    result = {
-        'input': {
-            'year': year, 'month': month, 'day': day,
-            'hour': hour, 'gender': gender, 'is_lunar': is_lunar,
-            'lunar_info': lunar_info,
-            'hour_name': hour_ji_names[hour_ji],
-        },
-        'pillars': {
-            'year': {
-                'gan': CHEONGAN[year_gan], 'ji': JIJI[year_ji],
-                'gan_kr': CHEONGAN_KR[year_gan], 'ji_kr': JIJI_KR[year_ji],
-                'gan_idx': year_gan, 'ji_idx': year_ji,
-                'gan_ohaeng': OHAENG_KR[CHEONGAN_OHAENG[year_gan]],
-                'ji_ohaeng': OHAENG_KR[JIJI_OHAENG[year_ji]],
-                'label': f"{CHEONGAN_KR[year_gan]}{JIJI_KR[year_ji]}({CHEONGAN[year_gan]}{JIJI[year_ji]})",
-            },
-            'month': {
-                'gan': CHEONGAN[month_gan], 'ji': JIJI[month_ji],
-                'gan_kr': CHEONGAN_KR[month_gan], 'ji_kr': JIJI_KR[month_ji],
-                'gan_idx': month_gan, 'ji_idx': month_ji,
-                'gan_ohaeng': OHAENG_KR[CHEONGAN_OHAENG[month_gan]],
-                'ji_ohaeng': OHAENG_KR[JIJI_OHAENG[month_ji]],
-                'label': f"{CHEONGAN_KR[month_gan]}{JIJI_KR[month_ji]}({CHEONGAN[month_gan]}{JIJI[month_ji]})",
-            },
-            'day': {
-                'gan': CHEONGAN[day_gan], 'ji': JIJI[day_ji],
-                'gan_kr': CHEONGAN_KR[day_gan], 'ji_kr': JIJI_KR[day_ji],
-                'gan_idx': day_gan, 'ji_idx': day_ji,
-                'gan_ohaeng': OHAENG_KR[CHEONGAN_OHAENG[day_gan]],
-                'ji_ohaeng': OHAENG_KR[JIJI_OHAENG[day_ji]],
-                'label': f"{CHEONGAN_KR[day_gan]}{JIJI_KR[day_ji]}({CHEONGAN[day_gan]}{JIJI[day_ji]})",
-            },
-            'hour': {
-                'gan': CHEONGAN[hour_gan], 'ji': JIJI[hour_ji],
-                'gan_kr': CHEONGAN_KR[hour_gan], 'ji_kr': JIJI_KR[hour_ji],
-                'gan_idx': hour_gan, 'ji_idx': hour_ji,
-                'gan_ohaeng': OHAENG_KR[CHEONGAN_OHAENG[hour_gan]],
-                'ji_ohaeng': OHAENG_KR[JIJI_OHAENG[hour_ji]],
-                'label': f"{CHEONGAN_KR[hour_gan]}{JIJI_KR[hour_ji]}({CHEONGAN[hour_gan]}{JIJI[hour_ji]})",
-            },
-        },
-        'ohaeng': {
-            'count': {OHAENG_NAME[i]: ohaeng_count[i] for i in range(5)},
-            'dominant': OHAENG_NAME[ohaeng_count.index(max(ohaeng_count))],
-            'weak': OHAENG_NAME[ohaeng_count.index(min(ohaeng_count))],
-            'values': ohaeng_count,
-        },
-        'sipsin': sipsin,
-        'relations': relations,
-        'sinsal': sinsal,
-        'yongsin': yongsin,
-        'daeun': {
-            'start_age': start_age,
-            'list': daeun_list,
-        },
-        'current_year': {
-            'year': current_year,
-            'gan': CHEONGAN[current_year_gan],
-            'ji': JIJI[current_year_ji],
-            'gan_kr': CHEONGAN_KR[current_year_gan],
-            'ji_kr': JIJI_KR[current_year_ji],
-            'label': f"{current_year}년 {CHEONGAN_KR[current_year_gan]}{JIJI_KR[current_year_ji]}({CHEONGAN[current_year_gan]}{JIJI[current_year_ji]})",
-        },
-        'zodiac': zodiac,
-        'jijanggan': jijanggan_info,
-        'ilgan_ohaeng': OHAENG_NAME[CHEONGAN_OHAENG[ilgan]],
-    }
+    Args:
+        get_saju_chart 와 동일
     
-    return result
+    Returns:
+        dict: 사주 분석 결과
+    """
+    return get_saju_chart(year, month, day, hour, gender, is_lunar, is_leap_month, as_of).to_dict()
 
 
 # 테스트
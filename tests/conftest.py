@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+테스트 공통 설정
+- 저장소 루트를 임포트 경로에 추가
+- 공유 SQLite 파일은 모두 임시 디렉터리로 (모듈이 임포트 시점에 *_PATH 를 읽으므로 임포트 전에)
+"""
+
+import os
+import sys
+import tempfile
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+_TMP = tempfile.mkdtemp(prefix='saju-test-')
+for _name in ('AI_CACHE', 'AI_JOBS', 'RATE_LIMIT', 'MODEL_HEALTH', 'CHART_STORE', 'CONTEXT_CACHE'):
+    os.environ[f'{_name}_PATH'] = os.path.join(_TMP, f'{_name.lower()}.sqlite3')
+os.environ['GEMINI_API_KEY'] = ''
+
+
+@pytest.fixture
+def gemini(tmp_path, monkeypatch):
+    """
+    로컬 Gemini 대역 서버 + 테스트마다 새 공유 저장소 (캐시·버킷·모델 상태·컨텍스트 캐시)
+    → FakeGemini (지연·오류율은 테스트에서 바꿔 씀)
+    """
+    import ai_interpreter
+    from ai_cache import InterpretationCache
+    from context_cache import ContextCacheRegistry
+    from model_health import ModelHealthRegistry
+    from rate_limiter import TokenBucketLimiter
+    from tools.fake_gemini import FakeGemini, serve
+
+    fake = FakeGemini(latency='fixed:0.05', chars=200)
+    server = serve(fake, port=0)
+    root = f'http://127.0.0.1:{server.server_address[1]}/v1beta'
+    monkeypatch.setattr(ai_interpreter, 'GEMINI_API_ROOT', root)
+    monkeypatch.setattr(ai_interpreter, 'GEMINI_BASE_URL', f'{root}/models')
+    monkeypatch.setenv('GEMINI_API_KEY', 'fake')
+    monkeypatch.setattr(ai_interpreter, 'AI_CACHE', InterpretationCache(str(tmp_path / 'cache.sqlite3')))
+    monkeypatch.setattr(ai_interpreter, 'GEMINI_LIMITER',
+                        TokenBucketLimiter(str(tmp_path / 'limit.sqlite3'), default_rpm=600))
+    monkeypatch.setattr(ai_interpreter, 'MODEL_HEALTH', ModelHealthRegistry(str(tmp_path / 'health.sqlite3')))
+    monkeypatch.setattr(ai_interpreter, 'CONTEXT_CACHE', ContextCacheRegistry(str(tmp_path / 'context.sqlite3')))
+    yield fake
+    server.shutdown()
+    server.server_close()
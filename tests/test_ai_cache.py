@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""AI 캐시 단일 비행 - 선행자 등록, 대기, 임대 만료, 죽은 선행자 정리"""
+
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+import ai_cache
+import ai_interpreter
+from ai_cache import InterpretationCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return InterpretationCache(str(tmp_path / 'cache.sqlite3'))
+
+
+def dead_pid():
+    proc = subprocess.Popen([sys.executable, '-c', 'pass'])
+    proc.wait()
+    return proc.pid
+
+
+def test_lease_is_below_worker_timeout():
+    assert ai_cache.FLIGHT_LEASE < 120
+    assert ai_interpreter.GEMINI_REQUEST_BUDGET < 120
+
+
+def test_second_caller_waits_for_leader(cache):
+    assert cache.begin_flight('fp', 'full')
+    assert not cache.begin_flight('fp', 'full')
+    assert cache.stats()['coalesced'] == 1
+
+    threading.Timer(0.3, cache.end_flight, ('fp', 'full', None)).start()
+    assert cache.wait_flight('fp', 'full', timeout=5) == ('done', None)
+
+
+def test_leader_error_is_shared(cache):
+    cache.begin_flight('fp', 'full')
+    cache.end_flight('fp', 'full', 'boom')
+    assert cache.wait_flight('fp', 'full', timeout=1) == ('done', 'boom')
+    # 끝난 호출 뒤에는 새 선행자
+    assert cache.begin_flight('fp', 'full')
+
+
+def test_wait_times_out(cache):
+    cache.begin_flight('fp', 'full')
+    started = time.monotonic()
+    assert cache.wait_flight('fp', 'full', timeout=0.3) == ('timeout', None)
+    assert time.monotonic() - started < 2
+
+
+def test_expired_lease_is_taken_over(cache, monkeypatch):
+    monkeypatch.setattr(ai_cache, 'FLIGHT_LEASE', 0.2)
+    assert cache.begin_flight('fp', 'full')
+    time.sleep(0.3)
+    assert cache.wait_flight('fp', 'full', timeout=1) == ('gone', None)
+    assert cache.begin_flight('fp', 'full')
+
+
+def test_dead_leader_is_reaped(cache):
+    assert cache.begin_flight('fp', 'full')
+    conn = cache._connect()
+    conn.execute('UPDATE inflight SET owner = ?', (dead_pid(),))
+
+    # 임대가 남아 있어도 선행자 프로세스가 없으면 바로 넘겨받음
+    assert cache.wait_flight('fp', 'full', timeout=1) == ('gone', None)
+    assert cache.begin_flight('fp', 'full')
+
+
+def test_end_flight_removes_dead_leases(cache):
+    cache.begin_flight('a', 'full')
+    cache.begin_flight('b', 'full')
+    cache._connect().execute("UPDATE inflight SET owner = ? WHERE fingerprint = 'a'", (dead_pid(),))
+    cache.end_flight('b', 'full')
+    assert cache.stats()['inflight'] == 0
+
+
+def test_waiter_calls_upstream_after_budget(cache, monkeypatch):
+    monkeypatch.setattr(ai_interpreter, 'AI_CACHE', cache)
+    cache.begin_flight('fp', 'full')
+    started = time.monotonic()
+    assert ai_interpreter._join_flight('fp', 'full', 0.3) == (False, None)
+    assert time.monotonic() - started < 2
+
+
+def test_waiter_gets_leader_result(cache, monkeypatch):
+    monkeypatch.setattr(ai_interpreter, 'AI_CACHE', cache)
+    model = ai_interpreter.GEMINI_MODELS[0]
+    cache.begin_flight('fp', 'full')
+
+    def finish():
+        cache.put('fp', 'full', model, '해석')
+        cache.end_flight('fp', 'full')
+    threading.Timer(0.3, finish).start()
+
+    leader, result = ai_interpreter._join_flight('fp', 'full', 5)
+    assert not leader
+    assert result['success'] and result['interpretation'] == '해석' and result['model'] == model
+
+
+def test_prefetch_lookups_are_not_counted(cache):
+    with cache.prefetching(['love']):
+        cache.put('fp', 'love', 'm', '해석')
+        assert cache.get('fp', 'love', 'm') == '해석'
+        cache.record_miss()
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['prefetch_hits']) == (0, 0, 0)
+
+    # 사용자 요청의 첫 적중은 선행 생성 적중
+    assert cache.get('fp', 'love', 'm') == '해석'
+    stats = cache.stats()
+    assert (stats['hits'], stats['prefetch_hits'], stats['prefetch_hit_rate']) == (1, 1, 1.0)
+
+
+def test_sweep_is_periodic_and_counted_once(tmp_path):
+    path = str(tmp_path / 'cache.sqlite3')
+    first = InterpretationCache(path, max_entries=3, sweep_interval=3600)
+    second = InterpretationCache(path, max_entries=3, sweep_interval=3600)
+    first.put('fp0', 'full', 'm', '해석')  # 첫 저장에서 정리 (이후 한 시간 동안은 저장만)
+    for i in range(1, 6):
+        first.put(f'fp{i}', 'full', 'm', '해석')
+    assert first.stats()['size'] == 6 and first.stats()['evictions'] == 0
+
+    # 다른 워커의 정리 한 번으로 초과분 축출, 이어서 정리해도 다시 집계하지 않음
+    second.put('fp6', 'full', 'm', '해석')
+    first._sweep(first._connect(), time.time())
+    stats = first.stats()
+    assert stats['size'] == 3 and stats['evictions'] == 4
+    assert [name for _, name, *_ in first._connect().execute('PRAGMA index_list(interpretations)')
+            if name == 'interpretations_created']
+
+
+def test_sweep_removes_expired(tmp_path):
+    cache = InterpretationCache(str(tmp_path / 'cache.sqlite3'), ttl=0.2, sweep_interval=0)
+    with cache.prefetching(['full']):
+        cache.put('old', 'full', 'm', '해석')
+    time.sleep(0.3)
+    cache.put('new', 'full', 'm', '해석')
+    stats = cache.stats()
+    assert (stats['size'], stats['expired'], stats['prefetch_wasted']) == (1, 1, 1)
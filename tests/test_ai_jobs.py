@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""AI 작업 큐 - 처리 중 임대 연장, 중단된 작업 재시도, 낮은 우선순위"""
+
+import sqlite3
+import threading
+import time
+
+import pytest
+
+import ai_jobs
+
+
+@pytest.fixture
+def queue(tmp_path, monkeypatch):
+    monkeypatch.setattr(ai_jobs, 'AI_JOBS_PATH', str(tmp_path / 'jobs.sqlite3'))
+    monkeypatch.setattr(ai_jobs, '_local', threading.local())
+    monkeypatch.setattr(ai_jobs, '_handlers', {})
+    monkeypatch.setattr(ai_jobs, '_low_priority', set())
+    monkeypatch.setattr(ai_jobs, '_started_pid', -1)  # enqueue 가 작업 스레드를 띄우지 않도록
+    monkeypatch.setattr(ai_jobs, 'start_workers', lambda threads=0: None)
+    monkeypatch.setattr(ai_jobs, 'AI_JOB_LEASE', 0.3)
+    monkeypatch.setattr(ai_jobs, 'AI_JOB_RENEW_INTERVAL', 0.1)
+    return ai_jobs
+
+
+def test_long_job_keeps_its_lease(queue):
+    queue.register_handler('slow', lambda payload: time.sleep(1) or {'ok': payload['n']})
+    job_id = queue.enqueue('slow', {'n': 1})
+
+    worker = threading.Thread(target=lambda: queue._run(queue._claim()))
+    worker.start()
+    time.sleep(0.7)  # 임대(0.3초)보다 오래 처리 중
+    assert queue._claim() is None
+    worker.join()
+
+    job = queue.get_job(job_id)
+    assert job['status'] == 'done' and job['result'] == {'ok': 1}
+    assert queue._connect().execute('SELECT attempts FROM jobs').fetchone()[0] == 1
+
+
+def test_abandoned_job_is_retried(queue):
+    queue.register_handler('full', lambda payload: {'ok': True})
+    job_id = queue.enqueue('full', {})
+    assert queue._claim()[0] == job_id  # 가져간 워커가 죽어 임대 연장이 멈춤
+    assert queue._claim() is None
+    time.sleep(0.4)
+    claimed = queue._claim()
+    assert claimed[0] == job_id and claimed[3] == 2
+
+
+def test_stale_worker_does_not_renew(queue):
+    queue.register_handler('full', lambda payload: {})
+    queue.enqueue('full', {})
+    job_id, _, _, attempt = queue._claim()
+    time.sleep(0.4)
+    queue._claim()  # 다른 워커가 넘겨받음 (attempt + 1)
+    lease = queue._connect().execute('SELECT lease_until FROM jobs').fetchone()[0]
+
+    stop = threading.Event()
+    renew = threading.Thread(target=queue._renew_lease, args=(job_id, attempt, stop))
+    renew.start()
+    time.sleep(0.25)
+    stop.set()
+    renew.join()
+    # 이전 워커의 연장은 반영되지 않음
+    assert queue._connect().execute('SELECT lease_until FROM jobs').fetchone()[0] == lease
+
+
+def test_stale_worker_does_not_overwrite_result(queue):
+    queue.register_handler('full', lambda payload: {'worker': payload['worker']})
+    job_id = queue.enqueue('full', {'worker': 'old'})
+    stale = queue._claim()
+    time.sleep(0.4)
+    current = queue._claim()  # 다른 워커가 넘겨받음 (attempt + 1)
+    current[2]['worker'] = 'new'
+    queue._run(current)
+    queue._run(stale)  # 늦게 끝난 이전 워커의 결과는 버려짐
+    assert queue.get_job(job_id)['result'] == {'worker': 'new'}
+
+
+def test_finish_error_does_not_escape(queue, monkeypatch):
+    # 결과 기록이 잠금 오류로 실패해도 작업 스레드는 살아 있고, 작업은 임대 만료 후 다시 실행
+    def locked(*args, **kwargs):
+        raise sqlite3.OperationalError('database is locked')
+    queue.register_handler('full', lambda payload: {})
+    job_id = queue.enqueue('full', {})
+    monkeypatch.setattr(queue, '_finish', locked)
+    queue._run(queue._claim())
+    time.sleep(0.4)
+    assert queue._claim()[0] == job_id
+
+
+def test_user_jobs_before_low_priority(queue):
+    queue.register_handler('prefetch', lambda payload: {}, low_priority=True)
+    queue.register_handler('full', lambda payload: {})
+    queue.enqueue('prefetch', {})
+    full_id = queue.enqueue('full', {})
+    assert queue._claim()[0] == full_id
+    assert queue._claim()[1] == 'prefetch'
+    assert queue._claim() is None  # 낮은 우선순위 실행 한도
+
+
+def test_failed_handler(queue):
+    def fail(payload):
+        raise RuntimeError('boom')
+    queue.register_handler('full', fail)
+    job_id = queue.enqueue('full', {})
+    queue._run(queue._claim())
+    job = queue.get_job(job_id)
+    assert job['status'] == 'failed' and job['error'] == 'boom'
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""카테고리 묶음 생성 - 기본값, 토큰·시간 상한, 묶음 전용 지문, 기존 캐시 보존"""
+
+import time
+
+import ai_interpreter
+from ai_interpreter import (
+    CATEGORIES, CATEGORY_MAX_TOKENS, category_bundle_fingerprint, category_extra_prompt,
+    get_category_interpretation, missing_interpretations, prompt_fingerprint, build_saju_prompt,
+)
+from saju_engine import get_saju_chart
+
+
+def make_chart():
+    return get_saju_chart(1990, 5, 15, 14, '남')
+
+
+def test_bundle_is_opt_in_and_fits_model_limits():
+    assert not ai_interpreter.GEMINI_CATEGORY_BUNDLE
+    assert ai_interpreter.CATEGORY_BUNDLE_MAX_TOKENS <= 8192
+    assert ai_interpreter.CATEGORY_BUNDLE_BUDGET <= 90
+
+
+def test_sections_use_bundle_fingerprint(gemini):
+    chart = make_chart()
+    prompt = build_saju_prompt(chart)
+    res = get_category_interpretation(chart, 'love', prompt=prompt, bundle=True)
+    assert res['success']
+
+    cache = ai_interpreter.AI_CACHE
+    standalone = prompt_fingerprint(prompt + category_extra_prompt(chart, 'money'), CATEGORY_MAX_TOKENS)
+    bundled = category_bundle_fingerprint(chart, prompt)
+    models = ai_interpreter.GEMINI_MODELS
+    assert not cache.has(standalone, 'money', models)
+    assert cache.has(bundled, 'money', models)
+    assert missing_interpretations(chart, CATEGORIES, prompt, bundle=True) == []
+    assert missing_interpretations(chart, CATEGORIES, prompt, bundle=False) == list(CATEGORIES)
+
+    # 나머지 카테고리는 호출 없이 묶음 캐시에서
+    calls = sum(gemini.stats().values())
+    assert get_category_interpretation(chart, 'money', prompt=prompt, bundle=True)['success']
+    assert sum(gemini.stats().values()) == calls
+
+
+def test_bundle_keeps_cached_categories(gemini):
+    chart = make_chart()
+    prompt = build_saju_prompt(chart)
+    single = get_category_interpretation(chart, 'money', prompt=prompt, bundle=False)
+    assert single['success']
+
+    assert get_category_interpretation(chart, 'love', prompt=prompt, bundle=True)['success']
+    cache = ai_interpreter.AI_CACHE
+    assert not cache.has(category_bundle_fingerprint(chart, prompt), 'money', ai_interpreter.GEMINI_MODELS)
+    again = get_category_interpretation(chart, 'money', prompt=prompt, bundle=True)
+    assert again['interpretation'] == single['interpretation']
+
+
+def test_call_budget_stops_retries(gemini, monkeypatch):
+    gemini.rate_429 = 1.0
+    monkeypatch.setattr(ai_interpreter, 'GEMINI_MODELS', ai_interpreter.GEMINI_MODELS[:1])
+    started = time.monotonic()
+    res = ai_interpreter._call_gemini('프롬프트', timeout=5, category='bundle', limit_wait=0, budget=8)
+    assert not res['success']
+    # 429 뒤 5초 대기 + 최소 시도 시간은 남은 예산을 넘으므로 재시도하지 않고 바로 실패
+    assert time.monotonic() - started < 2
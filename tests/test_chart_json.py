@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""명식 JSON 조각 조립 - jsonify(chart.to_dict()) 와 바이트 단위로 같은 응답"""
+
+import random
+
+import pytest
+
+from app import app
+from chart_json import encode_chart
+from saju_engine import get_saju_chart
+
+
+def jsonify_bytes(data):
+    with app.app_context():
+        return app.json.response(data).get_data()
+
+
+def random_charts(n, seed):
+    rng = random.Random(seed)
+    for _ in range(n):
+        is_lunar = rng.random() < 0.3
+        yield get_saju_chart(rng.randint(1901, 2049), rng.randint(1, 12), rng.randint(1, 28),
+                             rng.randint(0, 23), rng.choice('남여'), is_lunar, False, as_of=rng.randint(2000, 2040))
+
+
+def test_matches_jsonify():
+    for chart in random_charts(500, 1):
+        assert encode_chart(chart) == jsonify_bytes(chart.to_dict())
+
+
+def test_chart_id_is_first_key():
+    chart = get_saju_chart(1990, 5, 15, 14, '남')
+    expected = jsonify_bytes({'chart_id': 'abc"<', **chart.to_dict()})
+    assert encode_chart(chart, 'abc"<') == expected
+    assert encode_chart(chart, 'abc"<').startswith(b'{"chart_id":')
+
+
+@pytest.mark.parametrize('other', [
+    (1990, 5, 15, 13, '남'),                # 같은 시지(미시)의 다른 시각
+    (1990, 4, 21, 14, '남', True, False),   # 같은 날의 음력 입력
+])
+def test_shared_body_keeps_input(other):
+    # 본문 캐시를 공유하는 입력끼리도 input 은 각자의 값
+    first = get_saju_chart(1990, 5, 15, 14, '남')
+    second = get_saju_chart(*other)
+    assert first.cache_key == second.cache_key
+    for chart in (first, second):
+        assert encode_chart(chart) == jsonify_bytes(chart.to_dict())
+
+
+def test_api_response():
+    res = app.test_client().post('/api/saju', json={'year': 1990, 'month': 5, 'day': 15, 'hour': 14, 'gender': '남'})
+    assert res.status_code == 200
+    assert res.mimetype == 'application/json'
+    body = res.get_json()
+    chart = get_saju_chart(1990, 5, 15, 14, '남')
+    assert res.get_data() == encode_chart(chart, body['chart_id'])
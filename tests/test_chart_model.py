@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""SajuChart 모델 - 가벼운 인스턴스, 입력값만 다른 명식은 본문 공유"""
+
+import json
+
+import pytest
+
+from saju_engine import CHART_CACHE, SajuChart, analyze_saju, get_saju_chart
+
+KEYS = ['input', 'pillars', 'ohaeng', 'sipsin', 'relations', 'sinsal', 'yongsin', 'daeun',
+        'current_year', 'zodiac', 'jijanggan', 'ilgan_ohaeng']
+
+
+def test_slots_only():
+    chart = get_saju_chart(1990, 5, 15, 14, '남', as_of=2026)
+    assert not hasattr(chart, '__dict__')
+    with pytest.raises(AttributeError):
+        chart.extra = 1
+    assert isinstance(chart, SajuChart)
+
+
+def test_to_dict_layout():
+    result = analyze_saju(1990, 5, 15, 14, '남', as_of=2026)
+    assert list(result) == KEYS
+    assert result == get_saju_chart(1990, 5, 15, 14, '남', as_of=2026).to_dict()
+    assert result['current_year']['year'] == 2026
+    json.dumps(result, ensure_ascii=False)
+
+
+def test_rendering_is_independent_of_cache():
+    CHART_CACHE.clear()
+    fresh = analyze_saju(1985, 11, 3, 7, '여', as_of=2026)
+    cached = analyze_saju(1985, 11, 3, 7, '여', as_of=2026)
+    assert fresh == cached
+
+
+def test_same_body_different_input():
+    # 음력 입력과 같은 날의 양력 입력, 같은 시지의 다른 시각 → 본문 공유, input 만 다름
+    lunar = get_saju_chart(1990, 4, 21, 13, '남', is_lunar=True, as_of=2026)
+    solar = get_saju_chart(1990, 5, 15, 14, '남', as_of=2026)
+    assert lunar.cache_key == solar.cache_key
+    a, b = lunar.to_dict(), solar.to_dict()
+    assert a['input'] != b['input']
+    assert {k: v for k, v in a.items() if k != 'input'} == {k: v for k, v in b.items() if k != 'input'}
+    assert a['pillars'] is b['pillars']
+
+
+def test_as_of_changes_body():
+    assert get_saju_chart(1990, 5, 15, 14, '남', as_of=2025).cache_key != \
+        get_saju_chart(1990, 5, 15, 14, '남', as_of=2026).cache_key
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""명식 저장소 - 추측할 수 없는 chart_id, 워커 간 공유, 기준 연도 보존"""
+
+import json
+
+import pytest
+
+from chart_store import ChartStore, chart_input
+from saju_engine import get_saju_chart
+
+
+def build_prompt(chart):
+    return f'prompt {chart.cache_key} {chart.current_year}'
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / 'charts.sqlite3')
+
+
+def test_chart_id_depends_on_secret(path):
+    chart = get_saju_chart(1990, 5, 15, 14, '남', as_of=2026)
+    a = ChartStore(path, secret='a').chart_id(chart)
+    assert a == ChartStore(path, secret='a').chart_id(chart)
+    assert a != ChartStore(path, secret='b').chart_id(chart)
+    assert len(a) == 32
+
+
+def test_generated_secret_is_shared(path, tmp_path):
+    chart = get_saju_chart(1990, 5, 15, 14, '남', as_of=2026)
+    first, second = ChartStore(path), ChartStore(path)
+    assert first.chart_id(chart) == second.chart_id(chart)
+    assert first.chart_id(chart) != ChartStore(str(tmp_path / 'other.sqlite3')).chart_id(chart)
+
+
+def test_other_worker_rebuilds_with_stored_year(path):
+    chart = get_saju_chart(1990, 5, 15, 14, '남', as_of=2020)
+    chart_id, prompt = ChartStore(path).put(chart, build_prompt)
+
+    other = ChartStore(path)  # 다른 워커: 프로세스 내 LRU 가 비어 있음
+    rebuilt, stored_prompt = other.get(chart_id, get_saju_chart)
+    assert rebuilt.current_year == 2020
+    assert stored_prompt == prompt == build_prompt(rebuilt)
+    assert chart_input(rebuilt) == chart_input(chart)
+
+
+def test_rows_without_year_still_load(path):
+    store = ChartStore(path)
+    chart = get_saju_chart(1990, 5, 15, 14, '남')
+    store._connect().execute('INSERT INTO charts (id, input, prompt, expires) VALUES (?, ?, ?, ?)',
+                             ('old', json.dumps(chart_input(chart)), 'p', 1e12))
+    rebuilt, _ = store.get('old', get_saju_chart)
+    assert chart_input(rebuilt) == chart_input(chart)
+
+
+def test_unknown_id(path):
+    assert ChartStore(path).get('0' * 32, get_saju_chart) is None
+
+
+def test_chart_endpoint_does_not_store(path, monkeypatch):
+    import app as app_module
+    store = ChartStore(path)
+    monkeypatch.setattr(app_module, 'CHART_STORE', store)
+    monkeypatch.setattr(app_module, 'build_saju_prompt', lambda chart: pytest.fail('prompt built'))
+    client = app_module.app.test_client()
+    birth = {'year': 1990, 'month': 5, 'day': 15, 'hour': 14, 'gender': '남'}
+
+    chart_id = client.post('/api/saju', json=birth).get_json()['chart_id']
+    assert store.stats()['size'] == 0 and store.local.stats()['size'] == 0
+
+    # 저장 전 id 만으로는 찾을 수 없고, 생년월일을 함께 보내면 첫 AI 요청 때 같은 id 로 저장
+    monkeypatch.setattr(app_module, 'build_saju_prompt', build_prompt)
+    with pytest.raises(ValueError):
+        app_module.resolve_chart({'chart_id': chart_id})
+    assert app_module.resolve_chart(dict(birth, chart_id=chart_id))[0] == chart_id
+    assert store.stats()['size'] == 1
+    assert app_module.resolve_chart({'chart_id': chart_id})[0] == chart_id
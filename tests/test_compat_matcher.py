@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""궁합 매칭 - 풀 전체 벡터 점수와 한 쌍씩 계산한 점수의 일치, 상위 k 선택과 필터"""
+
+import numpy as np
+import pytest
+
+from compat_matcher import COMPAT_WEIGHTS, CompatPool
+from saju_batch import analyze_saju_batch
+from saju_engine import GAN_REL, JI_REL, SAMHAP_MASKS, REL_HAP, REL_YUKHAP, REL_CHUNG, get_saju_chart
+
+N = 300
+
+
+@pytest.fixture(scope='module')
+def pool_inputs():
+    rng = np.random.default_rng(11)
+    inputs = (rng.integers(1950, 2010, N), rng.integers(1, 13, N), rng.integers(1, 29, N),
+              rng.integers(0, 24, N), rng.choice(['남', '여'], N))
+    charts = [get_saju_chart(*(v.item() for v in row)) for row in zip(*inputs)]
+    return inputs, charts
+
+
+def pair_score(a, b):
+    """두 명식의 궁합 점수를 항목별로 한 쌍씩 계산"""
+    parts = {
+        'gan_hap': sum(bool(GAN_REL[x][y] & REL_HAP) for x in a.gans for y in b.gans),
+        'day_gan_hap': int(bool(GAN_REL[a.day_gan][b.day_gan] & REL_HAP)),
+        'ji_yukhap': sum(bool(JI_REL[x][y] & REL_YUKHAP) for x in a.jis for y in b.jis),
+        'ji_chung': sum(bool(JI_REL[x][y] & REL_CHUNG) for x in a.jis for y in b.jis),
+    }
+    a_bits = sum(1 << j for j in set(a.jis))
+    b_bits = sum(1 << j for j in set(b.jis))
+    parts['samhap'] = sum((a_bits | b_bits) & mask == mask and a_bits & mask != mask and b_bits & mask != mask
+                          for mask, _ in SAMHAP_MASKS)
+    parts['ohaeng_balance'] = -sum(abs(x + y - 3.2) for x, y in zip(a.ohaeng_values, b.ohaeng_values))
+    parts['yongsin'] = (b.ohaeng_values[a.yongsin['yongsin_idx']]
+                        + a.ohaeng_values[b.yongsin['yongsin_idx']])
+    return sum(COMPAT_WEIGHTS[k] * v for k, v in parts.items()), parts
+
+
+def test_score_matches_pairwise(pool_inputs):
+    inputs, charts = pool_inputs
+    pool = CompatPool(analyze_saju_batch(*inputs))
+    query = get_saju_chart(1990, 5, 15, 14, '남')
+    total, parts = pool.score(query)
+    for i, other in enumerate(charts):
+        expected_total, expected = pair_score(query, other)
+        assert total[i] == pytest.approx(expected_total)
+        for key, value in expected.items():
+            assert parts[key][i] == pytest.approx(value), key
+
+
+def test_top_k_order_and_filters(pool_inputs):
+    inputs, _ = pool_inputs
+    ids = np.arange(1000, 1000 + N)
+    pool = CompatPool(analyze_saju_batch(*inputs), ids=ids, genders=inputs[4])
+    query = get_saju_chart(1988, 8, 8, 8, '여')
+    total, _ = pool.score(query)
+
+    top = pool.top_k(query, k=20)
+    assert [r['score'] for r in top] == sorted((round(float(s), 3) for s in total), reverse=True)[:20]
+
+    male_ids = set(ids[inputs[4] == '남'].tolist())
+    excluded = min(male_ids)
+    top = pool.top_k(query, k=N, gender='남', exclude=[excluded])
+    assert {r['id'] for r in top} == male_ids - {excluded}
+    assert all(r['score'] >= s['score'] for r, s in zip(top, top[1:]))
+
+
+def test_gender_filter_needs_genders(pool_inputs):
+    inputs, _ = pool_inputs
+    pool = CompatPool(analyze_saju_batch(*inputs))
+    with pytest.raises(ValueError):
+        pool.top_k(get_saju_chart(1990, 5, 15, 14, '남'), gender='여')
+    with pytest.raises(ValueError):
+        CompatPool(np.zeros(3))
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""컨텍스트 캐시 핸들 - 핸들이 거절됐을 때만 인라인으로 다시 보냄"""
+
+import pytest
+
+import ai_interpreter
+
+
+class Response:
+    def __init__(self, status_code, text):
+        self.status_code = status_code
+        self.text = text
+
+    def close(self):
+        pass
+
+
+class Requests:
+    """requests.post 자리 - 보낸 본문을 기록하고 정해 둔 응답을 차례로 돌려줌"""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.sent = []
+
+    def post(self, url, headers, json, timeout, stream):
+        self.sent.append(json)
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def cached_handle(monkeypatch):
+    invalidated = []
+    monkeypatch.setattr(ai_interpreter, '_context_cached_body',
+                        lambda requests, model, api_key, body: dict(body, cachedContent='cachedContents/x'))
+    monkeypatch.setattr(ai_interpreter.CONTEXT_CACHE, 'invalidate', lambda model, name: invalidated.append(name))
+    return invalidated
+
+
+@pytest.mark.parametrize('status, text', [
+    (400, '{"error": {"message": "cached content not found"}}'),
+    (403, '{"error": {"message": "CachedContent not found (or permission denied)"}}'),
+])
+def test_rejected_handle_is_resent_inline(cached_handle, status, text):
+    requests = Requests(Response(status, text), Response(200, 'ok'))
+    body = {'contents': []}
+    response = ai_interpreter._post_gemini(requests, 'url', 'm', 'key', body, 5)
+    assert response.status_code == 200
+    assert requests.sent == [dict(body, cachedContent='cachedContents/x'), body]
+    assert cached_handle == ['cachedContents/x']
+
+
+@pytest.mark.parametrize('status, text', [
+    (403, '{"error": {"message": "API key not valid. Please pass a valid API key."}}'),
+    (404, '{"error": {"message": "models/m is not found"}}'),
+    (400, '{"error": {"message": "Invalid JSON payload"}}'),
+])
+def test_other_errors_are_returned(cached_handle, status, text):
+    requests = Requests(Response(status, text))
+    response = ai_interpreter._post_gemini(requests, 'url', 'm', 'key', {'contents': []}, 5)
+    assert response.status_code == status
+    assert len(requests.sent) == 1
+    assert cached_handle == []
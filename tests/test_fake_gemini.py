@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""Gemini 대역 서버 - 실제 클라이언트 경로(일반·스트리밍·404 전환)로 응답하고 호출 수를 집계"""
+
+import json
+import urllib.request
+
+import pytest
+
+import ai_interpreter
+from ai_interpreter import _call_gemini, _stream_gemini
+from tools.fake_gemini import parse_latency
+
+
+def server_url(path):
+    return ai_interpreter.GEMINI_API_ROOT.rsplit('/v1beta', 1)[0] + path
+
+
+def test_parse_latency():
+    assert parse_latency('fixed:0.5')() == 0.5
+    assert 1 <= parse_latency('uniform:1:2')() <= 2
+    assert parse_latency('lognormal:8:0.4')() > 0
+    with pytest.raises(ValueError):
+        parse_latency('gamma:1')
+
+
+def test_generate_and_stream(gemini):
+    res = _call_gemini('프롬프트')
+    assert res['success'] and res['model'] in res['interpretation']
+
+    events = list(_stream_gemini('다른 프롬프트'))
+    chunks = [payload for kind, payload in events if kind == 'chunk']
+    assert len(chunks) == gemini.chunks
+    assert events[-1] == ('done', {'success': True, 'error': None})
+    assert sum(gemini.stats().values()) == 2
+
+
+def test_missing_model_falls_through(gemini):
+    first, second = ai_interpreter.GEMINI_MODELS[:2]
+    gemini.missing = {first}
+    res = _call_gemini('프롬프트')
+    assert res['success'] and res['model'] == second
+    assert gemini.stats() == {f'{first}/404': 1, f'{second}/200': 1}
+
+
+def test_stats_and_reset_endpoints(gemini):
+    _call_gemini('프롬프트')
+    with urllib.request.urlopen(server_url('/stats')) as res:
+        assert sum(json.load(res).values()) == 1
+    urllib.request.urlopen(urllib.request.Request(server_url('/reset'), data=b'{}', method='POST')).close()
+    assert gemini.stats() == {}
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""십신/관계 조회 커널 - 이름 사전으로 직접 판단한 결과와 전 조합 일치"""
+
+import itertools
+
+import pytest
+
+from saju_engine import (
+    CHEONGAN, CHEONGAN_OHAENG, CHEONGAN_EUMYANG, JIJI, JIJANGGAN,
+    CHEONGAN_HAP, CHEONGAN_CHUNG, JIJI_YUKHAP, JIJI_SAMHAP, JIJI_CHUNG, JIJI_HYUNG,
+    DOHUA_MAP, YEOKMA_MAP, HWAGAE_MAP, GWIMUN_PAIRS, GAN_PAIRS, JI_PAIRS, PILLAR_JI_NAMES,
+    get_sipsin, get_sipsin_for_jiji, get_relations, get_sinsal, get_hour_pillar,
+)
+
+SHENG = {0: 1, 1: 2, 2: 3, 3: 4, 4: 0}
+KE = {0: 2, 1: 3, 2: 4, 3: 0, 4: 1}
+
+
+def reference_sipsin(me, other):
+    mine, theirs = CHEONGAN_OHAENG[me], CHEONGAN_OHAENG[other]
+    same = CHEONGAN_EUMYANG[me] == CHEONGAN_EUMYANG[other]
+    if mine == theirs:
+        return '비견' if same else '겁재'
+    if SHENG[mine] == theirs:
+        return '식신' if same else '상관'
+    if KE[mine] == theirs:
+        return '편재' if same else '정재'
+    if KE[theirs] == mine:
+        return '편관' if same else '정관'
+    return '편인' if same else '정인'
+
+
+def reference_relations(gans, jis):
+    relations = []
+    for i, j, name in GAN_PAIRS:
+        pair = (gans[i], gans[j])
+        if pair in CHEONGAN_HAP:
+            relations.append(f'천간합: {name} - {CHEONGAN_HAP[pair]}')
+        if pair in CHEONGAN_CHUNG:
+            relations.append(f'천간충: {name} - {CHEONGAN_CHUNG[pair]}')
+    for i, j, name in JI_PAIRS:
+        pair = (jis[i], jis[j])
+        if pair in JIJI_YUKHAP:
+            relations.append(f'지지육합: {name} - {JIJI_YUKHAP[pair]}')
+        if pair in JIJI_CHUNG:
+            relations.append(f'지지충: {name} - {JIJI_CHUNG[pair]}')
+        if pair in JIJI_HYUNG:
+            relations.append(f'지지형: {name} - {JIJI_HYUNG[pair]}')
+    for members, value in JIJI_SAMHAP.items():
+        if members <= set(jis):
+            relations.append(f'지지삼합: {value}')
+    return relations
+
+
+def reference_sinsal(jis):
+    result = []
+    for name, table in (('도화살(桃花殺)', DOHUA_MAP), ('역마살(驛馬殺)', YEOKMA_MAP), ('화개살(華蓋殺)', HWAGAE_MAP)):
+        for i in (0, 1, 3):
+            if jis[i] == table[jis[2]]:
+                result.append(f'{name} - {PILLAR_JI_NAMES[i]}')
+    for i, j, _ in JI_PAIRS:
+        if (jis[i], jis[j]) in GWIMUN_PAIRS or (jis[j], jis[i]) in GWIMUN_PAIRS:
+            result.append(f'귀문관살(鬼門關殺) - {PILLAR_JI_NAMES[i]}/{PILLAR_JI_NAMES[j]}')
+    return result
+
+
+def test_sipsin_all_pairs():
+    for me, other in itertools.product(range(10), repeat=2):
+        assert get_sipsin(me, other) == reference_sipsin(me, other)
+    for me, ji in itertools.product(range(10), JIJI):
+        bongi = CHEONGAN.index(JIJANGGAN[ji][-1][0])
+        assert get_sipsin_for_jiji(me, ji) == reference_sipsin(me, bongi)
+
+
+@pytest.mark.parametrize('gans', [(0, 5, 6, 1), (2, 7, 8, 3), (4, 9, 4, 9)])
+def test_relations_all_branches(gans):
+    for jis in itertools.product(range(12), repeat=4):
+        assert get_relations(gans, jis) == reference_relations(gans, jis)
+
+
+def test_relations_all_stems():
+    jis = (0, 6, 2, 8)
+    for gans in itertools.product(range(10), repeat=4):
+        assert get_relations(gans, jis) == reference_relations(gans, jis)
+
+
+def test_sinsal_all_branches():
+    for jis in itertools.product(range(12), repeat=4):
+        assert get_sinsal(*jis) == reference_sinsal(jis)
+
+
+def test_hour_branches():
+    expected = [0, 1, 1, 2, 2, 3, 3, 4, 4, 5, 5, 6, 6, 7, 7, 8, 8, 9, 9, 10, 10, 11, 11, 0]
+    for day_gan in range(10):
+        for hour, ji in enumerate(expected):
+            assert get_hour_pillar(day_gan, hour) == ((day_gan % 5 * 2 + ji) % 10, ji)
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""규칙 기반 기본 풀이 - 7개 항목 구성, 조사 처리, 카테고리, 같은 명식이면 같은 글"""
+
+import random
+import re
+
+import pytest
+
+from local_interpreter import (
+    CATEGORY_TITLES, SECTION_TITLES, _fix_josa, local_category_interpretation, local_interpretation,
+)
+from saju_engine import get_saju_chart
+
+PLACEHOLDER = re.compile(r'이\(가\)|은\(는\)|을\(를\)|\{|\}|None')
+
+
+def random_charts(n, seed):
+    rng = random.Random(seed)
+    for _ in range(n):
+        yield get_saju_chart(rng.randint(1901, 2049), rng.randint(1, 12), rng.randint(1, 28),
+                             rng.randint(0, 23), rng.choice('남여'), as_of=2026)
+
+
+def test_seven_sections():
+    for chart in random_charts(300, 2):
+        text = local_interpretation(chart)
+        titles = re.findall(r'^## (\d)\. (.+)$', text, re.MULTILINE)
+        assert titles == [(str(i + 1), title) for i, title in enumerate(SECTION_TITLES)]
+        assert not PLACEHOLDER.search(text), text
+
+
+@pytest.mark.parametrize('category', sorted(CATEGORY_TITLES))
+def test_categories(category):
+    for chart in random_charts(60, 3):
+        text = local_category_interpretation(chart, category)
+        assert text.startswith(f'## {CATEGORY_TITLES[category]}\n')
+        assert '용신인' in text and not PLACEHOLDER.search(text)
+
+
+def test_invalid_category():
+    assert local_category_interpretation(get_saju_chart(1990, 5, 15, 14, '남'), 'nope') is None
+
+
+def test_deterministic_and_input_independent():
+    # 같은 명식(같은 시지의 다른 시각)이면 같은 글
+    first = get_saju_chart(1990, 5, 15, 13, '남', as_of=2026)
+    second = get_saju_chart(1990, 5, 15, 14, '남', as_of=2026)
+    assert local_interpretation(first) == local_interpretation(second)
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('재성(財星)이(가) 많음', '재성(財星)이 많음'),
+    ('**비견**은(는)', '**비견**은'),
+    ('오행을(를) 보완', '오행을 보완'),
+    ('나무을(를)', '나무를'),
+    ('기운이(가)', '기운이'),
+    ('토이(가)', '토가'),
+])
+def test_fix_josa(text, expected):
+    assert _fix_josa(text) == expected
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""운세 타임라인 - 대운 목록과의 일치, 구간 건너뛰기, 페이지 API"""
+
+from itertools import islice
+
+from luck_timeline import get_interactions, iter_timeline
+from saju_engine import get_saju_chart, pillar_label
+
+INPUT = {'year': 1990, 'month': 5, 'day': 15, 'hour': 14, 'gender': '남'}
+
+
+def chart():
+    return get_saju_chart(1990, 5, 15, 14, '남')
+
+
+def test_daeun_matches_chart():
+    c = chart()
+    daeun = [item for item in iter_timeline(c, 1990, 1990 + 100, kinds=('daeun',))]
+    expected = c.daeun['list']
+    assert [(d['year'], d['label']) for d in daeun[:10]] == [(d['year'], d['label']) for d in expected]
+
+
+def test_year_counts_and_order():
+    c = chart()
+    items = list(iter_timeline(c, 2020, 2029, kinds=('seun', 'wolun')))
+    assert len(items) == 10 * 13
+    for offset in range(10):
+        seun, *wolun = items[offset * 13:(offset + 1) * 13]
+        assert seun['kind'] == 'seun' and seun['year'] == 2020 + offset
+        assert [w['month'] for w in wolun] == list(range(1, 13))
+    assert items[0]['label'] == pillar_label(6, 0)  # 2020 경자년
+
+
+def test_start_mid_daeun_yields_current_daeun_first():
+    c = chart()
+    daeun = c.daeun['list']
+    year = daeun[2]['year'] + 3
+    first = next(iter_timeline(c, year))
+    assert first['kind'] == 'daeun' and first['label'] == daeun[2]['label']
+
+
+def test_skip_equals_slice():
+    c = chart()
+    full = [i for i in iter_timeline(c, 2000, 2030, kinds=('seun',)) if i['year'] >= 2015]
+    assert full == list(iter_timeline(c, 2015, 2030, kinds=('seun',)))
+    assert len(list(islice(iter_timeline(c, 2000), 500))) == 500  # end_year 없으면 무한
+
+
+def test_interactions():
+    c = chart()
+    # 원국 일간과 합하는 천간, 일지와 충하는 지지
+    gan = (c.day_gan + 5) % 10
+    ji = (c.day_ji + 6) % 12
+    found = get_interactions(c, gan, ji)
+    assert any(text.startswith('천간합: 일간') for text in found)
+    assert any(text.startswith('지지충: 일지') for text in found)
+
+
+def test_timeline_api_pages():
+    from app import app
+    client = app.test_client()
+    res = client.post('/api/saju/timeline', json={**INPUT, 'from_year': 2020, 'years': 100, 'kinds': ['seun']})
+    body = res.get_json()
+    assert res.status_code == 200
+    assert (body['from_year'], body['to_year'], body['next_from_year']) == (2020, 2039, 2040)
+    assert [i['year'] for i in body['items']] == list(range(2020, 2040))
+
+    res = client.post('/api/saju/timeline', json={**INPUT, 'from_year': 'x'})
+    assert res.status_code == 400
+
+    # 문자열 하나는 글자 단위로 걸러져 빈 결과가 되므로 목록만 허용
+    res = client.post('/api/saju/timeline', json={**INPUT, 'kinds': 'seun'})
+    assert res.status_code == 400 and 'kinds' in res.get_json()['error']
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""음력↔양력 변환 - 색인과 korean_lunar_calendar 일치, 색인 이전 날짜는 라이브러리로"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+from korean_lunar_calendar import KoreanLunarCalendar
+
+from saju_batch import analyze_saju_batch
+from saju_engine import get_saju_chart, lunar_to_solar, solar_to_lunar
+
+
+def library_lunar(day):
+    cal = KoreanLunarCalendar()
+    assert cal.setSolarDate(day.year, day.month, day.day)
+    return cal.lunarYear, cal.lunarMonth, cal.lunarDay, bool(cal.isIntercalation)
+
+
+@pytest.mark.parametrize('start', [datetime(1850, 3, 1), datetime(1899, 12, 1), datetime(1960, 1, 1),
+                                   datetime(2049, 11, 1)])
+def test_matches_library(start):
+    for offset in range(0, 400, 3):
+        day = start + timedelta(days=offset)
+        if day > datetime(2050, 11, 18):
+            break
+        lunar = solar_to_lunar(day)
+        assert lunar == library_lunar(day), day
+        assert lunar_to_solar(*lunar) == day
+
+
+def test_lunar_before_1900():
+    assert lunar_to_solar(1899, 3, 1) == datetime(1899, 4, 10)
+    chart = get_saju_chart(1899, 3, 1, 10, '남', is_lunar=True)
+    assert chart.solar_date == datetime(1899, 4, 10)
+
+
+def test_solar_before_1900_keeps_lunar_info():
+    chart = get_saju_chart(1900, 1, 15, 10, '여')
+    assert chart.lunar_info == '양력 1900년 1월 15일 → 음력 1899년 12월 15일'
+
+
+@pytest.mark.parametrize('args', [(1899, 3, 1, True), (1899, 2, 30, False), (999, 1, 1, False),
+                                  (2051, 1, 1, False)])
+def test_invalid_lunar_dates(args):
+    with pytest.raises(ValueError):
+        lunar_to_solar(*args)
+
+
+def test_batch_lunar_before_1900():
+    years, months, days, hours = [1899, 1880, 1990], [3, 12, 5], [1, 29, 15], [10, 23, 0]
+    rows = analyze_saju_batch(np.array(years), np.array(months), np.array(days), np.array(hours),
+                              np.array(['남', '여', '남']), is_lunar=True)
+    for row, args in zip(rows, zip(years, months, days, hours)):
+        chart = get_saju_chart(*args, '남', is_lunar=True)
+        solar = chart.solar_date
+        assert (row['solar_year'], row['solar_month'], row['solar_day']) == (solar.year, solar.month, solar.day)
+        assert list(row['gan']) == [chart.year_gan, chart.month_gan, chart.day_gan, chart.hour_gan]
+        assert list(row['ji']) == [chart.year_ji, chart.month_ji, chart.day_ji, chart.hour_ji]
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""만세력 파일 - mmap 레코드로 읽은 원국과 절기 계산 경로의 일치, 헤더 검증"""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+import saju_engine
+from saju_engine import (
+    JEOL_MINUTES, MANSERYEOK_HEADER, get_day_pillar, get_lunar_from_manseryeok, get_month_pillar,
+    get_pillars_from_manseryeok, get_saju_chart, get_saju_month, get_year_pillar, read_manseryeok, solar_to_lunar,
+)
+from tools import build_manseryeok
+
+
+@pytest.fixture(scope='module')
+def manseryeok_file(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp('manseryeok') / 'manseryeok.bin')
+    build_manseryeok.main(path)
+    return path
+
+
+@pytest.fixture
+def opened(manseryeok_file, monkeypatch):
+    mm, first, count = saju_engine._open_manseryeok(manseryeok_file)
+    assert mm is not None
+    monkeypatch.setattr(saju_engine, 'MANSERYEOK', mm)
+    monkeypatch.setattr(saju_engine, 'MANSERYEOK_FIRST', first)
+    monkeypatch.setattr(saju_engine, 'MANSERYEOK_DAYS', count)
+    yield
+    mm.close()
+
+
+def computed(day, hour):
+    birth_time = day.replace(hour=hour)
+    year_gan, year_ji = get_year_pillar(birth_time)
+    month_gan, month_ji = get_month_pillar(year_gan, get_saju_month(birth_time))
+    return (year_gan, year_ji, month_gan, month_ji) + tuple(get_day_pillar(day))
+
+
+def test_random_days_all_hours(opened):
+    rng = random.Random(5)
+    first = build_manseryeok.FIRST_DATE
+    span = (build_manseryeok.LAST_DATE - first).days
+    for _ in range(1500):
+        day = first + timedelta(days=rng.randrange(span + 1))
+        for hour in range(24):
+            assert get_pillars_from_manseryeok(day, hour) == computed(day, hour), (day, hour)
+
+
+def test_jeol_days_all_hours(opened):
+    # 절입일은 시각에 따라 월주(입춘이면 연주도)가 바뀌는 날
+    first = build_manseryeok.FIRST_DATE.toordinal() * 1440
+    last = (build_manseryeok.LAST_DATE.toordinal() + 1) * 1440
+    for minute in JEOL_MINUTES[::7]:
+        if not first <= minute < last:
+            continue
+        day = datetime.fromordinal(minute // 1440)
+        for hour in range(24):
+            assert get_pillars_from_manseryeok(day, hour) == computed(day, hour), (day, hour)
+
+
+def test_lunar_fields(opened):
+    rng = random.Random(9)
+    for _ in range(300):
+        day = datetime(1900, 1, 1) + timedelta(days=rng.randrange(73414))
+        record = read_manseryeok(day)
+        converted = solar_to_lunar(day)
+        if converted is None:
+            assert not record[3] & saju_engine.MANSERYEOK_HAS_LUNAR
+            continue
+        assert record[5:] == tuple(converted[:3])
+        assert bool(record[3] & saju_engine.MANSERYEOK_LEAP) == converted[3]
+
+
+def test_lunar_info_reads_record(opened, monkeypatch):
+    chart = get_saju_chart(1990, 5, 15, 14, '남')
+    expected = chart.lunar_info
+    assert get_lunar_from_manseryeok(chart.solar_date) == solar_to_lunar(chart.solar_date)
+    monkeypatch.setattr(saju_engine, 'solar_to_lunar', lambda solar_date: pytest.fail('computed'))
+    assert chart.lunar_info == expected == '양력 1990년 5월 15일 → 음력 1990년 4월 21일'
+
+
+def test_lunar_info_without_lunar_fields(opened, monkeypatch):
+    # 음력 정보가 없는 레코드(예전 파일)면 계산 경로
+    monkeypatch.setattr(saju_engine, 'MANSERYEOK_HAS_LUNAR', 0x80)
+    chart = get_saju_chart(1900, 1, 1, 12, '남')
+    assert get_lunar_from_manseryeok(chart.solar_date) is None
+    lunar = solar_to_lunar(chart.solar_date)
+    assert chart.lunar_info.endswith(f'음력 {lunar[0]}년 {lunar[1]}월 {lunar[2]}일')
+
+
+def test_out_of_range_falls_back(opened):
+    assert read_manseryeok(datetime(1899, 12, 31)) is None
+    assert read_manseryeok(datetime(2101, 1, 1)) is None
+    assert read_manseryeok(datetime(2100, 12, 31)) is not None
+
+
+@pytest.mark.parametrize('corrupt', ['magic', 'crc', 'truncated', 'empty'])
+def test_bad_file_rejected(manseryeok_file, tmp_path, corrupt):
+    data = bytearray(open(manseryeok_file, 'rb').read())
+    if corrupt == 'magic':
+        data[:4] = b'XXXX'
+    elif corrupt == 'crc':
+        data[16:20] = bytes(4)
+    elif corrupt == 'truncated':
+        data = data[:len(data) - 1]
+    else:
+        data = data[:MANSERYEOK_HEADER.size - 1]
+    path = tmp_path / 'bad.bin'
+    path.write_bytes(bytes(data))
+    assert saju_engine._open_manseryeok(str(path)) == (None, 0, 0)
+    assert saju_engine._open_manseryeok(str(tmp_path / 'missing.bin')) == (None, 0, 0)
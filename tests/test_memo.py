@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""프로세스 내 LRU 캐시"""
+
+import time
+
+from memo import LRUCache
+
+
+def test_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1  # a 가 최근 사용
+    cache.put('c', 3)
+    assert cache.get('b') is None
+    assert (cache.get('a'), cache.get('c')) == (1, 3)
+    assert cache.stats()['evictions'] == 1
+
+
+def test_ttl():
+    cache = LRUCache(maxsize=4, ttl=0.1)
+    cache.put('a', 1)
+    assert cache.get('a') == 1
+    time.sleep(0.15)
+    assert cache.get('a', 'gone') == 'gone'
+    assert len(cache) == 0
+
+
+def test_get_or_compute_counts():
+    cache = LRUCache(maxsize=4)
+    calls = []
+    for _ in range(3):
+        assert cache.get_or_compute('k', lambda: calls.append(1) or 'v') == 'v'
+    assert len(calls) == 1
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['hit_rate']) == (2, 1, round(2 / 3, 4))
+
+
+def test_cached_none_is_a_hit():
+    cache = LRUCache(maxsize=4)
+    calls = []
+    cache.get_or_compute('k', lambda: calls.append(1))
+    cache.get_or_compute('k', lambda: calls.append(1))
+    assert len(calls) == 1
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""모델 상태 레지스트리 - 서킷 브레이커, 호출 순서, 지연 분위수와 집계"""
+
+import time
+
+import pytest
+
+import model_health
+from model_health import ERROR, NOT_FOUND, OK, RATE_LIMITED, ModelHealthRegistry
+
+MODELS = ['a', 'b', 'c']
+
+
+@pytest.fixture
+def registry(tmp_path):
+    return ModelHealthRegistry(str(tmp_path / 'health.sqlite3'))
+
+
+def test_breaker_opens_after_threshold(registry):
+    for _ in range(model_health.BREAKER_THRESHOLD - 1):
+        registry.record('a', ERROR)
+    assert registry.rank(MODELS) == ['b', 'c', 'a']  # 브레이커는 닫혀 있고 실패율로 뒤로
+    registry.record('a', RATE_LIMITED)
+    assert registry.rank(MODELS) == ['b', 'c']
+    stats = registry.stats(['a'])['a']
+    assert (stats['breaker'], stats['reason']) == ('open', RATE_LIMITED)
+
+
+def test_not_found_opens_immediately(registry):
+    registry.record('b', NOT_FOUND)
+    assert registry.rank(MODELS) == ['a', 'c']
+    assert registry.stats(['b'])['b']['open_seconds'] > model_health.BREAKER_COOLDOWN
+
+
+def test_success_resets_failures(registry):
+    registry.record('a', ERROR)
+    registry.record('a', ERROR)
+    registry.record('a', OK, 1.0)
+    registry.record('a', ERROR)
+    registry.record('a', ERROR)
+    assert 'a' in registry.rank(MODELS)
+
+
+def test_half_open_after_cooldown(registry, monkeypatch):
+    monkeypatch.setattr(model_health, 'BREAKER_COOLDOWN', 0.2)
+    for _ in range(model_health.BREAKER_THRESHOLD):
+        registry.record('a', ERROR)
+    assert 'a' not in registry.rank(MODELS)
+    time.sleep(0.25)
+    assert 'a' in registry.rank(MODELS)
+    registry.record('a', ERROR)  # 쿨다운 뒤 첫 호출 실패 → 바로 다시 열림
+    assert 'a' not in registry.rank(MODELS)
+
+
+def test_rank_last_success_first_and_all_open(registry):
+    registry.record('c', OK, 1.0)
+    assert registry.rank(MODELS) == ['c', 'a', 'b']
+
+    # 실패율 낮은 순 → p90 지연 짧은 순 (브레이커가 열리지 않은 실패도 순서에 반영)
+    for _ in range(5):
+        registry.record('a', OK, 3.0)
+        registry.record('b', OK, 1.0)
+    assert registry.rank(MODELS)[:2] == ['b', 'a']
+    registry.record('b', RATE_LIMITED)
+    assert registry.rank(MODELS) == ['a', 'c', 'b']  # c 는 지연 표본 부족
+    registry.record('c', ERROR)
+    registry.record('c', ERROR)
+    assert registry.rank(MODELS) == ['a', 'b', 'c']
+    for model in MODELS:
+        registry.record(model, NOT_FOUND)
+    assert registry.rank(MODELS) == MODELS
+
+
+def test_shared_between_instances_and_latency(registry):
+    other = ModelHealthRegistry(registry.path)
+    for latency in range(1, 11):
+        registry.record('a', OK, float(latency))
+    registry.record('a', ERROR)
+    assert other.latency_percentile('a', 0.5) == 6.0
+    assert other.latency_percentile('a', 0.9) == 10.0
+    assert other.latency_percentile('b') is None
+    stats = other.stats(['a'])['a']
+    assert stats['calls'] == 11 and stats['error_rate'] == round(1 / 11, 4)
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+"""모델 상태 레지스트리 - 브레이커가 열린 모델은 호출 순서에서만 빠지고 캐시는 그대로 사용"""
+
+import ai_interpreter
+from ai_interpreter import _call_gemini, _stream_gemini, prompt_fingerprint
+from model_health import NOT_FOUND
+
+
+def test_breaker_skips_model_for_live_calls(gemini):
+    first = ai_interpreter.GEMINI_MODELS[0]
+    ai_interpreter.MODEL_HEALTH.record(first, NOT_FOUND)
+    assert first not in ai_interpreter._model_order()
+
+    res = _call_gemini('프롬프트')
+    assert res['success'] and res['model'] != first
+    assert first not in {key.split('/')[0] for key in gemini.stats()}
+
+
+def test_cache_from_open_breaker_model_is_used(gemini):
+    first = ai_interpreter.GEMINI_MODELS[0]
+    fp = prompt_fingerprint('프롬프트', 4096)
+    ai_interpreter.AI_CACHE.put(fp, 'full', first, '캐시된 해석')
+    ai_interpreter.MODEL_HEALTH.record(first, NOT_FOUND)
+
+    res = _call_gemini('프롬프트')
+    assert res == {'success': True, 'interpretation': '캐시된 해석', 'error': None, 'model': first}
+    assert list(_stream_gemini('프롬프트')) == [('chunk', '캐시된 해석'), ('done', {'success': True, 'error': None})]
+    assert gemini.stats() == {}
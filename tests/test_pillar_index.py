@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""사주 역검색 색인 - 찾은 시각은 모두 그 사주, 그 사주의 출생 시각은 빠짐없이"""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from pillar_index import find_birth_ranges, find_birth_slots, parse_pillar
+from saju_engine import CHEONGAN, JIJI, get_saju_chart
+
+
+def pillars_at(moment):
+    chart = get_saju_chart(moment.year, moment.month, moment.day, moment.hour, '남')
+    return [CHEONGAN[g] + JIJI[j] for g, j in zip(chart.gans, chart.jis)]
+
+
+def contains(ranges, moment):
+    return any(lo <= moment < hi for lo, hi in ranges)
+
+
+def test_full_pattern_round_trip():
+    rng = random.Random(3)
+    for _ in range(40):
+        moment = datetime(1900, 3, 1) + timedelta(hours=rng.randrange(200 * 365 * 24))
+        pattern = pillars_at(moment)
+        ranges = find_birth_ranges(*pattern)
+        assert contains(ranges, moment)
+        for lo, hi in ranges:
+            assert pillars_at(lo) == pattern
+            assert pillars_at(hi - timedelta(hours=1)) == pattern
+
+
+def test_partial_pattern():
+    ranges = find_birth_ranges(None, '?寅', '甲子', None)
+    assert ranges
+    for lo, hi in ranges[:50]:
+        pattern = pillars_at(lo)
+        assert pattern[1][1] == '寅' and pattern[2] == '甲子'
+
+
+def test_korean_and_hanja_patterns_match():
+    assert find_birth_slots('경오', '신사', '경진', '계미') == find_birth_slots('庚午', '辛巳', '庚辰', '癸未')
+
+
+@pytest.mark.parametrize('pattern', ['庚', '가나', '甲午午'])
+def test_invalid_pattern(pattern):
+    with pytest.raises(ValueError):
+        parse_pillar(pattern)
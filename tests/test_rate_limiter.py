@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""공유 토큰 버킷 - 용량·충전·drain, 인스턴스와 프로세스가 같은 한도를 나눠 씀"""
+
+import multiprocessing
+import time
+
+import pytest
+
+from rate_limiter import TokenBucketLimiter, parse_limits
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / 'limit.sqlite3')
+
+
+def test_parse_limits():
+    assert parse_limits('a=10, b = 2.5,broken,') == {'a': 10.0, 'b': 2.5}
+    assert parse_limits(None) == {}
+
+
+def test_capacity_then_empty(path):
+    limiter = TokenBucketLimiter(path, default_rpm=5, limits={'fast': 60})
+    assert [limiter.acquire('m') for _ in range(6)] == [True] * 5 + [False]
+    assert limiter.headroom('fast') == 60  # 모델별 버킷
+    assert limiter.stats(['m'])['m']['rpm'] == 5
+
+
+def test_refill_and_wait(path):
+    limiter = TokenBucketLimiter(path, default_rpm=600)  # 초당 10개
+    limiter.drain('m')
+    assert not limiter.acquire('m')
+    started = time.monotonic()
+    assert limiter.acquire('m', timeout=1)
+    assert 0.05 < time.monotonic() - started < 0.5
+    assert not limiter.acquire('m', timeout=0.01)  # 다음 토큰까지 0.1초 → 기다리지 않고 실패
+
+
+def test_instances_share_bucket(path):
+    first = TokenBucketLimiter(path, default_rpm=3)
+    second = TokenBucketLimiter(path, default_rpm=3)
+    assert first.acquire('m') and second.acquire('m') and first.acquire('m')
+    assert not second.acquire('m')
+    second.drain('m')
+    assert first.headroom('m') < 0.1
+
+
+def _grab(path, n, queue):
+    limiter = TokenBucketLimiter(path, default_rpm=20)
+    queue.put(sum(limiter.acquire('m') for _ in range(n)))
+
+
+def test_processes_share_bucket(path):
+    ctx = multiprocessing.get_context('fork')
+    queue = ctx.Queue()
+    workers = [ctx.Process(target=_grab, args=(path, 10, queue)) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(10)
+    granted = sum(queue.get(timeout=5) for _ in workers)
+    assert 20 <= granted <= 21  # 용량 20 + 실행 중 충전분
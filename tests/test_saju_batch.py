@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""일괄 계산 엔진 - 같은 입력이면 analyze_saju 와 같은 결과"""
+
+import numpy as np
+import pytest
+
+from saju_batch import analyze_saju_batch, render_row
+from saju_engine import get_saju_chart
+
+
+def random_inputs(n, seed, is_lunar):
+    rng = np.random.default_rng(seed)
+    years = rng.integers(1901, 2049, n)
+    months = rng.integers(1, 13, n)
+    days = rng.integers(1, 29, n)  # 모든 달에 있는 날짜
+    hours = rng.integers(0, 24, n)
+    genders = rng.choice(['남', '여'], n)
+    return years, months, days, hours, genders, np.full(n, is_lunar)
+
+
+def assert_same(row, chart):
+    expected = chart.to_dict()
+    rendered = render_row(row)
+    solar = chart.solar_date
+    assert rendered['solar_date'] == f'{solar.year}-{solar.month:02d}-{solar.day:02d}'
+    assert rendered['pillars'] == {k: v['label'] for k, v in expected['pillars'].items()}
+    assert rendered['ohaeng'] == expected['ohaeng']['count']
+    assert rendered['sipsin'] == expected['sipsin']
+    assert rendered['relations'] == expected['relations']
+    assert rendered['sinsal'] == expected['sinsal']
+    assert rendered['yongsin']['strength'] == expected['yongsin']['strength']
+    assert rendered['yongsin']['yongsin_ohaeng'] == expected['yongsin']['yongsin_ohaeng']
+    assert row['daeun_start_age'] == expected['daeun']['start_age']
+    step = 1 if row['daeun_forward'] else -1
+    assert expected['daeun']['list'][0]['gan'] == (chart.month_gan + step) % 10
+
+
+@pytest.mark.parametrize('is_lunar', [False, True])
+def test_batch_matches_scalar(is_lunar):
+    years, months, days, hours, genders, lunar = random_inputs(1500, 7 + is_lunar, is_lunar)
+    rows = analyze_saju_batch(years, months, days, hours, genders, lunar)
+    for i, row in enumerate(rows):
+        chart = get_saju_chart(int(years[i]), int(months[i]), int(days[i]), int(hours[i]), str(genders[i]),
+                               is_lunar=is_lunar)
+        assert_same(row, chart)
+
+
+def test_leap_month_and_jeol_boundaries():
+    # 윤달 (2020년 윤4월), 입춘 당일 절입 전후 (2024-02-04 17:27), 자시 경계
+    cases = [(2020, 4, 10, 9, '여', True, True), (2020, 4, 10, 9, '여', True, False),
+             (2024, 2, 4, 16, '남', False, False), (2024, 2, 4, 18, '남', False, False),
+             (1999, 12, 31, 23, '남', False, False), (2000, 1, 1, 0, '여', False, False)]
+    columns = [np.array(column) for column in zip(*cases)]
+    rows = analyze_saju_batch(*columns[:5], is_lunar=columns[5], is_leap_month=columns[6])
+    for row, case in zip(rows, cases):
+        assert_same(row, get_saju_chart(*case))
+
+
+@pytest.mark.parametrize('column, value', [(3, 24), (3, -1), (1, 13), (2, 32)])
+def test_invalid_rows_raise(column, value):
+    inputs = [np.array([1990, 1990]), np.array([5, 5]), np.array([15, 15]), np.array([14, 14]),
+              np.array(['남', '여'])]
+    inputs[column][1] = value
+    with pytest.raises(ValueError, match='1번째 행'):
+        analyze_saju_batch(*inputs)
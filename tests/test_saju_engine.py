@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""사주 원국 - 절기 테이블 경계, 만세력 경로와 계산 경로의 시각 처리"""
+
+import pytest
+
+import saju_engine
+from saju_engine import CHEONGAN_KR, JIJI_KR, get_saju_chart
+
+
+@pytest.fixture(params=['manseryeok', 'computed'])
+def path(request, monkeypatch):
+    if request.param == 'computed':
+        monkeypatch.setattr(saju_engine, 'get_pillars_from_manseryeok', lambda solar_date, hour: None)
+    return request.param
+
+
+def label(gan, ji):
+    return CHEONGAN_KR[gan] + JIJI_KR[ji]
+
+
+def test_day_pillar_reference(path):
+    # get_day_pillar 기준일 1949-12-21 = 갑자일, 60일 뒤도 갑자일
+    for day in (21, 22):
+        chart = get_saju_chart(1949, 12, day, 12, '남')
+        assert label(chart.day_gan, chart.day_ji) == ('갑자' if day == 21 else '을축')
+    chart = get_saju_chart(1950, 2, 19, 12, '남')
+    assert label(chart.day_gan, chart.day_ji) == '갑자'
+
+
+@pytest.mark.parametrize('hour, year_pillar, month_pillar', [(16, '계묘', '을축'), (18, '갑진', '병인')])
+def test_ipchun_boundary(path, hour, year_pillar, month_pillar):
+    # 2024년 입춘 2월 4일 17:27
+    chart = get_saju_chart(2024, 2, 4, hour, '여')
+    assert label(chart.year_gan, chart.year_ji) == year_pillar
+    assert label(chart.month_gan, chart.month_ji) == month_pillar
+
+
+@pytest.mark.parametrize('hour', [0, 23])
+def test_hour_range_accepted(path, hour):
+    assert get_saju_chart(1990, 5, 15, hour, '남').hour_ji == 0  # 자시
+
+
+@pytest.mark.parametrize('hour', [-1, 24])
+def test_hour_out_of_range(path, hour):
+    with pytest.raises(ValueError, match='0~23'):
+        get_saju_chart(1990, 5, 15, hour, '남')
+
+
+def test_api_rejects_bad_hour():
+    from app import app
+    res = app.test_client().post('/api/saju', json={'year': 1990, 'month': 5, 'day': 15, 'hour': 24,
+                                                    'gender': '남'})
+    assert res.status_code == 400
+    assert '0~23' in res.get_json()['error']
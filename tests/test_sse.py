@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""스트리밍 API - 이벤트 순서 chart → local → chunk… → done, 캐시 적중·오류 시 형식"""
+
+import json
+import time
+
+import pytest
+
+from app import app
+from ai_interpreter import INVALID_CATEGORY_ERROR, NO_API_KEY_ERROR
+
+INPUT = {'year': 1990, 'month': 5, 'day': 15, 'hour': 14, 'gender': '남'}
+
+
+def stream(path, data):
+    res = app.test_client().post(path, json=data)
+    assert res.status_code == 200
+    assert res.mimetype == 'text/event-stream'
+    assert res.headers['Cache-Control'] == 'no-cache'
+    events = []
+    for block in res.get_data().split(b'\n\n')[:-1]:
+        event, payload = block.split(b'\n')
+        assert event.startswith(b'event: ') and payload.startswith(b'data: ')
+        events.append((event[7:].decode(), json.loads(payload[6:])))
+    return events
+
+
+def kinds(events):
+    return [kind for kind, _ in events]
+
+
+def test_full_stream_then_cache_hit(gemini):
+    events = stream('/api/saju/full/stream', INPUT)
+    assert kinds(events)[:2] == ['chart', 'local']
+    assert set(kinds(events)[2:-1]) == {'chunk'} and len(events) > 4
+    assert events[-1] == ('done', {'available': True, 'message': ''})
+    chart = events[0][1]
+    assert chart['chart_id'] and chart['input']['year'] == 1990
+    text = ''.join(data['text'] for kind, data in events if kind == 'chunk')
+    assert text
+
+    # 같은 명식을 chart_id 만으로 다시 요청 → 캐시 적중, 전체가 한 조각
+    calls = sum(gemini.stats().values())
+    again = stream('/api/saju/full/stream', {'chart_id': chart['chart_id']})
+    assert kinds(again) == ['chart', 'local', 'chunk', 'done']
+    assert again[0][1] == chart and again[2][1]['text'] == text
+    assert sum(gemini.stats().values()) == calls
+
+
+def test_detail_stream(gemini):
+    events = stream('/api/saju/detail/stream', dict(INPUT, category='money'))
+    assert kinds(events)[:3] == ['chart', 'local', 'chunk']
+    assert events[-1][1]['available'] is True
+
+
+def test_invalid_category(gemini):
+    events = stream('/api/saju/detail/stream', dict(INPUT, category='nope'))
+    assert kinds(events) == ['chart', 'done']
+    assert events[-1][1] == {'available': False, 'message': INVALID_CATEGORY_ERROR}
+
+
+def test_without_api_key_keeps_local(tmp_path, monkeypatch):
+    import ai_interpreter
+    from ai_cache import InterpretationCache
+    monkeypatch.setattr(ai_interpreter, 'AI_CACHE', InterpretationCache(str(tmp_path / 'cache.sqlite3')))
+    events = stream('/api/saju/full/stream', INPUT)
+    assert kinds(events) == ['chart', 'local', 'done']
+    assert events[-1][1] == {'available': False, 'message': NO_API_KEY_ERROR}
+
+
+@pytest.mark.parametrize('path', ['/api/saju/full/stream', '/api/saju/detail/stream'])
+def test_bad_input_is_plain_400(path):
+    res = app.test_client().post(path, json=dict(INPUT, hour=25))
+    assert res.status_code == 400
+    assert 'error' in res.get_json()
+
+
+def test_stream_stops_within_budget(gemini, monkeypatch):
+    import ai_interpreter
+    monkeypatch.setattr(ai_interpreter, 'MIN_ATTEMPT_TIMEOUT', 0.2)
+
+    # 429 재시도 대기가 예산을 넘으면 기다리지 않고 끝냄
+    gemini.rate_429 = 1.0
+    started = time.monotonic()
+    events = list(ai_interpreter._stream_gemini('429 프롬프트', budget=3))
+    assert time.monotonic() - started < 2
+    assert events == [('done', {'success': False, 'error': ai_interpreter.RATE_LIMIT_ERROR})]
+    assert ai_interpreter.MODEL_HEALTH.stats([ai_interpreter.GEMINI_MODELS[0]])[
+        ai_interpreter.GEMINI_MODELS[0]]['rate_limited_rate'] == 1.0
+
+    # 조각이 느리게 오면 예산에서 끊고 실패로 끝냄 (캐시 저장 안 함)
+    gemini.rate_429 = 0.0
+    gemini.latency = lambda: 4.0
+    started = time.monotonic()
+    events = list(ai_interpreter._stream_gemini('느린 프롬프트', budget=1))
+    assert time.monotonic() - started < 2
+    assert events[0][0] == 'chunk'
+    assert events[-1] == ('done', {'success': False, 'error': ai_interpreter.TIMEOUT_ERROR})
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""콜드 스타트 - 지연 임포트, 마스터 사전 로드, 워커 워밍업"""
+
+import subprocess
+import sys
+
+from conftest import ROOT
+
+
+def run(code):
+    # 새 프로세스에서 import 상태 확인 (환경 변수는 conftest 의 임시 경로 그대로)
+    return subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, timeout=60)
+
+
+def test_import_app_defers_requests():
+    result = run(
+        "import sys, app\n"
+        "assert 'requests' not in sys.modules, 'requests imported eagerly'\n"
+        "app.preload_shared()\n"
+        "assert 'requests' in sys.modules\n"
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_gunicorn_hooks():
+    result = run(
+        "import gc, runpy\n"
+        "conf = runpy.run_path('gunicorn.conf.py')\n"
+        "assert conf['preload_app'] and conf['timeout'] == 120\n"
+        "conf['when_ready'](None)\n"
+        "assert gc.get_freeze_count() > 0\n"
+        "import app\n"
+        "app.warm_up()\n"
+        "assert app.CHART_JSON_CACHE.stats()['size'] == 1, app.CHART_JSON_CACHE.stats()\n"
+    )
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""AI 캐시 예열 - 로그 파싱, 명식 단위 순위, 호출 수 추정, 선행 생성 표시"""
+
+import json
+
+import pytest
+
+import ai_interpreter
+from saju_engine import get_saju_chart
+from tools import warm_ai_cache
+from tools.warm_ai_cache import call_cost, parse_entry, rank_charts, read_logs, warm_chart
+
+BIRTH = {'year': 1990, 'month': 5, 'day': 15, 'hour': 14, 'gender': '남'}
+
+
+def line(**fields):
+    return json.dumps(dict(BIRTH, **fields), ensure_ascii=False)
+
+
+def test_parse_entry():
+    assert parse_entry(line()) == ((1990, 5, 15, 14, '남', False, False), 'full', None)
+    assert parse_entry(line(kind='detail', category='money', ts=5))[1:] == ('money', 5)
+    assert parse_entry('{"year": 1990}') is None
+    assert parse_entry('not json') is None
+    assert parse_entry(json.dumps(dict(BIRTH, hour='x'))) is None
+
+
+def test_read_logs_and_rank(tmp_path):
+    path = tmp_path / 'requests.jsonl'
+    path.write_text('\n'.join([
+        line(ts=100), line(hour=13, ts=100),                    # 같은 시지 → 같은 명식
+        line(month=4, day=21, is_lunar=True, ts=100),           # 같은 날의 음력 입력
+        line(kind='detail', category='love', ts=100),
+        line(year=2000, month=1, day=1, ts=100),
+        line(ts=1),                                             # since 이전
+        line(month=13, ts=100),                                 # 계산 불가
+        'broken', '',
+    ]), encoding='utf-8')
+
+    counts, kinds, skipped = read_logs([str(path)], since=50)
+    assert skipped == 1 and sum(counts.values()) == 6
+    ranked, invalid = rank_charts(counts, kinds)
+    assert invalid == 1
+    assert [item[0] for item in ranked] == [4, 1]
+    assert ranked[0][3] == {'full': 3, 'love': 1}
+
+
+@pytest.mark.parametrize('bundle, expected', [(False, 6), (True, 2)])
+def test_call_cost(monkeypatch, bundle, expected):
+    monkeypatch.setattr(warm_ai_cache, 'GEMINI_CATEGORY_BUNDLE', bundle)
+    assert call_cost(warm_ai_cache.KINDS) == expected
+    assert call_cost(('full',)) == 1
+    assert call_cost(()) == 0
+
+
+def test_warm_chart_marks_prefetched(gemini, monkeypatch):
+    monkeypatch.setattr(warm_ai_cache, 'AI_CACHE', ai_interpreter.AI_CACHE)
+    chart = get_saju_chart(1990, 5, 15, 14, '남')
+    prompt = ai_interpreter.build_saju_prompt(chart)
+    missing = ai_interpreter.missing_interpretations(chart, ('full', 'love'), prompt)
+    assert missing == ['full', 'love']
+
+    assert warm_chart(chart, prompt, missing, missing, limit_wait=0) == (True, None)
+    assert ai_interpreter.missing_interpretations(chart, ('full', 'love'), prompt) == []
+    assert ai_interpreter.AI_CACHE.stats()['prefetch_pending'] == 2
+    assert sum(gemini.stats().values()) == 2
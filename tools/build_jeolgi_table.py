@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+절기(節氣) 테이블 생성 스크립트 (빌드 전용)
+- 1899년 대설 ~ 2101년 소한까지 12절(節)의 입기 시각을 분 단위로 산출
+- 태양 시황경(apparent longitude)이 15°+30°k 가 되는 순간을 이분법으로 탐색
+- 결과는 한국 상용시(Asia/Seoul, 서머타임·표준시 변경 이력 포함)로 변환하여
+  saju_engine 이 그대로 bisect 할 수 있는 정렬된 정수 튜플로 저장
+
+사용법:
+    pip install ephem          # 빌드 시에만 필요 (서비스 의존성 아님)
+    python tools/build_jeolgi_table.py > jeolgi_data.py
+"""
+
+import math
+import sys
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import ephem
+
+SEOUL = ZoneInfo('Asia/Seoul')
+
+# 12절(節)의 태양 황경 (소한부터 대설까지, 양력 순서)
+JEOL_LONGITUDES = [285, 315, 345, 15, 45, 75, 105, 135, 165, 195, 225, 255]
+JEOL_NAMES = ['소한', '입춘', '경칩', '청명', '입하', '망종',
+              '소서', '입추', '백로', '한로', '입동', '대설']
+
+FIRST_YEAR = 1900
+LAST_YEAR = 2100
+
+
+def sun_longitude(d):
+    """ephem 날짜(UT)의 태양 시황경 (도)"""
+    sun = ephem.Sun(d)
+    # ra/dec 는 장동·광행차가 반영된 시위치 → 같은 역기(epoch)의 황도좌표로 변환
+    apparent = ephem.Equatorial(sun.ra, sun.dec, epoch=d)
+    return math.degrees(ephem.Ecliptic(apparent, epoch=d).lon)
+
+
+def find_term(target, approx):
+    """approx(UT datetime) 부근에서 태양 황경이 target 이 되는 순간(UT)을 구합니다."""
+    def diff(d):
+        return (sun_longitude(d) - target + 180.0) % 360.0 - 180.0
+
+    lo = ephem.Date(approx - timedelta(days=4))
+    hi = ephem.Date(approx + timedelta(days=4))
+    assert diff(lo) < 0 < diff(hi), (target, approx)
+    while (hi - lo) * 86400 > 1:
+        mid = ephem.Date((lo + hi) / 2)
+        if diff(mid) < 0:
+            lo = mid
+        else:
+            hi = mid
+    return ephem.Date((lo + hi) / 2).datetime().replace(tzinfo=timezone.utc)
+
+
+def ordinal_minutes(dt):
+    """datetime → 서기 1년 1월 1일 기준 누적 분 (saju_engine 조회 키와 동일)"""
+    return dt.toordinal() * 1440 + dt.hour * 60 + dt.minute
+
+
+def build():
+    # (연도, 절 순번) 목록: 1899 대설, 1900~2100 전체, 2101 소한
+    slots = [(FIRST_YEAR - 1, 11)]
+    slots += [(y, k) for y in range(FIRST_YEAR, LAST_YEAR + 1) for k in range(12)]
+    slots += [(LAST_YEAR + 1, 0)]
+
+    table = []
+    for year, k in slots:
+        # 평균 입기일 근처에서 탐색 (소한 1/6, 입춘 2/4 ... 대설 12/7)
+        approx = datetime(year, k + 1, 6)
+        utc = find_term(JEOL_LONGITUDES[k], approx)
+        # 분 단위 반올림 (천문 연감 표기 관례)
+        local = (utc + timedelta(seconds=30)).astimezone(SEOUL)
+        table.append((year, k, ordinal_minutes(local), local))
+    return table
+
+
+def main(out=sys.stdout):
+    table = build()
+    first_year, first_k = table[0][0], table[0][1]
+
+    out.write('# -*- coding: utf-8 -*-\n')
+    out.write('"""\n')
+    out.write('절기(節氣) 입기 시각 테이블 - tools/build_jeolgi_table.py 로 생성 (직접 수정 금지)\n')
+    out.write(f'- {table[0][3]:%Y-%m-%d %H:%M} {JEOL_NAMES[first_k]} ~ '
+              f'{table[-1][3]:%Y-%m-%d %H:%M} {JEOL_NAMES[table[-1][1]]}\n')
+    out.write('- 한국 상용시(Asia/Seoul) 기준, 서기 1년 1월 1일부터의 누적 분\n')
+    out.write('"""\n\n')
+    out.write(f'# JEOL_MINUTES[0] 은 {first_year}년 {JEOL_NAMES[first_k]}(절 순번 {first_k}, 0=소한)\n')
+    out.write(f'JEOL_FIRST_YEAR = {first_year}\n')
+    out.write(f'JEOL_FIRST_INDEX = {first_k}\n\n')
+    out.write('JEOL_MINUTES = (\n')
+    values = [row[2] for row in table]
+    for i in range(0, len(values), 6):
+        out.write('    ' + ', '.join(str(v) for v in values[i:i + 6]) + ',\n')
+    out.write(')\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+만세력 바이너리 파일 생성 스크립트 (빌드 단계)
+- 1900-01-01 ~ 2100-12-31 하루당 고정 크기 레코드 하나
+- 레코드: 일주·연주·월주(00:00 기준 60갑자 번호), 플래그, 그날 절입 시각(분),
+  음력 연/월/일 (음력 색인 범위 밖이면 0, 플래그 bit1 꺼짐)
+- saju_engine 이 import 시 mmap 으로 열어 날짜 조회를 오프셋 읽기 한 번으로 처리
+- 헤더에 절기 테이블 CRC 를 기록 → jeolgi_data.py 를 다시 만들면 이 파일도 다시 생성
+
+사용법:
+    python tools/build_manseryeok.py [출력 경로]    # 기본: saju_engine.MANSERYEOK_PATH
+"""
+
+import os
+import sys
+from bisect import bisect_left
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from saju_engine import (  # noqa: E402
+    JEOL_MINUTES, MANSERYEOK_PATH, MANSERYEOK_MAGIC, MANSERYEOK_VERSION,
+    MANSERYEOK_HEADER, MANSERYEOK_RECORD, MANSERYEOK_NO_JEOL,
+    MANSERYEOK_LEAP, MANSERYEOK_HAS_LUNAR,
+    jeol_table_crc, get_year_pillar, get_saju_month, get_month_pillar, get_day_pillar,
+    solar_to_lunar,
+)
+
+FIRST_DATE = datetime(1900, 1, 1)
+LAST_DATE = datetime(2100, 12, 31)
+
+
+def ganzhi_index(gan, ji):
+    """(천간, 지지) → 60갑자 번호"""
+    return (6 * gan - 5 * ji) % 60
+
+
+def build_record(day):
+    year_gan, year_ji = get_year_pillar(day)
+    month_gz = ganzhi_index(*get_month_pillar(year_gan, get_saju_month(day)))
+
+    # 그날 00:00 초과 ~ 24:00 미만에 드는 절입 시각 (00:00 정각 절입은 이미 00:00 기준에 반영)
+    start = day.toordinal() * 1440
+    i = bisect_left(JEOL_MINUTES, start + 1)
+    jeol_minute = MANSERYEOK_NO_JEOL
+    if i < len(JEOL_MINUTES) and JEOL_MINUTES[i] < start + 1440:
+        jeol_minute = JEOL_MINUTES[i] - start
+
+    flags, lunar = 0, (0, 0, 0)
+    converted = solar_to_lunar(day)
+    if converted is not None:
+        lunar, is_leap = converted[:3], converted[3]
+        flags = MANSERYEOK_HAS_LUNAR | (MANSERYEOK_LEAP if is_leap else 0)
+
+    return MANSERYEOK_RECORD.pack(
+        ganzhi_index(*get_day_pillar(day)), ganzhi_index(year_gan, year_ji), month_gz,
+        flags, jeol_minute, *lunar)
+
+
+def main(path=MANSERYEOK_PATH):
+    days = (LAST_DATE - FIRST_DATE).days + 1
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(MANSERYEOK_HEADER.pack(
+            MANSERYEOK_MAGIC, MANSERYEOK_VERSION, MANSERYEOK_RECORD.size,
+            FIRST_DATE.toordinal(), days, jeol_table_crc()))
+        for i in range(days):
+            f.write(build_record(FIRST_DATE + timedelta(days=i)))
+    # 실행 중인 프로세스가 mmap 한 기존 파일은 그대로 두고 교체
+    os.replace(tmp, path)
+    print(f'{path}: {days}일, {os.path.getsize(path):,} bytes')
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:2])
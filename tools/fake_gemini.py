@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+"""
+로컬 Gemini 대역 서버 (부하 테스트·개발용, 표준 라이브러리만 사용)
+- POST /v1beta/models/{모델}:generateContent
+- POST /v1beta/models/{모델}:streamGenerateContent?alt=sse  (조각을 나눠 chunked 전송)
+- POST /v1beta/cachedContents, PATCH /v1beta/cachedContents/{id}  (컨텍스트 캐시)
+- GET /stats  → 모델·결과별 호출 수, POST /reset → 카운터 초기화
+- responseSchema 가 있는 요청은 스키마의 키마다 문자열을 채운 JSON 으로 응답
+
+앱을 이 서버로 돌리기:
+    GEMINI_API_ROOT=http://127.0.0.1:8799/v1beta GEMINI_API_KEY=fake gunicorn app:app -c gunicorn.conf.py
+
+사용법:
+    python tools/fake_gemini.py [--port 8799] [--latency lognormal:8:0.4] [--time-scale 0.1]
+        [--rate-429 0.05] [--rpm 15] [--missing gemini-2.0-flash,...] [--rate-403 0]
+        [--chunks 8] [--chars 2000] [--no-context-cache]
+
+지연 분포 (초, --time-scale 을 곱함):
+    fixed:S            항상 S
+    uniform:A:B        A~B 균등
+    lognormal:M:SIGMA  중앙값 M, 로그 표준편차 SIGMA (실제 Gemini 응답 시간과 비슷한 꼬리)
+"""
+
+import argparse
+import json
+import math
+import random
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+GENERATE_PATH = re.compile(r'^/v1beta/models/([^/:]+):(generateContent|streamGenerateContent)$')
+CACHE_PATH = re.compile(r'^/v1beta/cachedContents(?:/([^/]+))?$')
+
+
+def parse_latency(spec):
+    """'lognormal:8:0.4' → 지연(초)을 뽑는 함수"""
+    kind, *args = spec.split(':')
+    args = [float(a) for a in args]
+    if kind == 'fixed':
+        return lambda: args[0]
+    if kind == 'uniform':
+        return lambda: random.uniform(args[0], args[1])
+    if kind == 'lognormal':
+        return lambda: random.lognormvariate(math.log(args[0]), args[1])
+    raise ValueError(f'알 수 없는 지연 분포: {spec}')
+
+
+class FakeGemini:
+    """대역 서버 상태 (설정 + 모델별 분당 한도 + 호출 카운터)"""
+
+    def __init__(self, latency='lognormal:8:0.4', time_scale=1.0, rate_429=0.0, rpm=0, missing=(),
+                 rate_403=0.0, chunks=8, chars=2000, context_cache=True):
+        self.latency = parse_latency(latency)
+        self.time_scale = time_scale
+        self.rate_429 = rate_429
+        self.rpm = rpm
+        self.missing = set(missing)
+        self.rate_403 = rate_403
+        self.chunks = max(1, chunks)
+        self.chars = chars
+        self.context_cache = context_cache
+        self.lock = threading.Lock()
+        self.counts = Counter()
+        self.windows = {}   # 모델 → 최근 1분 호출 시각
+        self.cached = {}    # cachedContents 이름 → 모델
+
+    def count(self, *key):
+        with self.lock:
+            self.counts['/'.join(key)] += 1
+
+    def stats(self):
+        with self.lock:
+            return dict(self.counts)
+
+    def reset(self):
+        with self.lock:
+            self.counts.clear()
+            self.windows.clear()
+
+    def decide(self, model):
+        """이번 호출의 HTTP 상태 (404 → 403 → 분당 한도 → 무작위 429 순)"""
+        if model in self.missing:
+            return 404
+        if random.random() < self.rate_403:
+            return 403
+        if self.rpm:
+            now = time.monotonic()
+            with self.lock:
+                window = [t for t in self.windows.get(model, []) if now - t < 60]
+                if len(window) >= self.rpm:
+                    self.windows[model] = window
+                    return 429
+                window.append(now)
+                self.windows[model] = window
+        if random.random() < self.rate_429:
+            return 429
+        return 200
+
+    def delay(self):
+        return max(0.0, self.latency()) * self.time_scale
+
+    def text(self, model, body):
+        """응답 본문 텍스트 (responseSchema 가 있으면 스키마 키마다 문자열을 채운 JSON)"""
+        filler = f'[{model}] 대역 서버 해석입니다. ' * max(1, self.chars // 24)
+        schema = body.get('generationConfig', {}).get('responseSchema')
+        if schema:
+            return json.dumps({key: f'{key}: {filler}' for key in schema.get('properties', {})},
+                              ensure_ascii=False)
+        return filler
+
+
+def make_handler(fake):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, *args):
+            pass
+
+        def read_json(self):
+            length = int(self.headers.get('Content-Length') or 0)
+            return json.loads(self.rfile.read(length) or b'{}')
+
+        def send_json(self, status, obj):
+            data = json.dumps(obj, ensure_ascii=False).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def send_error_json(self, status, message):
+            self.send_json(status, {'error': {'code': status, 'message': message}})
+
+        def do_GET(self):
+            if urlparse(self.path).path == '/stats':
+                return self.send_json(200, fake.stats())
+            self.send_error_json(404, 'not found')
+
+        def do_PATCH(self):
+            match = CACHE_PATH.match(urlparse(self.path).path)
+            self.read_json()
+            name = match and f'cachedContents/{match.group(1)}'
+            if not name or name not in fake.cached:
+                fake.count('cache', 'patch', '404')
+                return self.send_error_json(404, 'cached content not found')
+            fake.count('cache', 'patch', '200')
+            self.send_json(200, {'name': name, 'model': f'models/{fake.cached[name]}'})
+
+        def do_POST(self):
+            path = urlparse(self.path).path
+            if path == '/reset':
+                fake.reset()
+                return self.send_json(200, {})
+            body = self.read_json()
+
+            if CACHE_PATH.match(path):
+                model = body.get('model', '').split('/')[-1]
+                if not fake.context_cache:
+                    fake.count('cache', 'create', '400')
+                    return self.send_error_json(400, 'Cached content is too small.')
+                name = f'cachedContents/fake-{len(fake.cached) + 1}'
+                fake.cached[name] = model
+                fake.count('cache', 'create', '200')
+                return self.send_json(200, {'name': name, 'model': f'models/{model}'})
+
+            match = GENERATE_PATH.match(path)
+            if not match:
+                return self.send_error_json(404, 'not found')
+            model, method = match.groups()
+            if body.get('cachedContent') and body['cachedContent'] not in fake.cached:
+                fake.count(model, '400')
+                return self.send_error_json(400, 'cached content not found')
+
+            status = fake.decide(model)
+            fake.count(model, str(status))
+            if status != 200:
+                time.sleep(min(fake.delay(), 0.2 * fake.time_scale))
+                messages = {404: f'models/{model} is not found', 403: 'API key not valid',
+                            429: 'Resource has been exhausted'}
+                return self.send_error_json(status, messages[status])
+
+            text = fake.text(model, body)
+            if method == 'generateContent':
+                time.sleep(fake.delay())
+                return self.send_json(200, {'candidates': [{'content': {'parts': [{'text': text}]}}]})
+
+            # 스트리밍: 지연을 조각 수로 나눠 chunked 로 흘려보냄
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/event-stream')
+            self.send_header('Transfer-Encoding', 'chunked')
+            self.end_headers()
+            step = max(1, math.ceil(len(text) / fake.chunks))
+            pause = fake.delay() / fake.chunks
+            for i in range(0, len(text), step):
+                time.sleep(pause)
+                event = {'candidates': [{'content': {'parts': [{'text': text[i:i + step]}]}}]}
+                data = b'data: ' + json.dumps(event, ensure_ascii=False).encode() + b'\r\n\r\n'
+                self.wfile.write(b'%x\r\n%s\r\n' % (len(data), data))
+                self.wfile.flush()
+            self.wfile.write(b'0\r\n\r\n')
+
+    return Handler
+
+
+def serve(fake, host='127.0.0.1', port=8799):
+    """대역 서버 시작 (백그라운드 스레드) → ThreadingHTTPServer"""
+    server = ThreadingHTTPServer((host, port), make_handler(fake))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='fake-gemini', daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description='로컬 Gemini 대역 서버')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8799)
+    parser.add_argument('--latency', default='lognormal:8:0.4')
+    parser.add_argument('--time-scale', type=float, default=1.0)
+    parser.add_argument('--rate-429', type=float, default=0.0)
+    parser.add_argument('--rpm', type=int, default=0, help='모델별 분당 한도 (0 이면 없음)')
+    parser.add_argument('--missing', default='', help='404 를 돌려줄 모델 (쉼표 구분)')
+    parser.add_argument('--rate-403', type=float, default=0.0)
+    parser.add_argument('--chunks', type=int, default=8)
+    parser.add_argument('--chars', type=int, default=2000)
+    parser.add_argument('--no-context-cache', action='store_true')
+    args = parser.parse_args()
+
+    fake = FakeGemini(
+        latency=args.latency, time_scale=args.time_scale, rate_429=args.rate_429, rpm=args.rpm,
+        missing=[m for m in args.missing.split(',') if m], rate_403=args.rate_403,
+        chunks=args.chunks, chars=args.chars, context_cache=not args.no_context_cache,
+    )
+    serve(fake, args.host, args.port)
+    print(f"[대역 서버] http://{args.host}:{args.port}/v1beta (지연 {args.latency} × {args.time_scale})", flush=True)
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+"""
+종단 간 부하 테스트 드라이버
+- 실제 요청 구성(명식만 / 종합 해석 / 카테고리 상세 / 종합 스트리밍)을 비율대로 섞어 동시에 보냄
+- 출생 정보는 --profiles 명 풀에서 골라 반복 (같은 사람이 다시 보는 캐시 적중 패턴 재현),
+  상세 요청은 그 사람이 앞서 받은 chart_id 가 있으면 함께 보냄
+- 결과: 처리량, 종류별 p50/p95/p99 지연·오류 수, 대역 서버 기준 업스트림 호출 수
+
+--spawn: 대역 서버(tools/fake_gemini.py)와 gunicorn 을 임시 DB 경로로 직접 띄워서 측정 후 종료
+    python tools/load_test.py --spawn --workers 2 --concurrency 16 --duration 30 --time-scale 0.05
+
+이미 떠 있는 서버에 보내기 (대역 서버 통계는 --fake 로):
+    python tools/load_test.py --target http://127.0.0.1:5000 --fake http://127.0.0.1:8799
+
+요청 구성: --mix chart=5,full=2,detail=3,stream=0
+"""
+
+import argparse
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+
+import requests
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'tools'))
+
+CATEGORIES = ('love', 'money', 'career', 'health', 'yearly')
+ENDPOINTS = {
+    'chart': '/api/saju',
+    'full': '/api/saju/full',
+    'detail': '/api/saju/detail',
+    'stream': '/api/saju/full/stream',
+}
+
+
+def parse_mix(text):
+    """'chart=5,full=2' → [(종류, 가중치)]"""
+    mix = []
+    for item in text.split(','):
+        kind, weight = item.split('=')
+        if kind not in ENDPOINTS:
+            raise ValueError(f'알 수 없는 요청 종류: {kind}')
+        if float(weight) > 0:
+            mix.append((kind, float(weight)))
+    return mix
+
+
+def make_profiles(count, seed):
+    """출생 정보 풀 (1950~2005년, 10% 음력)"""
+    rng = random.Random(seed)
+    profiles = []
+    for _ in range(count):
+        lunar = rng.random() < 0.1
+        profiles.append({
+            'year': rng.randint(1950, 2005), 'month': rng.randint(1, 12),
+            'day': rng.randint(1, 28 if not lunar else 29), 'hour': rng.randint(0, 23),
+            'gender': rng.choice(('남', '여')), 'is_lunar': lunar,
+        })
+    return profiles
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+class LoadRun:
+    """가상 사용자 스레드들이 공유하는 상태 (chart_id, 지연 기록)"""
+
+    def __init__(self, target, mix, profiles, timeout):
+        self.target = target.rstrip('/')
+        self.kinds = [k for k, _ in mix]
+        self.weights = [w for _, w in mix]
+        self.profiles = profiles
+        self.timeout = timeout
+        self.lock = threading.Lock()
+        self.chart_ids = {}
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.ai_unavailable = defaultdict(int)
+
+    def request(self, session, rng):
+        kind = rng.choices(self.kinds, self.weights)[0]
+        index = rng.randrange(len(self.profiles))
+        payload = dict(self.profiles[index])
+        if kind == 'detail':
+            payload['category'] = rng.choice(CATEGORIES)
+            with self.lock:
+                if index in self.chart_ids:
+                    payload['chart_id'] = self.chart_ids[index]
+
+        started = time.perf_counter()
+        try:
+            response = session.post(self.target + ENDPOINTS[kind], json=payload, timeout=self.timeout,
+                                    stream=kind == 'stream')
+            if kind == 'stream':
+                body = b''.join(response.iter_content(chunk_size=None))
+                ok = response.status_code == 200 and b'event: done' in body
+                available = b'"available":true' in body
+                data = {}
+            else:
+                data = response.json()
+                ok = response.status_code == 200 and 'error' not in data
+                available = data.get('available', data.get('ai_interpretation', {}).get('available', True))
+        except (requests.RequestException, ValueError):
+            ok, available, data = False, False, {}
+        elapsed = time.perf_counter() - started
+
+        with self.lock:
+            if ok:
+                self.latencies[kind].append(elapsed)
+                if not available:
+                    self.ai_unavailable[kind] += 1
+                if data.get('chart_id'):
+                    self.chart_ids[index] = data['chart_id']
+            else:
+                self.errors[kind] += 1
+
+    def run(self, concurrency, duration, total, seed):
+        deadline = time.monotonic() + duration if duration else None
+        remaining = [total]
+
+        def take():
+            with self.lock:
+                if deadline is not None:
+                    return time.monotonic() < deadline
+                remaining[0] -= 1
+                return remaining[0] >= 0
+
+        def user(i):
+            rng = random.Random(seed * 1000 + i)
+            with requests.Session() as session:
+                while take():
+                    self.request(session, rng)
+
+        threads = [threading.Thread(target=user, args=(i,), daemon=True) for i in range(concurrency)]
+        started = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        return time.perf_counter() - started
+
+
+def fake_stats(fake_url):
+    if not fake_url:
+        return None
+    try:
+        return requests.get(fake_url.rstrip('/') + '/stats', timeout=5).json()
+    except requests.RequestException:
+        return None
+
+
+def report(run, wall, upstream_before, upstream_after):
+    done = sum(len(v) for v in run.latencies.values())
+    errors = sum(run.errors.values())
+    print(f"\n요청 {done + errors}건 ({errors}건 오류), {wall:.1f}초, 처리량 {done / wall:.1f} req/s")
+    print(f"{'종류':<8}{'성공':>7}{'오류':>6}{'AI없음':>8}{'p50':>9}{'p95':>9}{'p99':>9}{'평균':>9}  (ms)")
+    for kind in ENDPOINTS:
+        values = run.latencies.get(kind, [])
+        if not values and not run.errors.get(kind):
+            continue
+        cells = [percentile(values, q) * 1000 for q in (0.5, 0.95, 0.99)] + [statistics.mean(values) * 1000] \
+            if values else [0.0] * 4
+        print(f"{kind:<8}{len(values):>7}{run.errors.get(kind, 0):>6}{run.ai_unavailable.get(kind, 0):>8}"
+              + ''.join(f'{c:>9.1f}' for c in cells))
+    if upstream_after is not None:
+        before = upstream_before or {}
+        diff = {k: v - before.get(k, 0) for k, v in upstream_after.items() if v - before.get(k, 0)}
+        calls = sum(v for k, v in diff.items() if not k.startswith('cache/'))
+        ai_requests = sum(len(run.latencies.get(k, [])) for k in ('full', 'detail', 'stream'))
+        print(f"\n업스트림 호출 {calls}건 (AI 요청 {ai_requests}건당 {calls / ai_requests:.2f})"
+              if ai_requests else f"\n업스트림 호출 {calls}건")
+        for key in sorted(diff):
+            print(f"  {key}: {diff[key]}")
+
+
+def wait_ready(url, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if requests.get(url, timeout=2).status_code == 200:
+                return
+        except requests.RequestException:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f'{url} 응답 없음')
+
+
+def spawn(args):
+    """대역 서버(이 프로세스 안) + gunicorn(하위 프로세스) 시작 → (target, fake_url, 정리 함수)"""
+    from fake_gemini import FakeGemini, serve
+
+    fake = FakeGemini(latency=args.latency, time_scale=args.time_scale, rate_429=args.rate_429,
+                      rpm=args.fake_rpm, missing=[m for m in args.missing.split(',') if m])
+    fake_server = serve(fake, port=args.fake_port)
+    fake_url = f'http://127.0.0.1:{args.fake_port}'
+
+    tmp = tempfile.mkdtemp(prefix='saju-load-')
+    env = dict(os.environ, GEMINI_API_ROOT=f'{fake_url}/v1beta', GEMINI_API_KEY='fake',
+               WEB_CONCURRENCY=str(args.workers), PORT=str(args.port))
+    for name in ('AI_CACHE', 'AI_JOBS', 'RATE_LIMIT', 'MODEL_HEALTH', 'CHART_STORE', 'CONTEXT_CACHE'):
+        env[f'{name}_PATH'] = os.path.join(tmp, f'{name.lower()}.sqlite3')
+    gunicorn = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', 'app:app', '-c', 'gunicorn.conf.py',
+         '--bind', f'127.0.0.1:{args.port}', '--log-level', 'warning'],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL if not args.verbose else None,
+        stderr=subprocess.DEVNULL if not args.verbose else None)
+    target = f'http://127.0.0.1:{args.port}'
+    try:
+        wait_ready(target + '/api/health')
+    except RuntimeError:
+        gunicorn.kill()
+        raise
+
+    def stop():
+        gunicorn.terminate()
+        gunicorn.wait(timeout=30)
+        fake_server.shutdown()
+
+    return target, fake_url, stop
+
+
+def main():
+    parser = argparse.ArgumentParser(description='종단 간 부하 테스트')
+    parser.add_argument('--target', default='http://127.0.0.1:5000')
+    parser.add_argument('--fake', default='', help='대역 서버 주소 (업스트림 호출 수 집계)')
+    parser.add_argument('--mix', default='chart=5,full=2,detail=3')
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--duration', type=float, default=30, help='초 (0 이면 --requests 건수만큼)')
+    parser.add_argument('--requests', type=int, default=0)
+    parser.add_argument('--profiles', type=int, default=200)
+    parser.add_argument('--timeout', type=float, default=180)
+    parser.add_argument('--seed', type=int, default=1)
+    spawn_group = parser.add_argument_group('--spawn (대역 서버 + gunicorn 직접 실행)')
+    spawn_group.add_argument('--spawn', action='store_true')
+    spawn_group.add_argument('--workers', type=int, default=2)
+    spawn_group.add_argument('--port', type=int, default=5055)
+    spawn_group.add_argument('--fake-port', type=int, default=8799)
+    spawn_group.add_argument('--latency', default='lognormal:8:0.4')
+    spawn_group.add_argument('--time-scale', type=float, default=0.05)
+    spawn_group.add_argument('--rate-429', type=float, default=0.0)
+    spawn_group.add_argument('--fake-rpm', type=int, default=0)
+    spawn_group.add_argument('--missing', default='')
+    spawn_group.add_argument('--verbose', action='store_true')
+    args = parser.parse_args()
+
+    stop = None
+    target, fake_url = args.target, args.fake
+    if args.spawn:
+        target, fake_url, stop = spawn(args)
+    try:
+        run = LoadRun(target, parse_mix(args.mix), make_profiles(args.profiles, args.seed), args.timeout)
+        before = fake_stats(fake_url)
+        print(f"[부하] {target} 동시 {args.concurrency}, "
+              + (f"{args.duration:.0f}초" if args.duration else f"{args.requests}건") + f", 구성 {args.mix}")
+        wall = run.run(args.concurrency, args.duration if not args.requests else 0, args.requests, args.seed)
+        report(run, wall, before, fake_stats(fake_url))
+    finally:
+        if stop is not None:
+            stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""
+기동 시간 리포트
+- python -X importtime 으로 app 임포트 시 모듈별 누적 시간 상위 항목 출력
+- 새 프로세스에서 "임포트 → 첫 /api/saju 응답" 까지 걸린 시간을 여러 번 측정 (중앙값)
+
+사용법:
+    python tools/startup_report.py [상위 개수] [반복 횟수]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+FIRST_RESPONSE = """
+import time
+t = time.perf_counter()
+import app
+imported = time.perf_counter()
+r = app.app.test_client().post('/api/saju', json=app.WARM_UP_REQUEST)
+assert r.status_code == 200, r.status_code
+done = time.perf_counter()
+print((imported - t) * 1000, (done - t) * 1000)
+"""
+
+
+def import_times():
+    """-X importtime 출력 → [(누적 us, 자체 us, 모듈)]"""
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import app'],
+                          cwd=ROOT, capture_output=True, text=True, check=True)
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        rows.append((int(cumulative_us), int(self_us), name.rstrip()))
+    return rows
+
+
+def first_response_times(runs):
+    samples = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, '-c', FIRST_RESPONSE],
+                             cwd=ROOT, capture_output=True, text=True, check=True).stdout
+        samples.append(tuple(float(v) for v in out.split()))
+    return samples
+
+
+def main(top=20, runs=5):
+    rows = import_times()
+    total = max(rows)[0]
+    print(f'app 임포트: {total / 1000:.1f} ms (누적 상위 {top}개)')
+    print(f'{"누적 ms":>9} {"자체 ms":>9}  모듈')
+    for cumulative_us, self_us, name in sorted(rows, reverse=True)[:top]:
+        print(f'{cumulative_us / 1000:9.1f} {self_us / 1000:9.1f}  {name}')
+
+    samples = first_response_times(runs)
+    print(f'\n새 프로세스 {runs}회 중앙값: '
+          f'임포트 {statistics.median(s[0] for s in samples):.1f} ms, '
+          f'첫 /api/saju 응답까지 {statistics.median(s[1] for s in samples):.1f} ms')
+
+
+if __name__ == '__main__':
+    main(*(int(v) for v in sys.argv[1:3]))
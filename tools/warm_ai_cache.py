@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+"""
+AI 캐시 예열 (자주 보는 명식의 해석을 한가한 시간에 미리 생성)
+- 요청 로그(JSONL, 한 줄에 year/month/day/hour/gender[/is_lunar/is_leap_month/kind/category/ts])를 읽어
+  명식 단위로 묶고 요청 수 순으로 정렬 (음력·양력 입력, 같은 시지의 다른 시각 → 같은 프롬프트 → 같은 명식)
+  앱에서 REQUEST_LOG_PATH 를 설정하면 이 형식으로 기록됨, 생년월일이 없는 줄은 건너뜀
+- 상위 --top 개 명식에 대해 캐시에 없는 종류(종합 + 카테고리)만 생성
+  (카테고리는 묶음 생성이 켜져 있으면 다섯 개를 호출 한 번으로)
+- --budget: 이번 실행에서 쓸 업스트림 호출 수 상한 (명식 하나를 다 만들 수 없으면 거기서 멈춤)
+- 1순위 모델 버킷에 --min-headroom 개 이상 토큰이 남아 있을 때만 호출하고, 모자라면 기다림
+  → 낮에 돌려도 사용자 요청 몫을 먼저 남김, --until 시각이 지나면 종료
+- 만든 해석은 선행 생성으로 표시되어 /api/health 의 ai_cache.prefetch_hit_rate 로 효과 확인
+
+새벽 cron 예:
+    0 3 * * * cd /srv/saju && python tools/warm_ai_cache.py logs/requests.jsonl --top 200 --budget 300 --until 06:00
+
+순위만 보기:
+    python tools/warm_ai_cache.py logs/requests.jsonl --top 20 --dry-run
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import app  # noqa: F401,E402  (.env 로드 - 아래 모듈이 임포트 시점에 환경 변수를 읽음)
+from ai_cache import AI_CACHE  # noqa: E402
+from ai_interpreter import (  # noqa: E402
+    get_ai_interpretation, get_category_interpretation, build_saju_prompt,
+    interpretation_fingerprints, missing_interpretations, prefetch_headroom,
+    CATEGORIES, GEMINI_CATEGORY_BUNDLE, NO_API_KEY_ERROR, INVALID_API_KEY_ERROR,
+)
+from saju_engine import get_saju_chart, pillar_label  # noqa: E402
+
+KINDS = ('full',) + CATEGORIES
+ABORT_ERRORS = (NO_API_KEY_ERROR, INVALID_API_KEY_ERROR)  # 다음 명식으로 넘어가도 똑같이 실패
+
+
+def parse_entry(line):
+    """로그 한 줄 → (입력값 tuple, 요청 종류, 시각) 또는 None"""
+    try:
+        entry = json.loads(line)
+        key = (int(entry['year']), int(entry['month']), int(entry['day']), int(entry['hour']),
+               entry['gender'], bool(entry.get('is_lunar', False)), bool(entry.get('is_leap_month', False)))
+    except (ValueError, KeyError, TypeError):
+        return None
+    kind = entry.get('category') if entry.get('kind') == 'detail' else 'full'
+    return key, kind, entry.get('ts')
+
+
+def read_logs(paths, since):
+    """로그 파일들 → (입력값별 요청 수, 입력값별 종류 Counter, 건너뛴 줄 수)"""
+    counts, kinds, skipped = Counter(), defaultdict(Counter), 0
+    for path in paths:
+        with (sys.stdin if path == '-' else open(path, encoding='utf-8')) as f:
+            for line in f:
+                parsed = parse_entry(line) if line.strip() else None
+                if parsed is None:
+                    skipped += bool(line.strip())
+                    continue
+                key, kind, ts = parsed
+                if since and ts and ts < since:
+                    continue
+                counts[key] += 1
+                kinds[key][kind] += 1
+    return counts, kinds, skipped
+
+
+def rank_charts(counts, kinds):
+    """
+    입력값 → 명식으로 정규화해 묶고 요청 수 순으로 정렬
+    → [(요청 수, 명식, 프롬프트, 종류 Counter)], 계산할 수 없는 입력값 수
+    """
+    charts, invalid = {}, 0
+    for key, count in counts.items():
+        try:
+            chart = get_saju_chart(*key)
+        except Exception:
+            invalid += count
+            continue
+        prompt = build_saju_prompt(chart)
+        fp = interpretation_fingerprints(chart, prompt)['full']
+        if fp not in charts:
+            charts[fp] = [0, chart, prompt, Counter()]
+        charts[fp][0] += count
+        charts[fp][3].update(kinds[key])
+    ranked = sorted(charts.values(), key=lambda item: -item[0])
+    return [tuple(item) for item in ranked], invalid
+
+
+def call_cost(missing):
+    """생성할 종류 → 예상 업스트림 호출 수"""
+    categories = [kind for kind in missing if kind != 'full']
+    cost = int('full' in missing)
+    if categories:
+        cost += 1 if GEMINI_CATEGORY_BUNDLE else len(categories)
+    return cost
+
+
+def wait_headroom(min_headroom, deadline, idle):
+    """버킷 여유가 생길 때까지 대기 (deadline 을 넘기면 False)"""
+    while not prefetch_headroom(min_headroom):
+        if deadline and time.time() + idle > deadline:
+            return False
+        time.sleep(idle)
+    return True
+
+
+def warm_chart(chart, prompt, missing, kinds, limit_wait):
+    """missing 종류를 생성 → (성공 여부, 오류 메시지)"""
+    with AI_CACHE.prefetching(kinds):
+        for kind in missing:
+            if kind == 'full':
+                res = get_ai_interpretation(chart, limit_wait, prompt)
+            else:
+                res = get_category_interpretation(chart, kind, limit_wait, prompt)
+            if not res['success']:
+                return False, res['error']
+    return True, None
+
+
+def parse_until(text):
+    """'06:00' → 다음 06:00 의 time.time() 값"""
+    if not text:
+        return None
+    now = datetime.now()
+    hour, minute = (int(part) for part in text.split(':'))
+    until = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if until <= now:
+        until += timedelta(days=1)
+    return until.timestamp()
+
+
+def describe(chart):
+    inputs = f"{chart.year}-{chart.month:02d}-{chart.day:02d} {chart.hour:02d}시 {chart.gender}" \
+             + (' 음력' if chart.is_lunar else '')
+    return f"{pillar_label(chart.day_gan, chart.day_ji)}일주 ({inputs})"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='AI 캐시 예열')
+    parser.add_argument('logs', nargs='+', help="요청 로그 JSONL ('-' 이면 표준 입력)")
+    parser.add_argument('--top', type=int, default=100, help='예열할 명식 수')
+    parser.add_argument('--kinds', default=','.join(KINDS),
+                        help="생성할 종류 (쉼표 구분, 'logged' 면 명식마다 로그에 나온 종류만)")
+    parser.add_argument('--budget', type=int, default=100, help='업스트림 호출 수 상한')
+    parser.add_argument('--min-headroom', type=float, default=5, help='호출 전 버킷에 남아 있어야 할 토큰 수')
+    parser.add_argument('--idle', type=float, default=15, help='여유가 없을 때 다시 확인하는 간격 (초)')
+    parser.add_argument('--limit-wait', type=float, default=30, help='호출 한도 토큰 대기 (초)')
+    parser.add_argument('--until', default='', help='이 시각(HH:MM)이 지나면 종료')
+    parser.add_argument('--since-days', type=float, default=0, help='최근 N일 로그만 (ts 가 있는 줄)')
+    parser.add_argument('--dry-run', action='store_true', help='순위와 생성할 종류만 출력')
+    args = parser.parse_args()
+
+    if args.kinds == 'logged':
+        kinds = None
+    else:
+        kinds = tuple(k.strip() for k in args.kinds.split(',') if k.strip())
+        unknown = [k for k in kinds if k not in KINDS]
+        if unknown:
+            parser.error(f"알 수 없는 종류: {', '.join(unknown)}")
+    since = time.time() - args.since_days * 86400 if args.since_days else None
+    deadline = parse_until(args.until)
+
+    counts, logged_kinds, skipped = read_logs(args.logs, since)
+    ranked, invalid = rank_charts(counts, logged_kinds)
+    total = sum(counts.values())
+    print(f"[예열] 요청 {total}건 → 명식 {len(ranked)}개 (형식 오류 {skipped}줄, 계산 불가 {invalid}건)")
+    if ranked:
+        top_share = sum(item[0] for item in ranked[:args.top]) / total
+        print(f"[예열] 상위 {min(args.top, len(ranked))}개 명식이 요청의 {top_share:.0%}")
+
+    budget = args.budget
+    warm = generated = failed = 0
+    stop_reason = None
+    for rank, (count, chart, prompt, chart_kinds) in enumerate(ranked[:args.top], 1):
+        wanted = kinds or tuple(k for k in KINDS if chart_kinds[k])
+        missing = missing_interpretations(chart, wanted, prompt)
+        cost = call_cost(missing)
+        if args.dry_run:
+            print(f"{rank:>4}. {count:>6}건 {describe(chart)} 생성: {', '.join(missing) or '-'} ({cost}회)")
+            budget -= cost
+            continue
+        if not missing:
+            warm += 1
+            continue
+        if cost > budget:
+            stop_reason = f'호출 예산 소진 (남은 {budget}회, 필요 {cost}회)'
+            break
+        if deadline and time.time() >= deadline:
+            stop_reason = f'{args.until} 도달'
+            break
+        if not wait_headroom(args.min_headroom, deadline, args.idle):
+            stop_reason = f'{args.until} 까지 호출 한도 여유 없음'
+            break
+        ok, error = warm_chart(chart, prompt, missing, wanted, args.limit_wait)
+        if ok:
+            generated += 1
+            budget -= cost
+            print(f"[예열] {rank}. {describe(chart)} {count}건 → {', '.join(missing)} 생성")
+            continue
+        print(f"[예열] {rank}. {describe(chart)} 실패: {error}")
+        if error in ABORT_ERRORS:  # 호출 전에 실패 (예산 차감 없음)
+            stop_reason = error
+            break
+        failed += 1
+        budget -= cost
+
+    if args.dry_run:
+        print(f"[예열] 예상 호출 {args.budget - budget}회 (예산 {args.budget}회)")
+        return
+    print(f"[예열] 이미 캐시 {warm}개, 생성 {generated}개, 실패 {failed}개, 호출 {args.budget - budget}회 사용"
+          + (f" - 중단: {stop_reason}" if stop_reason else ''))
+
+
+if __name__ == '__main__':
+    main()